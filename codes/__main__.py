@@ -0,0 +1,12 @@
+"""Lets `python -m codes ...` run the command line from the repository root,
+see `cli.py`.
+"""
+import os
+import sys
+
+# The modules import each other as top-level modules:
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cli import main
+
+sys.exit(main())
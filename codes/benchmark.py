@@ -0,0 +1,347 @@
+"""Benchmarks `Brorix84.update_calendar` on headless, seeded planets.
+
+Every case of the sweep (engine x scux production scale x litix colony size x
+litix memory size) runs in a fresh process, so its peak RSS is its own, and
+reports ticks per second, seconds per phase, peak RSS and allocation counts.
+The bytes per creature of every representation are measured too. Results are
+saved as JSON, and two result files can be compared to catch regressions:
+
+    python benchmark.py --days 100 --out before.json
+    python benchmark.py --days 100 --out after.json --compare before.json
+"""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from time import perf_counter
+import argparse
+import gc
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tracemalloc
+
+import numpy as np
+
+from brorix84 import Brorix84
+from profiler import Profiler
+from scux import Scux, ScuxPool
+from litix import Litix, LitixSwarm
+
+
+def _planet(case, profiler = None):
+    planet = Brorix84(
+        engine = case["engine"],
+        log_path = ":memory:",
+        telemetry_path = None,
+        verbose = False,
+        seed = case["seed"],
+        profiler = profiler
+    )
+    planet.scux_production_scale = case["scux_scale"]
+    planet.litix_colony_size = case["litix"]
+    planet.litix_memory_size = case["memory"]
+
+    return planet
+
+# ---------------------------------------------------------------------------- #
+def run_case(case):
+    """Run one benchmark case and return its measures. Meant to run in its
+    own process.
+    """
+    # 1. Timing, with nothing else running:
+    profiler = Profiler()
+    planet = _planet(case, profiler)
+
+    gc_collections = sum(stats["collections"] for stats in gc.get_stats())
+    start = perf_counter()
+
+    for day in range(case["days"]):
+        planet.update_calendar()
+
+    elapsed = perf_counter() - start
+    gc_collections = sum(
+        stats["collections"] for stats in gc.get_stats()
+    ) - gc_collections
+
+    metrics = profiler.metrics()
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    result = dict(
+        case,
+        ticks_per_second = case["days"] / elapsed,
+        seconds = elapsed,
+        phase_seconds = metrics["seconds"],
+        counters = metrics["counters"],
+        peak_rss_kb = peak_rss,
+        gc_collections = gc_collections,
+        alive_scux = planet.n_scux,
+        alive_litix = planet.n_litix
+    )
+
+    # 2. Allocations, traced on a second planet with the same seed:
+    planet = _planet(case)
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+
+    for day in range(case["days"]):
+        planet.update_calendar()
+
+    traced, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result["allocated_blocks"] = sys.getallocatedblocks() - blocks
+    result["traced_peak_bytes"] = traced_peak
+
+    return result
+
+# ---------------------------------------------------------------------------- #
+def _traced_bytes(build, n, rng):
+    # Built once untraced first, so one-off caches and the first block of
+    # random numbers are not charged to the creatures:
+    entities = build(n)
+    del entities
+
+    gc.collect()
+    block = rng.block
+    tracemalloc.start()
+    entities = build(n)
+    traced = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # A block of random numbers drawn while tracing belongs to the world,
+    # not to the creatures:
+    if rng.block is not block:
+        traced -= rng.block.nbytes
+
+    del entities
+
+    return traced
+
+# ---------------------------------------------------------------------------- #
+def entity_bytes(n: int = 1000, memory: int = 100, seed: int = 0):
+    """Bytes per creature of every representation: what `n` of them take
+    beyond an empty population, traced while they are built. Litix objects
+    include their memory of `memory` events. The planet they live in, its
+    random numbers and the fixed cost of a container are not counted, so the
+    result barely depends on `n`. Meant to run in its own process.
+    """
+    planet = _planet(
+        {
+            "engine": "object",
+            "seed": seed,
+            "scux_scale": 1,
+            "litix": 0,
+            "memory": memory
+        }
+    )
+
+    def swarm(n):
+        swarm = LitixSwarm(rng = planet.rng)
+        swarm.spawn(n)
+        return swarm
+
+    def pool(n):
+        pool = ScuxPool(rng = planet.rng)
+        pool.spawn(n)
+        return pool
+
+    builders = [
+        ("scux", lambda n: [Scux(rng = planet.rng) for i in range(n)]),
+        (
+            "litix",
+            lambda n: [
+                Litix(planet = planet, max_memory_size = memory)
+                for i in range(n)
+            ]
+        ),
+        ("scux_pool", pool),
+        ("litix_swarm", swarm)
+    ]
+
+    return {
+        name: (
+            _traced_bytes(build, n, planet.rng)
+            - _traced_bytes(build, 0, planet.rng)
+        ) / n
+        for name, build in builders
+    }
+
+# ---------------------------------------------------------------------------- #
+def run_suite(
+    days: int = 100,
+    engines: list = ["object", "vector"],
+    scux_scales: list = [1, 4],
+    litix: list = [10, 100],
+    memory: list = [100],
+    seed: int = 0,
+    entities: int = 1000
+):
+    """Run every case of the sweep, one process per case, and measure the
+    bytes per creature with `entities` creatures of each kind. Returns the
+    results with some metadata about where they were measured.
+    """
+    cases = [
+        {
+            "engine": engine,
+            "scux_scale": scux_scale,
+            "litix": n_litix,
+            "memory": memory_size,
+            "days": days,
+            "seed": seed
+        }
+        for engine, scux_scale, n_litix, memory_size
+        in product(engines, scux_scales, litix, memory)
+    ]
+
+    results = list()
+
+    for case in cases:
+        with ProcessPoolExecutor(max_workers = 1) as executor:
+            result = executor.submit(run_case, case).result()
+
+        print(
+            f"{result['engine']:>6} scux x{result['scux_scale']:<3} "
+            f"litix {result['litix']:<5} memory {result['memory']:<5} "
+            f"{result['ticks_per_second']:10.1f} ticks/s "
+            f"{result['peak_rss_kb'] / 1024:8.1f} MB"
+        )
+        results.append(result)
+
+    with ProcessPoolExecutor(max_workers = 1) as executor:
+        sizes = executor.submit(entity_bytes, entities, memory[0], seed).result()
+
+    for name, size in sizes.items():
+        print(f"{name:>11} {size:10.1f} bytes/entity")
+
+    return {
+        "meta": _meta(),
+        "results": results,
+        "entities": entities,
+        "entity_bytes": sizes
+    }
+
+# ---------------------------------------------------------------------------- #
+def _meta():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output = True,
+            text = True
+        ).stdout.strip()
+    except OSError:
+        commit = None
+
+    return {
+        "commit": commit or None,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor()
+    }
+
+# ---------------------------------------------------------------------------- #
+def _key(result):
+    return (
+        result["engine"],
+        result["scux_scale"],
+        result["litix"],
+        result["memory"],
+        result["days"]
+    )
+
+# ---------------------------------------------------------------------------- #
+def compare(baseline, current, tolerance: float = 0.10):
+    """Compare the ticks per second of two result sets case by case, and
+    their bytes per creature when both were measured with as many
+    creatures. Returns the cases that got slower, and the creatures that got
+    larger, than `tolerance` (10% by default).
+    """
+    baseline_sizes = baseline.get("entity_bytes", dict())
+
+    if baseline.get("entities") != current.get("entities"):
+        print(
+            f"bytes/entity not compared, measured with "
+            f"{baseline.get('entities')} and {current.get('entities')} entities"
+        )
+        baseline_sizes = dict()
+    baseline = {_key(result): result for result in baseline["results"]}
+    regressions = list()
+
+    for result in current["results"]:
+        if _key(result) not in baseline:
+            continue
+
+        before = baseline[_key(result)]["ticks_per_second"]
+        ratio = result["ticks_per_second"] / before
+        flag = "REGRESSION" if ratio < 1 - tolerance else ""
+
+        print(
+            f"{result['engine']:>6} scux x{result['scux_scale']:<3} "
+            f"litix {result['litix']:<5} memory {result['memory']:<5} "
+            f"{before:10.1f} -> {result['ticks_per_second']:10.1f} ticks/s "
+            f"({ratio:5.2f}x) {flag}"
+        )
+
+        if flag:
+            regressions.append(result)
+
+    for name, size in current.get("entity_bytes", dict()).items():
+        if name not in baseline_sizes:
+            continue
+
+        before = baseline_sizes[name]
+
+        ratio = size / before
+        flag = "REGRESSION" if ratio > 1 + tolerance else ""
+
+        print(
+            f"{name:>11} {before:10.1f} -> {size:10.1f} bytes/entity "
+            f"({ratio:5.2f}x) {flag}"
+        )
+
+        if flag:
+            regressions.append({"entity": name, "bytes": size, "baseline": before})
+
+    return regressions
+
+# ---------------------------------------------------------------------------- #
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = __doc__.split("\n")[0])
+    parser.add_argument("--days", type = int, default = 100)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--engines", nargs = "+", default = ["object", "vector"])
+    parser.add_argument("--scux-scales", nargs = "+", type = float, default = [1, 4])
+    parser.add_argument("--litix", nargs = "+", type = int, default = [10, 100])
+    parser.add_argument("--memory", nargs = "+", type = int, default = [100])
+    parser.add_argument("--out", default = "benchmark.json")
+    parser.add_argument("--compare", default = None, help = "a baseline JSON")
+    parser.add_argument("--tolerance", type = float, default = 0.10)
+    parser.add_argument("--entities", type = int, default = 1000)
+    args = parser.parse_args(argv)
+
+    results = run_suite(
+        days = args.days,
+        engines = args.engines,
+        scux_scales = args.scux_scales,
+        litix = args.litix,
+        memory = args.memory,
+        seed = args.seed,
+        entities = args.entities
+    )
+
+    with open(args.out, "w") as file:
+        json.dump(results, file, indent = 2)
+
+    if args.compare is not None:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+        if compare(baseline, results, args.tolerance):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
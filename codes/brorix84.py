@@ -1,22 +1,81 @@
-from tkinter import *
-from time import sleep
 from math import sin, cos, radians
-from scux import Scux
-from litix import Litix
+from scux import Scux, ScuxPool, ScuxField
+from litix import Litix, LitixSwarm
+from vohix import VohixPack
+from grid import SpatialGrid
+from registry import EntityRegistry
+from logger import LogWriter, MemoryLog
+from telemetry import TelemetryStore
+from randomness import RandomService
+from checkpoint import write_checkpoint, read_checkpoint
+from snapshot import Snapshot, Subscription
 import numpy as np
-import pandas as pd
 
 
 class Brorix84:
     def __init__(
         self,
-        canvas: Canvas
+        canvas = None,
+        engine: str = "object",
+        log_path: str = "../data/brorix84_log.csv",
+        telemetry_path: str = "../data/litix_telemetry.sqlite",
+        verbose: bool = True,
+        seed: int = None,
+        profiler = None,
+        render_every: int = 1
     ):
+        """Instantiate the Brorix84 planet.
+
+        Args:
+            canvas (Tkinter.canvas): If given, a `TkView` is attached to draw
+                the planet on it. Defaults to None, a headless planet.
+
+            engine (str): How creatures are stored. "object" keeps one Python
+                object per creature; "vector" keeps the scux population in a
+                `ScuxPool` and the litix colony in a `LitixSwarm`, both made
+                of NumPy arrays; "field" keeps the same colony, but the scux
+                population as a `ScuxField`, a density grid that can hold
+                millions of algae. Defaults to "object".
+
+            log_path (str): Where the world log is appended every ten days.
+                Files ending in ".parquet" or ".arrow" are written in those
+                formats. ":memory:" keeps the records in `log.records`
+                instead. None disables the log. Defaults to
+                "../data/brorix84_log.csv".
+
+            telemetry_path (str): Where the events of every Litix are stored,
+                see `TelemetryStore`. None disables it. Defaults to
+                "../data/litix_telemetry.sqlite".
+
+            verbose (bool): Print the day count every ten days. Defaults to
+                True.
+
+            seed (int): Seeds every random number of this world, see
+                `RandomService`. The same seed gives the same run. Defaults to
+                None, a random seed.
+
+            profiler (Profiler): Times every phase of the day and counts
+                births and deaths, see `Profiler`. Defaults to None, no
+                profiling.
+
+            render_every (int): The `TkView` attached for `canvas` draws one
+                frame every `render_every` days. Defaults to 1, every day.
+
+        """
+        assert engine in ["object", "vector", "field"], \
+            f"<ERROR> `engine` must be 'object', 'vector' or 'field', not {engine}"
 
         # Let's get some definitions:
         self.orbital_period = 360 # days, one "year".
         self.rotation_period = 36 # hours, one "day" + one "night"
         self.average_temperature = 27 # Celsius degrees
+        self.width = 1000       # pixels, the world is a 1000 x 700 rectangle
+        self.height = 700
+        self.scux_production_scale = 1  # multiplies the daily scux production
+        self.litix_colony_size = 10     # litix raised when the colony is empty
+        self.litix_memory_size = 100    # `max_memory_size` of every litix
+        self.vohix_pack_size = 0        # vohix raised when the pack is empty
+        self.litix_traits = dict()      # `Litix` arguments of raised colonies
 
         # This colors change with seasons:
         self.colors = [
@@ -28,19 +87,361 @@ class Brorix84:
             "#0f326b", "#0f346f", "#103674", "#113878", "#123a7c", "#133c81"
         ]
 
+        self.ticks = 0          # Days run since the world was created
         self.day = 0            # Current day
         self.season = "hot"     # Current season
         self.year = 0           # Current year
         self.temperature = 27   # base temperature
         self.day_length = 18    # base day_lenght: day + night = rotation period
 
+        self.current_color = self.colors[0]
+
+        self.rng = RandomService(seed)
+
+        self.engine = engine
         self.scux_list = list()
+        self.scux_pool = ScuxPool(rng = self.rng)
         self.litix_list = list()
+        self.litix_swarm = LitixSwarm(rng = self.rng)
+        self.scux_field = ScuxField(rng = self.rng) if engine == "field" else None
+        self.vohix_pack = VohixPack(rng = self.rng)
+        self.vohix_keys = list()    # Grid keys of the vohix, object engine only
+
+        # Ids of the creature objects, and their index for the touch and
+        # sense queries:
+        self.registry = EntityRegistry()
+        self.grid = SpatialGrid()
+
+        # The sense rings of the litix objects. The canvas tagged them
+        # "litix" like the bodies, so the queries count them as litix too:
+        self.sense_grid = SpatialGrid(tags = ("litix",))
+
+        # Views are optional, the planet runs headless without them:
+        self.observers = list()
+        if canvas is not None:
+            from view import TkView
+            self.attach(TkView(canvas = canvas, render_every = render_every))
+
+        self.verbose = verbose
+        self.profiler = profiler
+
+        self.log = None
+        if log_path == ":memory:":
+            self.log = MemoryLog()
+        elif log_path is not None:
+            extension = log_path.rsplit(".", 1)[-1]
+            self.log = LogWriter(
+                log_path,
+                format = extension if extension in LogWriter.formats else "csv"
+            )
+
+        self.telemetry = None
+        if telemetry_path is not None:
+            self.telemetry = TelemetryStore(telemetry_path, Litix.memory_fields)
+# ---------------------------------------------------------------------------- #
+    def configure(self, **overrides):
+        """Set planet attributes before a run starts, e.g.
+        `planet.configure(scux_production_scale = 2)`. Only attributes the
+        planet already has can be set, so a typo fails instead of being
+        ignored.
+        """
+        for attribute, value in overrides.items():
+            assert hasattr(self, attribute), \
+                f"<ERROR> Brorix84 has no attribute `{attribute}` to override"
+            setattr(self, attribute, value)
+
+# ---------------------------------------------------------------------------- #
+    def attach(self, observer):
+        """Register an `observer` that is updated at the end of every day.
+        Observers must implement `update(planet)`.
+        """
+        self.observers.append(observer)
+        observer.update(self)
+
+# ---------------------------------------------------------------------------- #
+    def notify(self):
+        for observer in self.observers:
+            observer.update(self)
+
+# ---------------------------------------------------------------------------- #
+    def snapshot(self, positions = False):
+        """A read-only `Snapshot` of the world as it is now."""
+        return Snapshot(self, positions = positions)
+
+# ---------------------------------------------------------------------------- #
+    def subscribe(self, callback, every = 1, positions = False):
+        """Call `callback(snapshot)` now and every `every` days, see
+        `Snapshot`. Returns the subscription, to `unsubscribe` it.
+        """
+        subscription = Subscription(callback, every = every, positions = positions)
+        self.attach(subscription)
+
+        return subscription
+
+# ---------------------------------------------------------------------------- #
+    def unsubscribe(self, subscription):
+        self.observers.remove(subscription)
+
+# ---------------------------------------------------------------------------- #
+    def run(self, days = None, every = 1, positions = False):
+        """Run `days` days (forever if None), yielding a `Snapshot` every
+        `every` days, so the run can be consumed as a stream:
+
+            for snapshot in planet.run(360, every = 10):
+                print(snapshot.day, snapshot.n_litix)
+
+        Nothing runs until the next snapshot is asked for.
+        """
+        assert isinstance(every, int) and every >= 1, \
+            f"<ERROR> `every` must be a positive integer, not {every}"
+
+        day = 0
+        while days is None or day < days:
+            self.update_calendar()
+            day += 1
+
+            if self.ticks % every == 0:
+                yield Snapshot(self, positions = positions)
+
+# ---------------------------------------------------------------------------- #
+    def find_overlapping(self, x0, y0, x1, y1, exclude = None):
+        """Same as `Canvas.find_overlapping`, but over the creature objects of
+        the planet and grouped by tag: {"scux": [...], "litix": [...],
+        "vohix": [...]}. Litix are found by their body and by their sense
+        ring, like the canvas items. Scux pools and fields have no single
+        algae to find, see `eat_scux_in`.
+        """
+        objects = self.grid.find_overlapping(x0, y0, x1, y1, exclude = exclude)
+        objects["litix"] += self.sense_grid.find_overlapping(
+            x0, y0, x1, y1,
+            exclude = exclude
+        )["litix"]
+
+        return objects
+
+# ---------------------------------------------------------------------------- #
+    def find_enclosed(self, x0, y0, x1, y1, exclude = None):
+        """Same as `Canvas.find_enclosed`, but over the creature objects of
+        the planet and grouped by tag: {"scux": [...], "litix": [...],
+        "vohix": [...]}. Litix are found by their body and by their sense
+        ring, like the canvas items.
+        """
+        objects = self.grid.find_enclosed(x0, y0, x1, y1, exclude = exclude)
+        objects["litix"] += self.sense_grid.find_enclosed(
+            x0, y0, x1, y1,
+            exclude = exclude
+        )["litix"]
+
+        return objects
+
+# ---------------------------------------------------------------------------- #
+    def eat_scux(self, scux):
+        """Kill a `scux` object found by `find_overlapping` or
+        `find_enclosed` and return the energy it gives to whoever ate it.
+        """
+        if self.profiler is not None:
+            self.profiler.count("scux_eaten")
+
+        self.kill(scux)
+
+        return scux.size ** 2
+
+# ---------------------------------------------------------------------------- #
+    def eat_scux_in(self, x0, y0, x1, y1):
+        """Kill every scux overlapping the given rectangle and return the
+        energy they give to whoever ate them, for every engine.
+        """
+        if self.engine == "vector":
+            return int(self.eat_scux_in_all(np.array([[x0, y0, x1, y1]]))[0])
+
+        if self.engine == "field":
+            eaten, energy = self.scux_field.eat(x0, y0, x1, y1)
+
+            if self.profiler is not None:
+                self.profiler.count("scux_eaten", eaten)
+
+            return energy
+
+        return sum(
+            self.eat_scux(scux)
+            for scux in self.find_overlapping(x0, y0, x1, y1)["scux"]
+        )
+
+# ---------------------------------------------------------------------------- #
+    def eat_scux_in_all(self, rects):
+        """Same as `eat_scux_in` for an (n, 4) array of rectangles, eaten in
+        order. Returns the energy of every rectangle.
+        """
+        if self.engine != "vector":
+            return np.array(
+                [self.eat_scux_in(*coords) for coords in rects.tolist()],
+                dtype = np.int64
+            )
+
+        energy, eaten = self.scux_pool.consume_overlapping(rects)
+
+        if self.profiler is not None:
+            self.profiler.count("scux_eaten", eaten)
+
+        return energy
 
-        self.canvas = canvas
-        self.canvas.configure(bg = self.colors[0])
-        self.canvas.update()
-        self.log = pd.DataFrame()
+# ---------------------------------------------------------------------------- #
+    def count_scux_in_all(self, rects, enclosed = False):
+        """How many living scux overlap each rectangle of an (n, 4) array,
+        or are enclosed by it, for every engine. A field only knows its
+        algae by cell, it counts every algae of the cells a rectangle
+        overlaps, the ones `eat_scux_in` would eat.
+        """
+        if self.engine == "vector":
+            return self.scux_pool.count_in(rects, enclosed = enclosed)
+
+        if self.engine == "field":
+            return self.scux_field.sense(rects, counts = True)
+
+        find = self.find_enclosed if enclosed else self.find_overlapping
+
+        return np.array(
+            [len(find(*coords)["scux"]) for coords in np.asarray(rects).tolist()],
+            dtype = np.int64
+        )
+
+# ---------------------------------------------------------------------------- #
+    def _add(self, creature, tag):
+        """Give a new scux or litix object its id and put it in the grid."""
+        creature.id = self.registry.add(creature)
+        self._index(creature, tag)
+
+# ---------------------------------------------------------------------------- #
+    def _index(self, creature, tag):
+        if tag == "scux":
+            self.grid.insert(creature, tag, creature.coords)
+        else:
+            self.grid.insert(creature, tag, creature.body_coords)
+            self.sense_grid.insert(creature, tag, creature.sense_coords)
+
+# ---------------------------------------------------------------------------- #
+    def kill(self, creature):
+        """Kill a scux or litix object. It leaves the grid and the registry
+        right away and its list at the end of the next update of that list,
+        until then it is only skipped.
+        """
+        creature.status = "dead"
+        self.grid.remove(creature)
+        self.sense_grid.remove(creature)
+        self.registry.remove(creature.id)
+
+# ---------------------------------------------------------------------------- #
+    def litix_positions(self):
+        """An (n, 2) array with the center of every living litix, in the
+        order used by `eat_litix`.
+        """
+        if self.engine != "object":
+            return self.litix_swarm.position
+
+        return np.array(
+            [litix.center_coordinates for litix in self.litix_list],
+            dtype = np.float64
+        ).reshape(-1, 2)
+
+# ---------------------------------------------------------------------------- #
+    def scux_positions(self):
+        """An (n, 2) array with the center of every living scux, None for the
+        "field" engine, which only keeps densities.
+        """
+        if self.engine == "field":
+            return None
+
+        if self.engine == "vector":
+            return self.scux_pool.position[self.scux_pool.alive]
+
+        return np.array(
+            [
+                scux.initial_position
+                for scux in self.scux_list
+                if scux.status == "alive"
+            ],
+            dtype = np.float64
+        ).reshape(-1, 2)
+
+# ---------------------------------------------------------------------------- #
+    def eat_litix(self, index):
+        """Kill the litix at `index`, positions of `litix_positions`, and
+        return the energy each one gives to whoever ate it.
+        """
+        if self.profiler is not None:
+            self.profiler.count("litix_eaten", len(index))
+
+        if self.engine != "object":
+            return self.litix_swarm.remove(index)
+
+        eaten = [self.litix_list[i] for i in np.asarray(index).tolist()]
+        energy = np.array(
+            [litix.energy_content for litix in eaten],
+            dtype = np.float64
+        )
+
+        for litix in eaten:
+            self.kill(litix)
+
+        self.litix_list = [
+            litix for litix in self.litix_list if litix.status == "alive"
+        ]
+
+        return energy
+
+# ---------------------------------------------------------------------------- #
+    @property
+    def n_scux(self):
+        if self.engine == "vector":
+            return len(self.scux_pool)
+
+        if self.engine == "field":
+            return len(self.scux_field)
+
+        return sum(1 for scux in self.scux_list if scux.status == "alive")
+
+# ---------------------------------------------------------------------------- #
+    @property
+    def total_scux_energy(self):
+        if self.engine == "vector":
+            return self.scux_pool.total_energy()
+
+        if self.engine == "field":
+            return self.scux_field.total_energy()
+
+        return sum(
+            [
+                scux.energy_content
+                for scux in self.scux_list
+                if scux.status == "alive"
+            ]
+        )
+
+# ---------------------------------------------------------------------------- #
+    @property
+    def n_litix(self):
+        if self.engine != "object":
+            return len(self.litix_swarm)
+
+        return len(self.litix_list)
+
+# ---------------------------------------------------------------------------- #
+    @property
+    def total_litix_energy(self):
+        if self.engine != "object":
+            return self.litix_swarm.total_energy()
+
+        return sum([litix.energy_content for litix in self.litix_list])
+
+# ---------------------------------------------------------------------------- #
+    @property
+    def n_vohix(self):
+        return len(self.vohix_pack)
+
+# ---------------------------------------------------------------------------- #
+    @property
+    def total_vohix_energy(self):
+        return self.vohix_pack.total_energy()
 # ---------------------------------------------------------------------------- #
 
     def _log_events(self):
@@ -51,51 +452,285 @@ class Brorix84:
                 "day": self.day,
                 "day_length": self.day_length,
                 "temperature": self.temperature,
-                "alive_scux": len(self.scux_list),
-                "alive_litix": len(self.litix_list),
-                "total_scux_energy": sum(
-                    [scux.energy_content for scux in self.scux_list]
-                ),
-                "total_litix_energy": sum(
-                    [litix.energy_content for litix in self.litix_list]
-                )
+                "alive_scux": self.n_scux,
+                "alive_litix": self.n_litix,
+                "total_scux_energy": self.total_scux_energy,
+                "total_litix_energy": self.total_litix_energy,
+                "alive_vohix": self.n_vohix,
+                "total_vohix_energy": self.total_vohix_energy
             }
 
-            self.log = self.log.append(events, ignore_index = True)
-            self.log.to_csv("../data/brorix84_log.csv", decimal = ",", index = False)
+            if self.log is not None:
+                self.log.write(events)
+
+# ---------------------------------------------------------------------------- #
+    def close(self):
+        """Flush the world log, the telemetry and the views that record, like
+        `RasterView`. Call it when the run is over.
+        """
+        for observer in self.observers:
+            if hasattr(observer, "close"):
+                observer.close()
+
+        if self.log is not None:
+            self.log.close()
+
+        if self.telemetry is not None:
+            self.telemetry.close()
+
+# ---------------------------------------------------------------------------- #
+    # The planet attributes saved by `save_checkpoint`:
+    checkpoint_fields = [
+        "orbital_period", "rotation_period", "average_temperature", "width",
+        "height", "scux_production_scale", "litix_colony_size",
+        "litix_memory_size", "litix_traits", "vohix_pack_size", "ticks", "day",
+        "season", "year", "temperature", "day_length", "current_color"
+    ]
+
+    def save_checkpoint(self, path):
+        """Save the whole world (calendar, creatures, memories and random
+        numbers) to `path`, see `write_checkpoint`. Logs, telemetry and views
+        are not part of the world and are not saved.
+        """
+        state = {field: getattr(self, field) for field in self.checkpoint_fields}
+        state["engine"] = self.engine
+        state["rng"] = self.rng.get_state()
+        state["vohix"] = self.vohix_pack.get_state()
 
+        if self.engine == "vector":
+            state["scux"] = self.scux_pool.get_state()
+            state["litix"] = self.litix_swarm.get_state()
+        elif self.engine == "field":
+            state["scux"] = self.scux_field.get_state()
+            state["litix"] = self.litix_swarm.get_state()
+        else:
+            state["registry"] = self.registry.get_state()
+            state["scux"] = Scux.pack(self.scux_list)
+            state["litix"] = Litix.pack(self.litix_list)
+
+        write_checkpoint(path, state)
+
+# ---------------------------------------------------------------------------- #
+    @classmethod
+    def load_checkpoint(cls, path, **kwargs):
+        """A planet that continues the world saved in `path` as if it had
+        never stopped.
+
+        Args:
+            path (str): A file written by `save_checkpoint`.
+
+            **kwargs: Any other `Brorix84` argument, like `canvas` or
+                `log_path`. The engine is the one of the checkpoint. A view
+                draws the restored world on the next day. `log_path` and
+                `telemetry_path` default to None here: the default files
+                would replace the log and telemetry of the run that saved the
+                checkpoint.
+        Returns:
+            Brorix84: The restored planet.
+        """
+        kwargs.setdefault("log_path", None)
+        kwargs.setdefault("telemetry_path", None)
+
+        state = read_checkpoint(path)
+        planet = cls(engine = state["engine"], **kwargs)
+
+        for field in cls.checkpoint_fields:
+            setattr(planet, field, state[field])
+
+        planet.rng.set_state(state["rng"])
+        planet.vohix_pack.set_state(state["vohix"])
+
+        if planet.engine == "vector":
+            planet.scux_pool.set_state(state["scux"])
+            planet.litix_swarm.set_state(state["litix"])
+        elif planet.engine == "field":
+            planet.scux_field.set_state(state["scux"])
+            planet.litix_swarm.set_state(state["litix"])
+        else:
+            planet.registry.set_state(state["registry"])
+            planet.scux_list = Scux.unpack(state["scux"])
+            planet.litix_list = Litix.unpack(planet, state["litix"])
+
+            for scux in planet.scux_list:
+                if scux.status == "alive":
+                    planet.registry.restore(scux.id, scux)
+                    planet._index(scux, "scux")
+
+            for litix in planet.litix_list:
+                if litix.status == "alive":
+                    planet.registry.restore(litix.id, litix)
+                    planet._index(litix, "litix")
+
+            planet._update_vohix_grid()
+
+        return planet
+
+# ---------------------------------------------------------------------------- #
     def update_litix_list(self, n_litix):
+        profiler = self.profiler
+
+        if self.engine != "object":
+            if len(self.litix_swarm) == 0:
+                self.litix_swarm.spawn(n_litix, traits = self.litix_traits)
+
+                if profiler is not None:
+                    profiler.count("litix_born", n_litix)
+                    profiler.lap("litix.spawn")
+
+            born, died = self.litix_swarm.update_age(self)
+
+            if profiler is not None:
+                profiler.count("litix_born", born)
+                profiler.count("litix_died", died)
+                profiler.lap("litix")
+            return
+
         # We'll raise litix once.
         if len(self.litix_list) == 0:
+            traits = {"max_memory_size": self.litix_memory_size}
+            traits.update(self.litix_traits)
+
             self.litix_list = [
-                Litix(canvas = self.canvas)
-                for i in range(n_litix)
+                Litix(planet = self, **traits) for i in range(n_litix)
             ]
 
+            for litix in self.litix_list:
+                self._add(litix, "litix")
+
+            if profiler is not None:
+                profiler.count("litix_born", n_litix)
+                profiler.lap("litix.spawn")
+
         for litix in self.litix_list:
             litix._update_age()
 
             if litix.status == "dead":
-                self.litix_list.remove(litix)
+                self.kill(litix)
+
+                if profiler is not None:
+                    profiler.count("litix_died")
+
+        # Ripe litix turn into their spores:
+        spores = list()
+        for litix in self.litix_list:
+            children = litix._sporulate()
+
+            if children:
+                self.kill(litix)
+                spores.extend(children)
+
+        for spore in spores:
+            self._add(spore, "litix")
+
+        if profiler is not None:
+            profiler.count("litix_born", len(spores))
+            profiler.lap("litix.spores")
+
+        # The dead leave the colony all at once:
+        self.litix_list = [
+            litix for litix in self.litix_list if litix.status == "alive"
+        ] + spores
 
-            self.canvas.update()
+        if profiler is not None:
+            profiler.lap("litix")
 # ---------------------------------------------------------------------------- #
     def update_scux_list(self, n_scux):
-        self.scux_list += [Scux(canvas = self.canvas) for i in range(n_scux)]
+        profiler = self.profiler
+
+        if profiler is not None:
+            profiler.count("scux_born", max(n_scux, 0))
+
+        if self.engine == "vector":
+            self.scux_pool.spawn(n_scux)
+            alive = len(self.scux_pool)
+            self.scux_pool.update_age()
+
+            if profiler is not None:
+                profiler.count("scux_died", alive - len(self.scux_pool))
+                profiler.lap("scux")
+            return
+
+        if self.engine == "field":
+            self.scux_field.spawn(n_scux)
+            died = self.scux_field.update_age()
+
+            if profiler is not None:
+                profiler.count("scux_died", died)
+                profiler.lap("scux")
+            return
+
+        # Draw the whole day of newborns at once:
+        sizes = self.rng.integers(3, 7, max(n_scux, 0)).tolist()
+        positions = self.rng.integers(5, 995, (max(n_scux, 0), 2)).tolist()
+
+        newborn = [
+            Scux(size = size, initial_position = tuple(position))
+            for size, position in zip(sizes, positions)
+        ]
+
+        for scux in newborn:
+            self._add(scux, "scux")
+
+        self.scux_list += newborn
 
+        # Eaten scux are already dead, they are only dropped:
         for scux in self.scux_list:
-            scux.update_age()
+            if scux.status == "alive":
+                scux.update_age()
 
-            if scux.status == "dead":
-                self.scux_list.remove(scux)
+                if scux.status == "dead":
+                    self.kill(scux)
 
-            self.canvas.update()
+                    if profiler is not None:
+                        profiler.count("scux_died")
+
+        self.scux_list = [
+            scux for scux in self.scux_list if scux.status == "alive"
+        ]
+
+        if profiler is not None:
+            profiler.lap("scux")
+
+# ---------------------------------------------------------------------------- #
+    def _update_vohix_grid(self):
+        # Litix objects feel the vohix through the grid, so it follows them:
+        for key in self.vohix_keys:
+            self.grid.remove(key)
+
+        self.vohix_keys = [("vohix", id) for id in self.vohix_pack.ids.tolist()]
+
+        for key, coords in zip(
+            self.vohix_keys,
+            self.vohix_pack.body_coords().tolist()
+        ):
+            self.grid.insert(key, "vohix", coords)
+
+# ---------------------------------------------------------------------------- #
+    def update_vohix_pack(self, n_vohix):
+        profiler = self.profiler
+
+        if len(self.vohix_pack) == 0 and n_vohix > 0:
+            self.vohix_pack.spawn(n_vohix)
+
+            if profiler is not None:
+                profiler.count("vohix_born", n_vohix)
+
+        born, died = self.vohix_pack.update_age(self)
+
+        if self.engine == "object":
+            self._update_vohix_grid()
+
+        if profiler is not None:
+            profiler.count("vohix_born", born)
+            profiler.count("vohix_died", died)
+            profiler.lap("vohix")
 
 # ---------------------------------------------------------------------------- #
     def update_appearance(self):
         if self.day % 10 == 0:
-            self.canvas.configure(bg = self.colors[int(self.day / 10)-1])
-            print (f"day = {self.day}")
+            self.current_color = self.colors[int(self.day / 10)-1]
+            if self.verbose:
+                print (f"day = {self.day}")
 
 # ---------------------------------------------------------------------------- #
     def update_temperature(self):
@@ -107,6 +742,12 @@ class Brorix84:
 
 # ---------------------------------------------------------------------------- #
     def update_calendar(self):
+        profiler = self.profiler
+
+        if profiler is not None:
+            profiler.start()
+
+        self.ticks += 1
         self.day += 1
 
         # 1. If day count is greater than 179, update season:
@@ -125,10 +766,27 @@ class Brorix84:
         self.update_temperature()
         self.update_day_length()
 
+        if profiler is not None:
+            profiler.lap("climate")
+
         # 4. Calculating constants:
-        SCUX_PRODUCTION_RATE = int(2 * self.temperature - self.day_length)
+        SCUX_PRODUCTION_RATE = int(
+            self.scux_production_scale * (2 * self.temperature - self.day_length)
+        )
         self.update_scux_list(n_scux = SCUX_PRODUCTION_RATE)
-        self.update_litix_list(n_litix = 10)
+        self.update_litix_list(n_litix = self.litix_colony_size)
+        self.update_vohix_pack(n_vohix = self.vohix_pack_size)
 
         # 5. Logging:
         self._log_events()
+
+        if profiler is not None:
+            profiler.lap("world_logging")
+
+        # 6. Let the views know about the new day:
+        self.notify()
+
+        if profiler is not None:
+            profiler.lap("rendering")
+            profiler.end_day()
+
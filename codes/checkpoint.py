@@ -0,0 +1,129 @@
+import json
+import numpy as np
+
+
+MAGIC = b"BRX84CK1"
+ALIGNMENT = 64
+
+
+def _align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+# ---------------------------------------------------------------------------- #
+def _split(state, arrays, prefix = ""):
+    # Move every array of a nested dict to `arrays`, leaving its name behind:
+    tree = dict()
+
+    for key, value in state.items():
+        name = prefix + key
+
+        if isinstance(value, dict):
+            tree[key] = _split(value, arrays, name + ".")
+        elif isinstance(value, np.ndarray):
+            arrays[name] = value
+            tree[key] = {"__array__": name}
+        else:
+            tree[key] = value
+
+    return tree
+
+# ---------------------------------------------------------------------------- #
+def _join(tree, arrays):
+    state = dict()
+
+    for key, value in tree.items():
+        if isinstance(value, dict) and "__array__" in value:
+            state[key] = arrays[value["__array__"]]
+        elif isinstance(value, dict):
+            state[key] = _join(value, arrays)
+        else:
+            state[key] = value
+
+    return state
+
+# ---------------------------------------------------------------------------- #
+def write_checkpoint(path, state: dict):
+    """Write a checkpoint file: the magic bytes, the length of a JSON header,
+    the header, and then every array as raw C-ordered bytes, each one starting
+    at a multiple of 64 bytes, so they can be memory-mapped back.
+
+    Args:
+        path (str): Where the checkpoint is written.
+
+        state (dict): A nested dict of JSON serializable values and NumPy
+            arrays of fixed size dtypes.
+
+    """
+    arrays = dict()
+    tree = _split(state, arrays)
+
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+
+    for name, array in arrays.items():
+        assert not array.dtype.hasobject, \
+            f"<ERROR> array `{name}` has an object dtype, it can't be stored"
+
+    # The array offsets depend on the header length, and the header holds the
+    # offsets, so they are counted from the end of a padded header:
+    layout = dict()
+    offset = 0
+    for name, array in arrays.items():
+        layout[name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset
+        }
+        offset = _align(offset + array.nbytes)
+
+    header = json.dumps(
+        {"version": 1, "state": tree, "arrays": layout}
+    ).encode("utf-8")
+    data_start = _align(len(MAGIC) + 8 + len(header))
+
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        file.write(np.uint64(len(header)).tobytes())
+        file.write(header)
+
+        for name, array in arrays.items():
+            file.write(b"\0" * (data_start + layout[name]["offset"] - file.tell()))
+            file.write(array.tobytes())
+
+# ---------------------------------------------------------------------------- #
+def read_checkpoint(path):
+    """Read a checkpoint written by `write_checkpoint`. Arrays are memory-mapped
+    copy-on-write, so they are only read from disk when used, and writing to
+    them never changes the file.
+
+    Returns:
+        dict: The `state` given to `write_checkpoint`.
+    """
+    with open(path, "rb") as file:
+        assert file.read(len(MAGIC)) == MAGIC, \
+            f"<ERROR> {path} is not a Brorix84 checkpoint"
+
+        header_size = int(np.frombuffer(file.read(8), dtype = np.uint64)[0])
+        header = json.loads(file.read(header_size).decode("utf-8"))
+
+    data_start = _align(len(MAGIC) + 8 + header_size)
+    arrays = dict()
+
+    for name, layout in header["arrays"].items():
+        dtype = np.dtype(layout["dtype"])
+        shape = tuple(layout["shape"])
+
+        # Empty arrays can't be mapped:
+        if int(np.prod(shape)) == 0:
+            arrays[name] = np.zeros(shape, dtype = dtype)
+        else:
+            arrays[name] = np.asarray(
+                np.memmap(
+                    path,
+                    dtype = dtype,
+                    mode = "c",
+                    offset = data_start + layout["offset"],
+                    shape = shape
+                )
+            )
+
+    return _join(header["state"], arrays)
@@ -0,0 +1,187 @@
+"""The Brorix84 command line.
+
+    python -m cli run --headless --days 360 --seed 1 --out runs/1
+    python -m cli bench --days 100 --out bench.json --engines vector
+    python -m cli ensemble --runs 10 --days 360 --out ensemble.csv
+
+From the repository root, `python -m codes ...` does the same. Only the
+standard library is imported up front: NumPy comes with the planet, and
+tkinter and pandas only with the commands that need them, so the many short
+headless runs of a job scheduler start fast.
+"""
+from time import perf_counter
+import argparse
+import os
+import sys
+
+STARTED = perf_counter()
+
+
+def _common(parser, days, out):
+    parser.add_argument("--days", type = int, default = days)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--out", default = out)
+    parser.add_argument(
+        "--headless",
+        action = "store_true",
+        help = "don't open a window (bench and ensemble always are)"
+    )
+
+# ---------------------------------------------------------------------------- #
+def run(args):
+    from brorix84 import Brorix84
+
+    if args.out:
+        os.makedirs(args.out, exist_ok = True)
+
+    tk = canvas = None
+    if not args.headless:
+        from tkinter import Tk, Canvas
+
+        tk = Tk()
+        canvas = Canvas(tk, width = 1000, height = 700, bg = "#27505c")
+        canvas.pack()
+
+    planet = Brorix84(
+        canvas = canvas,
+        engine = args.engine,
+        log_path = os.path.join(args.out, "brorix84_log.csv"),
+        telemetry_path = (
+            os.path.join(args.out, "litix_telemetry.sqlite")
+            if args.telemetry
+            else None
+        ),
+        verbose = args.verbose,
+        seed = args.seed,
+        render_every = args.render_every
+    )
+    planet.vohix_pack_size = args.vohix
+
+    if args.frames:
+        from raster import RasterView
+
+        planet.attach(
+            RasterView(
+                os.path.join(args.out, "frames", "{frame:06d}.png"),
+                render_every = args.frames
+            )
+        )
+
+    startup = perf_counter() - STARTED
+
+    if args.headless:
+        for snapshot in planet.run(args.days, every = max(args.days, 1)):
+            pass
+    else:
+        from scheduler import Scheduler
+
+        scheduler = Scheduler(planet, mode = "realtime", ticks_per_second = 100)
+        scheduler.run_tk(tk, ticks = args.days)
+        tk.mainloop()
+
+    planet.close()
+
+    print(
+        f"{planet.ticks} days, {planet.n_scux} scux, {planet.n_litix} litix, "
+        f"{planet.n_vohix} vohix in {perf_counter() - STARTED:.2f} s "
+        f"(startup {startup:.3f} s)"
+    )
+
+    return 0
+
+# ---------------------------------------------------------------------------- #
+def bench(args, extra):
+    import benchmark
+
+    return benchmark.main(
+        ["--days", str(args.days), "--seed", str(args.seed), "--out", args.out]
+        + extra
+    )
+
+# ---------------------------------------------------------------------------- #
+def ensemble(args):
+    from ensemble import Ensemble
+
+    runs = Ensemble(
+        n_runs = args.runs,
+        days = args.days,
+        seed = args.seed,
+        engine = args.engine,
+        max_workers = args.workers
+    ).run()
+
+    runs.to_csv(args.out, index = False)
+    print(f"{args.runs} runs of {args.days} days written to {args.out}")
+
+    return 0
+
+# ---------------------------------------------------------------------------- #
+def main(argv = None):
+    parser = argparse.ArgumentParser(
+        prog = "brorix84",
+        description = __doc__.split("\n")[0]
+    )
+    commands = parser.add_subparsers(dest = "command", required = True)
+
+    parser_run = commands.add_parser("run", help = "run one planet")
+    _common(parser_run, days = 360, out = ".")
+    parser_run.add_argument(
+        "--engine",
+        choices = ["object", "vector", "field"],
+        default = "object"
+    )
+    parser_run.add_argument("--vohix", type = int, default = 0)
+    parser_run.add_argument(
+        "--telemetry",
+        action = "store_true",
+        help = "store the events of every litix in --out"
+    )
+    parser_run.add_argument(
+        "--frames",
+        type = int,
+        default = 0,
+        help = "record a PNG frame every N days in --out/frames"
+    )
+    parser_run.add_argument(
+        "--render-every",
+        type = int,
+        default = 1,
+        help = "draw one frame every N days in the window"
+    )
+    parser_run.add_argument("--verbose", action = "store_true")
+
+    parser_bench = commands.add_parser(
+        "bench",
+        help = "benchmark, other options go to benchmark.py"
+    )
+    _common(parser_bench, days = 100, out = "benchmark.json")
+
+    parser_ensemble = commands.add_parser(
+        "ensemble",
+        help = "run many planets in parallel"
+    )
+    _common(parser_ensemble, days = 360, out = "ensemble.csv")
+    parser_ensemble.add_argument("--runs", type = int, default = 10)
+    parser_ensemble.add_argument(
+        "--engine",
+        choices = ["object", "vector", "field"],
+        default = "vector"
+    )
+    parser_ensemble.add_argument("--workers", type = int, default = None)
+
+    args, extra = parser.parse_known_args(argv)
+
+    if extra and args.command != "bench":
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+
+    if args.command == "bench":
+        return bench(args, extra)
+
+    if args.command == "ensemble":
+        return ensemble(args)
+
+    return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
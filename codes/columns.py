@@ -0,0 +1,106 @@
+import numpy as np
+
+
+class Column:
+    """One per creature array of a `ColumnStore`. Reading it gives a view of
+    the rows in use of its buffer, and assigning to it copies into them, so
+    the buffer is never replaced by the assignment.
+    """
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, store, owner = None):
+        if store is None:
+            return self
+
+        return store.buffers[self.name][:store.n]
+
+    def __set__(self, store, value):
+        store.buffers[self.name][:store.n] = value
+
+# ---------------------------------------------------------------------------- #
+class ColumnStore:
+    """Aligned per creature arrays in preallocated buffers that double their
+    capacity when full, so appending k rows costs amortized O(k) instead of
+    copying the whole population every time.
+
+    Subclasses declare their arrays in `columns`, as {name: (dtype, shape of
+    a row)}, and read and write them as plain attributes.
+    """
+    columns = dict()
+
+    __slots__ = ("n", "buffers")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        for name in cls.columns:
+            setattr(cls, name, Column(name))
+
+    def __init__(
+        self,
+        n: int = 0,
+        capacity: int = 16
+    ):
+        """Instantiate `n` rows of zeros.
+
+        Args:
+            n (int): How many rows are in use. Defaults to 0.
+
+            capacity (int): How many rows fit before the first growth.
+                Defaults to 16.
+
+        """
+        self.n = n
+        self.buffers = {
+            name: np.zeros((max(capacity, n),) + shape, dtype = dtype)
+            for name, (dtype, shape) in self.columns.items()
+        }
+
+# ---------------------------------------------------------------------------- #
+    def __len__(self):
+        return self.n
+
+# ---------------------------------------------------------------------------- #
+    @property
+    def capacity(self):
+        return next(iter(self.buffers.values())).shape[0]
+
+# ---------------------------------------------------------------------------- #
+    def _reserve(self, n):
+        """Make room for `n` rows, at least doubling the capacity if it grows."""
+        if n <= self.capacity:
+            return
+
+        capacity = max(n, 2 * self.capacity)
+
+        for name, buffer in self.buffers.items():
+            grown = np.zeros((capacity,) + buffer.shape[1:], dtype = buffer.dtype)
+            grown[:self.n] = buffer[:self.n]
+            self.buffers[name] = grown
+
+# ---------------------------------------------------------------------------- #
+    def _append(self, rows: dict, n: int):
+        """Append `n` rows, `rows` maps every column to its new values."""
+        self._reserve(self.n + n)
+
+        for name, buffer in self.buffers.items():
+            buffer[self.n:self.n + n] = rows[name]
+
+        self.n += n
+
+# ---------------------------------------------------------------------------- #
+    def _compact(self, keep):
+        """Keep only the rows where the `keep` mask is True, in order."""
+        kept = int(np.count_nonzero(keep))
+
+        for name, buffer in self.buffers.items():
+            buffer[:kept] = buffer[:self.n][keep]
+
+        self.n = kept
+
+# ---------------------------------------------------------------------------- #
+    def _resize(self, n):
+        """Use `n` rows, e.g. before assigning whole columns of a saved state."""
+        self._reserve(n)
+        self.n = n
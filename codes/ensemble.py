@@ -0,0 +1,148 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from brorix84 import Brorix84
+
+
+def _run_planet(run, seed, days, engine, overrides):
+    """Run one headless planet for `days` days and return its log records.
+    This is what every worker process executes.
+    """
+    planet = Brorix84(
+        engine = engine,
+        seed = seed,
+        log_path = ":memory:",
+        telemetry_path = None,
+        verbose = False
+    )
+
+    planet.configure(**overrides)
+
+    for day in range(days):
+        planet.update_calendar()
+
+    planet.close()
+
+    return run, seed, planet.log.records
+
+# ---------------------------------------------------------------------------- #
+class Ensemble:
+    """Runs many independent headless Brorix84 planets across a process pool
+    and merges their world logs into a single dataset.
+    """
+    def __init__(
+        self,
+        n_runs: int = 10,
+        days: int = 360,
+        seed: int = 0,
+        overrides = None,
+        engine: str = "vector",
+        max_workers: int = None
+    ):
+        """Instantiate an ensemble of `n_runs` planets.
+
+        Args:
+            n_runs (int): How many planets are run. Defaults to 10.
+
+            days (int): How many days every planet runs. Defaults to 360.
+
+            seed (int): Run `i` is seeded with `seed + i`. Defaults to 0.
+
+            overrides (dict or list): Planet attributes set before the run
+                starts, e.g. {"average_temperature": 30}. A list gives one dict
+                per run. Defaults to None, no overrides.
+
+            engine (str): The planet engine, see `Brorix84`. Defaults to
+                "vector".
+
+            max_workers (int): The number of worker processes. Defaults to
+                None, one per core.
+
+        """
+        if overrides is None:
+            overrides = dict()
+
+        if isinstance(overrides, dict):
+            overrides = [overrides] * n_runs
+
+        assert len(overrides) == n_runs, \
+            f"<ERROR> `overrides` must have one dict per run, not {len(overrides)}"
+
+        self.n_runs = n_runs
+        self.days = days
+        self.seed = seed
+        self.overrides = overrides
+        self.engine = engine
+        self.max_workers = max_workers
+
+        self.runs = None
+
+# ---------------------------------------------------------------------------- #
+    def run(self, on_result = None):
+        """Run every planet. Logs are merged as soon as each run finishes.
+
+        Args:
+            on_result (callable): Called as `on_result(run, frame)` with the
+                log of each run as soon as it arrives. Defaults to None.
+        Returns:
+            pd.DataFrame: The logs of every run, with `run` and `seed` columns.
+        """
+        import pandas as pd
+
+        frames = list()
+
+        with ProcessPoolExecutor(max_workers = self.max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_planet,
+                    run,
+                    self.seed + run,
+                    self.days,
+                    self.engine,
+                    self.overrides[run]
+                )
+                for run in range(self.n_runs)
+            ]
+
+            for future in as_completed(futures):
+                run, seed, records = future.result()
+
+                frame = pd.DataFrame(records)
+                frame.insert(0, "seed", seed)
+                frame.insert(0, "run", run)
+                frames.append(frame)
+
+                if on_result is not None:
+                    on_result(run, frame)
+
+        self.runs = pd.concat(frames, ignore_index = True).sort_values(
+            ["run", "year", "day"],
+            ignore_index = True
+        )
+
+        return self.runs
+
+# ---------------------------------------------------------------------------- #
+    def summary(self, quantiles: list = [0.05, 0.5, 0.95]):
+        """Mean and quantile bands of every logged variable across runs, for
+        each logged day.
+
+        Returns:
+            pd.DataFrame: Indexed by (year, day), with (variable, statistic)
+                columns, e.g. ("alive_litix", "mean") or ("alive_litix", 0.95).
+        """
+        assert self.runs is not None, "<ERROR> call `run` first"
+
+        import pandas as pd
+
+        variables = self.runs.drop(columns = ["run", "seed", "season"])
+        groups = variables.groupby(["year", "day"])
+
+        bands = {"mean": groups.mean()}
+        for quantile in quantiles:
+            bands[quantile] = groups.quantile(quantile)
+
+        return pd.concat(bands, axis = 1).swaplevel(axis = 1).sort_index(
+            axis = 1,
+            level = 0,
+            sort_remaining = False
+        )
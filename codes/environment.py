@@ -1,16 +1,26 @@
 from tkinter import *
-from time import sleep
 
 from brorix84 import Brorix84
+from scheduler import Scheduler
+from profiler import Profiler
 
 tk = Tk()
 canvas = Canvas(tk, width=1000, height=700, bg="#27505c")
 canvas.pack()
 
-planet = Brorix84(canvas = canvas)
+# A summary of where the time goes is printed once a year. Raise
+# `render_every` to draw one frame every few days and run faster:
+planet = Brorix84(
+    canvas = canvas,
+    profiler = Profiler(summary_every = 360),
+    render_every = 1
+)
+planet.vohix_pack_size = 3
 
-for i in range(36000):
-    planet.update_calendar()
-    sleep(0.01)
+scheduler = Scheduler(planet, mode = "realtime", ticks_per_second = 100)
+scheduler.run_tk(tk, ticks = 36000)
 
 tk.mainloop()
+
+print(scheduler.report())
+planet.close()
@@ -0,0 +1,350 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import hashlib
+import itertools
+import json
+import os
+
+from brorix84 import Brorix84
+from randomness import RandomService
+
+
+def _run_world(traits, seed, days, engine, overrides):
+    """Run one headless planet whose colonies are raised with `traits` and
+    return how well they did. This is what every worker process executes.
+
+    The fitness is the mean number of living litix per day over all `days`.
+    A colony that dies out has clearly failed, it would only be raised again,
+    so the run stops there and the days left count as empty.
+    """
+    planet = Brorix84(
+        engine = engine,
+        seed = seed,
+        log_path = None,
+        telemetry_path = None,
+        verbose = False
+    )
+
+    planet.configure(**overrides)
+
+    planet.litix_traits = traits
+
+    litix_days = 0
+    for day in range(days):
+        planet.update_calendar()
+        litix_days += planet.n_litix
+
+        if planet.n_litix == 0:
+            break
+
+    planet.close()
+
+    return {
+        "fitness": litix_days / days,
+        "days": day + 1,
+        "extinct": planet.n_litix == 0
+    }
+
+# ---------------------------------------------------------------------------- #
+class FitnessCache:
+    """Fitness results on disk, one JSON line per evaluated world, keyed by a
+    hash of everything that defines the world. Evaluations already made, by
+    this or any earlier search, are never run again.
+    """
+    # Bump it when the rules of the world change, old results are then ignored:
+    version = 1
+
+    def __init__(self, path: str = "../data/fitness_cache.jsonl"):
+        """Load the results saved in `path`, if any.
+
+        Args:
+            path (str): The cache file. None keeps the results in memory only.
+                Defaults to "../data/fitness_cache.jsonl".
+
+        """
+        self.path = path
+        self.results = dict()
+
+        # Made here, a bad path fails before any world is run:
+        if path is not None and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok = True)
+
+        if path is not None and os.path.exists(path):
+            with open(path) as file:
+                for line in file:
+                    record = json.loads(line)
+                    self.results[record["key"]] = record["result"]
+
+# ---------------------------------------------------------------------------- #
+    def __len__(self):
+        return len(self.results)
+
+# ---------------------------------------------------------------------------- #
+    def __contains__(self, key):
+        return key in self.results
+
+# ---------------------------------------------------------------------------- #
+    @classmethod
+    def key(cls, traits, seed, days, engine, overrides):
+        world = json.dumps(
+            {
+                "version": cls.version,
+                "traits": traits,
+                "seed": seed,
+                "days": days,
+                "engine": engine,
+                "overrides": overrides
+            },
+            sort_keys = True
+        )
+
+        return hashlib.sha256(world.encode("utf-8")).hexdigest()
+
+# ---------------------------------------------------------------------------- #
+    def get(self, key):
+        return self.results.get(key)
+
+# ---------------------------------------------------------------------------- #
+    def put(self, key, result):
+        self.results[key] = result
+
+        if self.path is not None:
+            with open(self.path, "a") as file:
+                file.write(json.dumps({"key": key, "result": result}) + "\n")
+
+# ---------------------------------------------------------------------------- #
+class Evolution:
+    """Searches the Litix traits, the `Litix` arguments, for the colonies
+    that live best. Every trait vector is evaluated by running headless
+    worlds, one per seed, across a process pool, and scored by the mean of
+    their fitness, see `_run_world`. Results are cached on disk, see
+    `FitnessCache`.
+
+    `sweep` evaluates a grid of trait vectors; `run` evolves a population:
+    the best quarter of every generation is kept and the rest is replaced by
+    mutated crossovers of it.
+    """
+    # The searched traits and their (low, high) bounds. Integer bounds give
+    # integer traits. `sense_range` is left out, sensing is only logged and
+    # doesn't change how a cell lives:
+    bounds = {
+        "cell_size": (10, 30),
+        "cell_speed": (5, 40),
+        "metabolic_cost": (1, 5),
+        "direction_change_prob": (0.10, 0.90),
+        "direction_angle_window": (30, 90),
+        "max_memory_size": (10, 200)
+    }
+
+    def __init__(
+        self,
+        population_size: int = 16,
+        generations: int = 10,
+        days: int = 360,
+        seeds: list = [0, 1, 2],
+        engine: str = "vector",
+        overrides: dict = None,
+        bounds: dict = None,
+        mutation: float = 0.1,
+        cache_path: str = "../data/fitness_cache.jsonl",
+        max_workers: int = None,
+        seed: int = 0
+    ):
+        """Instantiate a search.
+
+        Args:
+            population_size (int): Trait vectors per generation. Defaults to
+                16.
+
+            generations (int): How many generations `run` evolves. Defaults
+                to 10.
+
+            days (int): How many days every world runs. Defaults to 360.
+
+            seeds (list): Every trait vector runs one world per seed.
+                Defaults to [0, 1, 2].
+
+            engine (str): The planet engine, see `Brorix84`. Only the
+                "object" engine searches `max_memory_size`. Defaults to
+                "vector".
+
+            overrides (dict): Planet attributes set before every run starts,
+                e.g. {"scux_production_scale": 2}. Defaults to None.
+
+            bounds (dict): The searched traits, see `Evolution.bounds`.
+                Defaults to None, all of them.
+
+            mutation (float): How far a mutation moves a trait, as a share of
+                its bounds. Defaults to 0.1.
+
+            cache_path (str): See `FitnessCache`. Defaults to
+                "../data/fitness_cache.jsonl".
+
+            max_workers (int): The number of worker processes. Defaults to
+                None, one per core.
+
+            seed (int): Seeds the search itself, not the worlds. Defaults to
+                0.
+
+        """
+        assert population_size >= 2, \
+            f"<ERROR> `population_size` must be at least 2, not {population_size}"
+        assert isinstance(days, int) and days >= 1, \
+            f"<ERROR> `days` must be a positive integer, not {days}"
+
+        bounds = dict(self.bounds if bounds is None else bounds)
+
+        for trait in bounds:
+            assert trait in self.bounds, \
+                f"<ERROR> `{trait}` is not a Litix trait, see `Evolution.bounds`"
+
+        if engine != "object":
+            bounds.pop("max_memory_size", None)
+
+        self.population_size = population_size
+        self.generations = generations
+        self.days = days
+        self.seeds = list(seeds)
+        self.engine = engine
+        self.overrides = dict() if overrides is None else overrides
+        self.bounds = bounds
+        self.mutation = mutation
+        self.cache = FitnessCache(cache_path)
+        self.max_workers = max_workers
+        self.rng = RandomService(seed)
+
+        self.history = list()       # (generation, traits, fitness)
+
+# ---------------------------------------------------------------------------- #
+    def _cast(self, trait, value):
+        low, high = self.bounds[trait]
+        value = min(max(value, low), high)
+
+        if isinstance(low, int) and isinstance(high, int):
+            return int(round(value))
+
+        return float(value)
+
+# ---------------------------------------------------------------------------- #
+    def random_traits(self):
+        return {
+            trait: self._cast(trait, self.rng.uniform(low, high))
+            for trait, (low, high) in self.bounds.items()
+        }
+
+# ---------------------------------------------------------------------------- #
+    def offspring(self, mother, father):
+        """A uniform crossover of two trait vectors, mutated."""
+        child = dict()
+
+        for trait, (low, high) in self.bounds.items():
+            value = mother[trait] if self.rng.random() < 0.5 else father[trait]
+            step = self.mutation * (high - low)
+
+            child[trait] = self._cast(trait, value + self.rng.uniform(-step, step))
+
+        return child
+
+# ---------------------------------------------------------------------------- #
+    def evaluate(self, population):
+        """The fitness of every trait vector of `population`, the mean over
+        `seeds`. Only the worlds missing from the cache are run.
+        """
+        keys = [
+            [
+                self.cache.key(traits, seed, self.days, self.engine, self.overrides)
+                for seed in self.seeds
+            ]
+            for traits in population
+        ]
+
+        missing = dict()
+        for traits, row in zip(population, keys):
+            for seed, key in zip(self.seeds, row):
+                if key not in self.cache:
+                    missing[key] = (traits, seed)
+
+        if missing:
+            with ProcessPoolExecutor(max_workers = self.max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        _run_world,
+                        traits,
+                        seed,
+                        self.days,
+                        self.engine,
+                        self.overrides
+                    ): key
+                    for key, (traits, seed) in missing.items()
+                }
+
+                for future in as_completed(futures):
+                    self.cache.put(futures[future], future.result())
+
+        return [
+            sum(self.cache.get(key)["fitness"] for key in row) / len(row)
+            for row in keys
+        ]
+
+# ---------------------------------------------------------------------------- #
+    def sweep(self, grid: dict):
+        """Evaluate every combination of the values in `grid`, e.g.
+        {"cell_speed": [10, 20, 30], "metabolic_cost": [1, 2]}.
+
+        Returns:
+            list: (traits, fitness) pairs, the fittest first.
+        """
+        traits = list(grid)
+        population = [
+            dict(zip(traits, values))
+            for values in itertools.product(*[grid[trait] for trait in traits])
+        ]
+
+        return sorted(
+            zip(population, self.evaluate(population)),
+            key = lambda pair: pair[1],
+            reverse = True
+        )
+
+# ---------------------------------------------------------------------------- #
+    def run(self, on_generation = None):
+        """Evolve `generations` generations.
+
+        Args:
+            on_generation (callable): Called as `on_generation(generation,
+                ranked)` after every generation, with its (traits, fitness)
+                pairs, the fittest first. Defaults to None.
+        Returns:
+            tuple: The fittest (traits, fitness) found.
+        """
+        population = [self.random_traits() for i in range(self.population_size)]
+        best = None
+
+        for generation in range(self.generations):
+            ranked = sorted(
+                zip(population, self.evaluate(population)),
+                key = lambda pair: pair[1],
+                reverse = True
+            )
+
+            for traits, fitness in ranked:
+                self.history.append((generation, traits, fitness))
+
+            if best is None or ranked[0][1] > best[1]:
+                best = ranked[0]
+
+            if on_generation is not None:
+                on_generation(generation, ranked)
+
+            # The best quarter lives on and breeds the rest:
+            parents = [traits for traits, fitness in ranked]
+            parents = parents[:max(self.population_size // 4, 2)]
+
+            population = parents + [
+                self.offspring(
+                    self.rng.choice(parents),
+                    self.rng.choice(parents)
+                )
+                for i in range(self.population_size - len(parents))
+            ]
+
+        return best
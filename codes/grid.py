@@ -0,0 +1,192 @@
+import numpy as np
+
+
+class SpatialGrid:
+    """A uniform grid (spatial hash) over the Brorix84 world. Every creature
+    is stored in the grid cells its bounding box covers, so touch and sense
+    queries only look at the creatures around the queried rectangle instead of
+    the whole world.
+    """
+    def __init__(
+        self,
+        cell_size: int = 40,
+        tags: tuple = ("scux", "litix", "vohix")
+    ):
+        """Instantiate an empty grid.
+
+        Args:
+            cell_size (int): The side of each grid cell in pixels. It should be
+                close to the largest query, the Litix sense range. Defaults to
+                40.
+
+            tags (tuple): The creature tags answered by the queries. Defaults
+                to ("scux", "litix", "vohix").
+
+        """
+        self.cell_size = cell_size
+        self.tags = tags
+
+        self.cells = dict()     # (column, row) -> {creature: tag}
+        self.items = dict()     # creature -> (tag, coords, cells)
+
+# ---------------------------------------------------------------------------- #
+    def __len__(self):
+        return len(self.items)
+
+# ---------------------------------------------------------------------------- #
+    def __contains__(self, creature):
+        return creature in self.items
+
+# ---------------------------------------------------------------------------- #
+    def _cells(self, x0, y0, x1, y1):
+        columns = range(int(x0 // self.cell_size), int(x1 // self.cell_size) + 1)
+        rows = range(int(y0 // self.cell_size), int(y1 // self.cell_size) + 1)
+
+        return [(column, row) for column in columns for row in rows]
+
+# ---------------------------------------------------------------------------- #
+    def insert(self, creature, tag, coords):
+        """Add `creature` with bounding box `coords` (x0, y0, x1, y1)."""
+        cells = self._cells(*coords)
+
+        for cell in cells:
+            self.cells.setdefault(cell, dict())[creature] = tag
+
+        self.items[creature] = (tag, coords, cells)
+
+# ---------------------------------------------------------------------------- #
+    def remove(self, creature):
+        """Forget `creature`. Removing an unknown creature does nothing."""
+        if creature not in self.items:
+            return
+
+        tag, coords, cells = self.items.pop(creature)
+
+        for cell in cells:
+            bucket = self.cells[cell]
+            del bucket[creature]
+
+            if len(bucket) == 0:
+                del self.cells[cell]
+
+# ---------------------------------------------------------------------------- #
+    def move(self, creature, coords):
+        """Update the bounding box of `creature` after it moved."""
+        tag, old_coords, old_cells = self.items[creature]
+        cells = self._cells(*coords)
+
+        if cells == old_cells:
+            self.items[creature] = (tag, coords, cells)
+        else:
+            self.remove(creature)
+            self.insert(creature, tag, coords)
+
+# ---------------------------------------------------------------------------- #
+    def _candidates(self, x0, y0, x1, y1, exclude):
+        candidates = dict()
+
+        for cell in self._cells(x0, y0, x1, y1):
+            candidates.update(self.cells.get(cell, dict()))
+
+        candidates.pop(exclude, None)
+
+        return candidates
+
+# ---------------------------------------------------------------------------- #
+    def find_overlapping(self, x0, y0, x1, y1, exclude = None):
+        """Same as `Canvas.find_overlapping`, grouped by tag."""
+        objects = {tag: list() for tag in self.tags}
+
+        for creature, tag in self._candidates(x0, y0, x1, y1, exclude).items():
+            coords = self.items[creature][1]
+
+            if coords[0] <= x1 and coords[2] >= x0 \
+            and coords[1] <= y1 and coords[3] >= y0:
+                objects[tag].append(creature)
+
+        return objects
+
+# ---------------------------------------------------------------------------- #
+    def find_enclosed(self, x0, y0, x1, y1, exclude = None):
+        """Same as `Canvas.find_enclosed`, grouped by tag."""
+        objects = {tag: list() for tag in self.tags}
+
+        for creature, tag in self._candidates(x0, y0, x1, y1, exclude).items():
+            coords = self.items[creature][1]
+
+            if coords[0] > x0 and coords[2] < x1 \
+            and coords[1] > y0 and coords[3] < y1:
+                objects[tag].append(creature)
+
+        return objects
+
+# ---------------------------------------------------------------------------- #
+class PointGrid:
+    """A static index of points, like the positions of a whole colony, built
+    in a single vectorized pass (one sort by grid cell) and meant to be
+    rebuilt once per tick. Radius queries only look at the cells around the
+    queried point, so finding the neighbours of every predator costs about
+    the same whatever the size of the colony.
+    """
+    def __init__(
+        self,
+        points,
+        cell_size: float = 40
+    ):
+        """Index `points`.
+
+        Args:
+            points (np.ndarray): An (n, 2) array of non negative (x, y).
+
+            cell_size (float): The side of each grid cell in pixels. It
+                should be close to the usual query radius. Defaults to 40.
+
+        """
+        self.points = np.asarray(points, dtype = np.float64).reshape(-1, 2)
+        self.cell_size = cell_size
+
+        cells = np.maximum(np.floor(self.points / cell_size), 0).astype(np.int64)
+        self.n_columns = int(cells[:, 0].max()) + 1 if len(cells) else 1
+        self.n_rows = int(cells[:, 1].max()) + 1 if len(cells) else 1
+
+        # Points sorted by cell, the cells of a row are contiguous:
+        keys = cells[:, 1] * self.n_columns + cells[:, 0]
+        self.order = np.argsort(keys, kind = "stable")
+        self.keys = keys[self.order]
+
+# ---------------------------------------------------------------------------- #
+    def __len__(self):
+        return self.points.shape[0]
+
+# ---------------------------------------------------------------------------- #
+    def query_radius(self, x, y, radius):
+        """Indexes of the points within `radius` of (x, y), the nearest
+        first.
+        """
+        c0, c1 = np.clip(
+            np.floor([(x - radius) / self.cell_size, (x + radius) / self.cell_size]),
+            0,
+            self.n_columns - 1
+        ).astype(np.int64)
+        r0, r1 = np.clip(
+            np.floor([(y - radius) / self.cell_size, (y + radius) / self.cell_size]),
+            0,
+            self.n_rows - 1
+        ).astype(np.int64)
+
+        rows = np.arange(r0, r1 + 1) * self.n_columns
+        starts = np.searchsorted(self.keys, rows + c0, side = "left")
+        ends = np.searchsorted(self.keys, rows + c1, side = "right")
+
+        candidates = np.concatenate(
+            [self.order[start:end] for start, end in zip(starts, ends)]
+            + [np.zeros(0, dtype = np.int64)]
+        )
+
+        distances = np.hypot(
+            self.points[candidates, 0] - x,
+            self.points[candidates, 1] - y
+        )
+        inside = distances <= radius
+
+        return candidates[inside][np.argsort(distances[inside], kind = "stable")]
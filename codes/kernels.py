@@ -0,0 +1,301 @@
+import math
+import numpy as np
+
+
+# "numba" when the kernels are compiled, "numpy" when they fall back, None
+# until the first kernel runs:
+backend = None
+_move_numba = None
+_eat_numba = None
+_count_numba = None
+
+# Angles are whole degrees, so their cosines and sines are looked up in the
+# same table by both backends, which keeps their results identical:
+COS = np.cos(np.radians(np.arange(360)))
+SIN = np.sin(np.radians(np.arange(360)))
+
+
+def _move_numpy(position, speed, angle, width, height, tracks):
+    angle = angle % 360
+
+    position[:, 0] = np.clip(
+        np.floor(position[:, 0] + speed * COS[angle]),
+        0,
+        width
+    )
+
+    position[:, 1] = np.clip(
+        np.floor(position[:, 1] + speed * SIN[angle]),
+        0,
+        height
+    )
+
+    if tracks is not None:
+        tracks[:, :-1] = tracks[:, 1:]
+        tracks[:, -1] = position
+
+# ---------------------------------------------------------------------------- #
+def _move_loop(position, speed, angle, width, height, tracks, cos, sin):
+    # A single pass with no temporaries, compiled by Numba:
+    for i in range(position.shape[0]):
+        a = angle[i] % 360
+
+        x = math.floor(position[i, 0] + speed[i] * cos[a])
+        y = math.floor(position[i, 1] + speed[i] * sin[a])
+
+        position[i, 0] = min(max(x, 0.0), width)
+        position[i, 1] = min(max(y, 0.0), height)
+
+        if tracks is not None:
+            for j in range(tracks.shape[1] - 1):
+                tracks[i, j, 0] = tracks[i, j + 1, 0]
+                tracks[i, j, 1] = tracks[i, j + 1, 1]
+
+            tracks[i, -1, 0] = position[i, 0]
+            tracks[i, -1, 1] = position[i, 1]
+
+# ---------------------------------------------------------------------------- #
+def move(position, speed, angle, width, height, tracks = None):
+    """Move every creature `speed` pixels towards its `angle` and clamp it
+    to the world, in place. Positions are floored to whole pixels, like the
+    Litix objects do.
+
+    Args:
+        position (np.ndarray): The (n, 2) float centers, updated in place.
+
+        speed (np.ndarray): The n speeds in pixels per tick.
+
+        angle (np.ndarray): The n integer directions in degrees.
+
+        width (int): The world width.
+
+        height (int): The world height.
+
+        tracks (np.ndarray): The (n, k, 2) last positions of every creature,
+            shifted and updated in place. Defaults to None, no tracks.
+
+    """
+    if _load() == "numba":
+        _move_numba(
+            position, speed, angle, float(width), float(height), tracks, COS, SIN
+        )
+    else:
+        _move_numpy(position, speed, angle, width, height, tracks)
+
+# ---------------------------------------------------------------------------- #
+def _eat_numpy(rects, coords, order, x0, reach, alive, size, energy):
+    eaten = 0
+
+    for i, (a0, b0, a1, b1) in enumerate(rects.tolist()):
+        start = np.searchsorted(x0, a0 - reach, side = "left")
+        end = np.searchsorted(x0, a1, side = "right")
+
+        candidates = order[start:end]
+        box = coords[candidates]
+        hit = candidates[
+            alive[candidates]
+            & (box[:, 0] <= a1) & (box[:, 2] >= a0)
+            & (box[:, 1] <= b1) & (box[:, 3] >= b0)
+        ]
+
+        alive[hit] = False
+        energy[i] = (size[hit] ** 2).sum()
+        eaten += len(hit)
+
+    return eaten
+
+# ---------------------------------------------------------------------------- #
+def _eat_loop(rects, coords, order, x0, reach, alive, size, energy):
+    # The same pass as `_eat_numpy`, one algae at a time, compiled by Numba:
+    eaten = 0
+
+    for i in range(rects.shape[0]):
+        a0, b0, a1, b1 = rects[i, 0], rects[i, 1], rects[i, 2], rects[i, 3]
+        start = np.searchsorted(x0, a0 - reach, side = "left")
+        end = np.searchsorted(x0, a1, side = "right")
+
+        total = 0
+        for k in range(start, end):
+            j = order[k]
+
+            if alive[j] \
+            and coords[j, 0] <= a1 and coords[j, 2] >= a0 \
+            and coords[j, 1] <= b1 and coords[j, 3] >= b0:
+                alive[j] = False
+                total += size[j] * size[j]
+                eaten += 1
+
+        energy[i] = total
+
+    return eaten
+
+# ---------------------------------------------------------------------------- #
+def eat_overlapping(rects, coords, alive, size):
+    """Every rectangle, in order, eats the living algae overlapping it, so
+    the first rectangle touching an algae is the one that eats it. Algae are
+    sorted once by their left edge, so each rectangle only tests the algae
+    in its columns instead of all of them.
+
+    Args:
+        rects (np.ndarray): The (n, 4) rectangles (x0, y0, x1, y1) that eat.
+
+        coords (np.ndarray): The (m, 4) rectangles of the algae.
+
+        alive (np.ndarray): The m alive flags, the eaten algae are set to
+            False in place.
+
+        size (np.ndarray): The m algae sizes, an algae gives size ** 2.
+
+    Returns:
+        tuple: The energy eaten by every rectangle and how many algae were
+            eaten.
+    """
+    rects = np.asarray(rects, dtype = np.float64).reshape(-1, 4)
+    energy = np.zeros(len(rects), dtype = np.int64)
+
+    if len(coords) == 0 or len(rects) == 0:
+        return energy, 0
+
+    order = np.argsort(coords[:, 0], kind = "stable")
+    x0 = np.ascontiguousarray(coords[order, 0])
+    reach = float((coords[:, 2] - coords[:, 0]).max())
+
+    if _load() == "numba":
+        eaten = _eat_numba(rects, coords, order, x0, reach, alive, size, energy)
+    else:
+        eaten = _eat_numpy(rects, coords, order, x0, reach, alive, size, energy)
+
+    return energy, int(eaten)
+
+# ---------------------------------------------------------------------------- #
+def _count_numpy(
+    rects, coords, order, x0, reach, alive, enclosed, exclude_self, counts
+):
+    for i, (a0, b0, a1, b1) in enumerate(rects.tolist()):
+        start = np.searchsorted(x0, a0 - reach, side = "left")
+        end = np.searchsorted(x0, a1, side = "right")
+
+        candidates = order[start:end]
+        box = coords[candidates]
+
+        if enclosed:
+            inside = (box[:, 0] > a0) & (box[:, 2] < a1) \
+                & (box[:, 1] > b0) & (box[:, 3] < b1)
+        else:
+            inside = (box[:, 0] <= a1) & (box[:, 2] >= a0) \
+                & (box[:, 1] <= b1) & (box[:, 3] >= b0)
+
+        inside &= alive[candidates]
+
+        if exclude_self:
+            inside &= candidates != i
+
+        counts[i] = np.count_nonzero(inside)
+
+# ---------------------------------------------------------------------------- #
+def _count_loop(
+    rects, coords, order, x0, reach, alive, enclosed, exclude_self, counts
+):
+    # The same pass as `_count_numpy`, one rectangle at a time, compiled by
+    # Numba:
+    for i in range(rects.shape[0]):
+        a0, b0, a1, b1 = rects[i, 0], rects[i, 1], rects[i, 2], rects[i, 3]
+        start = np.searchsorted(x0, a0 - reach, side = "left")
+        end = np.searchsorted(x0, a1, side = "right")
+
+        total = 0
+        for k in range(start, end):
+            j = order[k]
+
+            if not alive[j] or (exclude_self and j == i):
+                continue
+
+            if enclosed:
+                inside = coords[j, 0] > a0 and coords[j, 2] < a1 \
+                    and coords[j, 1] > b0 and coords[j, 3] < b1
+            else:
+                inside = coords[j, 0] <= a1 and coords[j, 2] >= a0 \
+                    and coords[j, 1] <= b1 and coords[j, 3] >= b0
+
+            if inside:
+                total += 1
+
+        counts[i] = total
+
+# ---------------------------------------------------------------------------- #
+def count_boxes(
+    rects,
+    coords,
+    enclosed = False,
+    alive = None,
+    exclude_self = False
+):
+    """How many boxes overlap each rectangle, or are enclosed by it, the
+    same tests of `Canvas.find_overlapping` and `Canvas.find_enclosed`.
+    Boxes are sorted once by their left edge, like in `eat_overlapping`.
+
+    Args:
+        rects (np.ndarray): The (n, 4) rectangles (x0, y0, x1, y1).
+
+        coords (np.ndarray): The (m, 4) boxes that are counted.
+
+        enclosed (bool): Count the boxes strictly inside every rectangle
+            instead of the boxes overlapping it. Defaults to False.
+
+        alive (np.ndarray): The m flags of the boxes that count. Defaults to
+            None, all of them.
+
+        exclude_self (bool): `rects` and `coords` belong to the same
+            creatures, a rectangle doesn't count the box at its own index.
+            Defaults to False.
+
+    Returns:
+        np.ndarray: The count of every rectangle.
+    """
+    rects = np.asarray(rects, dtype = np.float64).reshape(-1, 4)
+    coords = np.asarray(coords, dtype = np.float64).reshape(-1, 4)
+    counts = np.zeros(len(rects), dtype = np.int64)
+
+    if len(coords) == 0 or len(rects) == 0:
+        return counts
+
+    if alive is None:
+        alive = np.ones(len(coords), dtype = bool)
+
+    order = np.argsort(coords[:, 0], kind = "stable")
+    x0 = np.ascontiguousarray(coords[order, 0])
+    reach = float((coords[:, 2] - coords[:, 0]).max())
+
+    if _load() == "numba":
+        _count_numba(
+            rects, coords, order, x0, reach, alive, enclosed, exclude_self, counts
+        )
+    else:
+        _count_numpy(
+            rects, coords, order, x0, reach, alive, enclosed, exclude_self, counts
+        )
+
+    return counts
+
+# ---------------------------------------------------------------------------- #
+def _load():
+    """Pick the backend the first time a kernel runs. Importing Numba is
+    slow, so processes that only import this module, like the parent of an
+    ensemble or a `--help`, don't pay for it.
+    """
+    global backend, _move_numba, _eat_numba, _count_numba
+
+    if backend is not None:
+        return backend
+
+    try:
+        import numba
+    except ImportError:
+        backend = "numpy"
+    else:
+        _move_numba = numba.njit(cache = True)(_move_loop)
+        _eat_numba = numba.njit(cache = True)(_eat_loop)
+        _count_numba = numba.njit(cache = True)(_count_loop)
+        backend = "numba"
+
+    return backend
@@ -1,17 +1,80 @@
-from tkinter import *
 from math import sin, cos, radians
 import numpy as np
-import pandas as pd
-import uuid
+from memory import RingMemory
+from reward import RewardTracker
+from randomness import RandomService, shared
+from columns import ColumnStore
+from kernels import move, count_boxes
 
 
+def _clamp(value, low, high):
+    if value < low:
+        return low
+    elif value > high:
+        return high
+    else:
+        return value
+
+# ---------------------------------------------------------------------------- #
+def _join_counts(*counts):
+    """The counts of every tag written one after the other, the way the
+    `in_touch` and `in_range` events of `Litix` are: 3 scux, 12 litix and no
+    vohix give 3120. Every argument is an array with one count per cell.
+    """
+    joined = np.zeros(len(counts[0]), dtype = np.int64)
+
+    for count in counts:
+        digits = np.floor(np.log10(np.maximum(count, 1))).astype(np.int64) + 1
+        joined = joined * 10 ** digits + count
+
+    return joined
+
+# ---------------------------------------------------------------------------- #
 class Litix:
     """This class implements a Litix. An unicelular creature from Brorix84
     world that converts organic matter into energy.
     """
+    # The events a cell remembers, and how they are stored. The color is its
+    # index in `cell_colors` and the status is whether the cell is alive, the
+    # strings are only rebuilt for telemetry and `memory_frame`:
+    memory_fields = {
+        "age": np.int64,
+        "color": np.uint8,
+        "energy": np.float64,
+        "position_x": np.float64,
+        "position_y": np.float64,
+        "direction": np.int64,
+        "in_touch": np.int64,
+        "in_range": np.int64,
+        "status": bool,
+        "short_term_reward": np.float64,
+        "long_term_reward": np.float64
+    }
+
+    # A pallete with ten RGB colors to indicate the cell energy content,
+    # shared by every Litix that doesn't bring its own:
+    default_cell_colors = [
+        "#ff8b15", "#fe9831", "#fda547", "#fcb15d", "#fbbc72",
+        "#fac788", "#fad29e", "#f9dcb4", "#f8e5cb", "#f7efe3"
+    ]
+
+    # No instance dict, large colonies are bound by memory:
+    __slots__ = (
+        "planet", "cell_size", "cell_speed", "cell_colors", "max_memory_size",
+        "max_energy_content", "metabolic_cost", "sense_range",
+        "direction_angle", "direction_angle_window", "direction_change_prob",
+        "center_coordinates", "age", "feeling", "status", "tracks", "memory",
+        "reward", "current_color", "energy_content", "id"
+    )
+
+    max_age = 25            # days, a Litix may live 25 cycles
+    spore_age = 15          # days, from then on a Litix may split into spores
+    spore_count = 2         # spores of every split
+    spore_energy = 0.5      # share of `max_energy_content` needed to split
+
     def __init__(
         self,
-        canvas: Canvas,
+        planet,
         cell_size: int = None,
         cell_speed: int = None,
         cell_colors: list = None,
@@ -28,6 +91,9 @@ class Litix:
         eat organic matter in order to get energy.
 
         Args:
+            planet (Brorix84): The world where this cell lives. It answers the
+                cell's touch and sense queries and bounds its movement.
+
             cell_size (int): The size of cells in pixels. It is randomly choosed
                 among 14, 16, 18, and 20 if None. Size also defines `cell_speed`
                 (defaults to 1.3 * `cell_size`) and `max_energy_content`
@@ -37,9 +103,8 @@ class Litix:
                 Defaults to 1.3 * `cell_size` if None.
 
             cell_colors (list): A pallete with ten RGB colors to indicate the
-                cell `current_energy_content`. Defaults to [ "#f6ac40",
-                "#db9a39", "#c18933", "#a8782c", "#906726", "#785620",
-                "#62461a", "#4c3715", "#38280f", "#251a05"] if None.
+                cell `current_energy_content`. Defaults to
+                `Litix.default_cell_colors`, shared by every Litix, if None.
 
             max_memory_size (int): The maximum history records this cell can
                 store. This is used to take decisions, so, bugger mememories
@@ -58,49 +123,90 @@ class Litix:
                 defaults to a random value between 0 and 359.
 
             center_coordinates (tuple): Tuple of integers representing the
-                cell initial coordinates in `canvas`.
-
-            canvas (Tkinter.canvas): The canvas where this cell will be placed.
+                cell initial coordinates in `planet`.
 
+        Arguments are only checked here, attributes are plain slots and are
+        not checked again when they change.
         """
-
-        self.cell_size = cell_size
-        self.cell_speed = cell_speed
-        self.cell_colors = cell_colors
-        self.max_memory_size = max_memory_size
-        self.max_energy_content = max_energy_content
-        self.metabolic_cost = metabolic_cost
-        self.sense_range = sense_range
-        self.direction_angle = direction_angle
-        self.direction_angle_window = direction_angle_window
-        self.direction_change_prob = direction_change_prob
-        self.center_coordinates = center_coordinates
-        self.canvas = canvas
+        for name, value, types in [
+            ("cell_size", cell_size, int),
+            ("cell_speed", cell_speed, (int, float)),
+            ("cell_colors", cell_colors, list),
+            ("max_memory_size", max_memory_size, int),
+            ("max_energy_content", max_energy_content, int),
+            ("metabolic_cost", metabolic_cost, int),
+            ("sense_range", sense_range, int),
+            ("direction_angle", direction_angle, int),
+            ("direction_angle_window", direction_angle_window, int),
+            ("direction_change_prob", direction_change_prob, float),
+            ("center_coordinates", center_coordinates, tuple)
+        ]:
+            assert value is None or isinstance(value, types), \
+                f"<ERROR> `{name}` must be a {types}, not {type(value)}"
+
+        rng = planet.rng
+        self.planet = planet
+
+        # Random defaults are drawn in this order, keep it to keep runs:
+        if cell_size is None:
+            cell_size = rng.choice([14, 16, 18, 20])
+        self.cell_size = cell_size if cell_size % 2 == 0 else cell_size + 1
+
+        self.cell_speed = 1.3 * self.cell_size if cell_speed is None else cell_speed
+        self.cell_colors = (
+            self.default_cell_colors if cell_colors is None else cell_colors
+        )
+        self.max_memory_size = 100 if max_memory_size is None else max_memory_size
+        self.max_energy_content = (
+            self.cell_size ** 2
+            if max_energy_content is None
+            else max_energy_content
+        )
+        self.metabolic_cost = max(
+            int(self.cell_size / 100) if metabolic_cost is None else metabolic_cost,
+            1
+        )
+        self.sense_range = 2 * self.cell_size if sense_range is None else sense_range
+        self.direction_angle = (
+            rng.integers(0, 360) if direction_angle is None else direction_angle
+        )
+        self.direction_angle_window = _clamp(
+            rng.integers(30, 90)
+            if direction_angle_window is None
+            else direction_angle_window,
+            30,
+            90
+        )
+        self.direction_change_prob = _clamp(
+            rng.uniform(0.4, 0.61)
+            if direction_change_prob is None
+            else direction_change_prob,
+            0.10,
+            0.90
+        )
+        self.center_coordinates = (
+            (rng.integers(5, 995), rng.integers(5, 700))
+            if center_coordinates is None
+            else center_coordinates
+        )
 
         self.age = 0
         self.feeling = None
         self.status = "alive"
         self.tracks = list()
-        self.memory = pd.DataFrame()
+        self.memory = RingMemory(self.max_memory_size, self.memory_fields)
+        self.reward = RewardTracker()
         self.current_color = self.cell_colors[0]
-        self.cell = {"body": None, "sense": None}
         self.energy_content = self.max_energy_content
-        self.id = str(uuid.uuid4().hex)
-
-        self._draw_cell()
+        self.id = None              # Given by the planet registry
 
 # ---------------------------------------------------------------------------- #
     def _randomize_direction_angle(self):
-        try:
-            self.direction_angle = np.random.randint(
-                self.direction_angle - self.direction_angle_window,
-                self.direction_angle + self.direction_angle_window
-            )
-        except ValueError:
-            self.direction_angle = np.random.randint(
-                self.direction_angle + self.direction_angle_window,
-                self.direction_angle - self.direction_angle_window
-            )
+        # `direction_angle_window` is at least 30, so the range is never empty:
+        self.direction_angle = self.planet.rng.integers(
+            self.direction_angle - self.direction_angle_window,
+            self.direction_angle + self.direction_angle_window
+        )
 
 # ---------------------------------------------------------------------------- #
     def _update_direction_angle(self):
@@ -113,16 +219,28 @@ class Litix:
         Returns:
             None.
         """
-        if self.memory.shape[0] > 10:
-            long_term_reward = self.memory.long_term_reward.to_list()[-1]
+        if len(self.memory) > 10:
+            long_term_reward = self.memory.newest("long_term_reward")
 
-            self.direction_change_prob += long_term_reward
+            self.direction_change_prob = _clamp(
+                self.direction_change_prob + long_term_reward,
+                0.10,
+                0.90
+            )
 
-            if np.random.random() >= self.direction_change_prob:
-                self.direction_angle_window += 1
+            if self.planet.rng.random() >= self.direction_change_prob:
+                self.direction_angle_window = _clamp(
+                    self.direction_angle_window + 1,
+                    30,
+                    90
+                )
                 self._randomize_direction_angle()
             else:
-                self.direction_angle_window -= 1
+                self.direction_angle_window = _clamp(
+                    self.direction_angle_window - 1,
+                    30,
+                    90
+                )
         else:
             self._randomize_direction_angle()
 
@@ -130,7 +248,7 @@ class Litix:
     def _log_events(self):
         events = {
             "age": self.age,
-            "color": self.current_color,
+            "color": self.cell_colors.index(self.current_color),
             "energy": self.energy_content / self.max_energy_content,
             "position_x": self.center_coordinates[0],
             "position_y": self.center_coordinates[1],
@@ -141,82 +259,55 @@ class Litix:
             "in_range": int(
                 "".join([str(len(object_)) for object_ in self.feeling[1].values()])
             ),
-            "status": self.status
+            "status": self.status == "alive"
         }
 
-        self.memory = self.memory.append(events, ignore_index = True)
-
-        if self.memory.shape[0] > self.max_memory_size:
-            self.memory = self.memory.tail(self.max_memory_size)
-
-        self._update_reward()
-
-        if self.age % 10 == 0:
-            self.memory.to_csv(f"../data/litix_memory_{self.id}.csv", decimal = ",", index = False)
-
-# ---------------------------------------------------------------------------- #
-    def _update_reward(self):
+        events["short_term_reward"], events["long_term_reward"] = \
+            self._update_reward(events["energy"])
 
-        def short_term_reward_policy(energy_diff):
-            return energy_diff
+        self.memory.append(events)
 
-        def long_term_reward_policy(short_term_reward_value):
-            return np.mean(
-                np.asarray(
-                    [
-                        strv + (strv * 1 / i)
-                        for strv, i in zip(short_term_reward_value, range(1, 11))
-                    ]
-                )
+        if self.planet.telemetry is not None:
+            self.planet.telemetry.write(
+                self.id,
+                dict(events, color = self.current_color, status = self.status)
             )
 
-        self.memory["short_term_reward"] = self.memory.energy.diff().apply(
-            lambda x: short_term_reward_policy(x)
+# ---------------------------------------------------------------------------- #
+    def memory_frame(self):
+        """The memory of this cell as a DataFrame, with its colors and status
+        as strings.
+        """
+        return self.memory.to_frame(
+            labels = {"color": self.cell_colors, "status": ["dead", "alive"]}
         )
 
-        self.memory["long_term_reward"] = self.memory.short_term_reward.rolling(
-            window = 10
-        ).apply(
-            lambda x: long_term_reward_policy(x)
-        )
+# ---------------------------------------------------------------------------- #
+    def _update_reward(self, energy):
+        """Compute the short and long term rewards of a new event with
+        `energy`, in O(1) with the cell `RewardTracker`.
 
-        self.memory["long_term_reward"].fillna(self.memory.long_term_reward.mean(), inplace = True)
+        Args:
+            energy (float): The energy proportion of the new event.
+        Returns:
+            tuple: (short_term_reward, long_term_reward), NaN while there is
+                not enough memory.
+        """
+        short_term_reward, long_term_reward = self.reward.update(energy)
+
+        return short_term_reward[0], long_term_reward[0]
 
 # ---------------------------------------------------------------------------- #
     def _update_feeling(self):
-        tags = ["scux", "litix", "vohix"]
-        body_coords = self.canvas.coords(self.cell["body"])
-        sense_coords = self.canvas.coords(self.cell["sense"])
-
-        in_touch_objects = {
-            tag: [
-                id
-                for id in self.canvas.find_overlapping(
-                    body_coords[0],
-                    body_coords[1],
-                    body_coords[2],
-                    body_coords[3]
-               )
-               if id in self.canvas.find_withtag(tag)
-               and id not in [self.cell["body"], self.cell["sense"]]
-            ]
-            for tag in tags
-        }
+        in_touch_objects = self.planet.find_overlapping(
+            *self.body_coords,
+            exclude = self
+        )
 
-        in_range_objects = {
-            tag: [
-                id
-                for id in self.canvas.find_enclosed(
-                    sense_coords[0],
-                    sense_coords[1],
-                    sense_coords[2],
-                    sense_coords[3]
-               )
-               if id in self.canvas.find_withtag(tag)
-               and id not in [self.cell["body"], self.cell["sense"]]
-            ]
-            for tag in tags
-        }
+        in_range_objects = self.planet.find_enclosed(
+            *self.sense_coords,
+            exclude = self
+        )
 
         self.feeling = (in_touch_objects, in_range_objects)
 
@@ -239,55 +330,30 @@ class Litix:
 
         self.current_color = self.cell_colors[current_color_index]
 
-        self.canvas.itemconfig(
-            self.cell["body"],
-            fill = self.current_color
-        )
-
-        self.canvas.itemconfig(
-            self.cell["body"],
-            outline = self.current_color
-        )
-
-        self.canvas.itemconfig(
-            self.cell["sense"],
-            outline = self.current_color
-        )
-
 # ---------------------------------------------------------------------------- #
     def _update_track_list(self, origin, destination):
-        self.tracks.append(
-            self.canvas.create_line(
-                origin[0],
-                origin[1],
-                destination[0],
-                destination[1],
-                fill = self.current_color
-            )
-        )
+        self.tracks.append((origin, destination, self.current_color))
 
         if len(self.tracks) > 10:
-            self.canvas.delete(self.tracks[0])
-            self.tracks.remove(self.tracks[0])
+            del self.tracks[0]
 # ---------------------------------------------------------------------------- #
-    def _draw_cell(self):
-        self.cell["body"] = self.canvas.create_oval(
+    @property
+    def body_coords(self):
+        return (
             self.center_coordinates[0] - (self.cell_size / 2),
             self.center_coordinates[1] - (self.cell_size / 2),
             self.center_coordinates[0] + (self.cell_size / 2),
-            self.center_coordinates[1] + (self.cell_size / 2),
-            fill = self.current_color,
-            outline = self.current_color,
-            tag = ("litix", "body")
+            self.center_coordinates[1] + (self.cell_size / 2)
         )
 
-        self.cell["sense"] = self.canvas.create_oval(
+# ---------------------------------------------------------------------------- #
+    @property
+    def sense_coords(self):
+        return (
             self.center_coordinates[0] - self.sense_range,
             self.center_coordinates[1] - self.sense_range,
             self.center_coordinates[0] + self.sense_range,
-            self.center_coordinates[1] + self.sense_range,
-            outline = self.current_color,
-            tag = ("litix", "sense")
+            self.center_coordinates[1] + self.sense_range
         )
 
 # ---------------------------------------------------------------------------- #
@@ -297,12 +363,12 @@ class Litix:
 
         new_x = self.__check_canvas_limits(
             old_x + self.cell_speed * cos(radians(self.direction_angle)),
-            1000
+            self.planet.width
         )
 
         new_y = self.__check_canvas_limits(
             old_y + self.cell_speed * sin(radians(self.direction_angle)),
-            700
+            self.planet.height
         )
 
         self.center_coordinates = (new_x, new_y)
@@ -314,253 +380,623 @@ class Litix:
 # ---------------------------------------------------------------------------- #
     def _update_position(self):
         origin, destination = self._update_center_coordinates()
-
-        self.canvas.coords(
-            self.cell["body"],
-            self.center_coordinates[0] - (self.cell_size / 2),
-            self.center_coordinates[1] - (self.cell_size / 2),
-            self.center_coordinates[0] + (self.cell_size / 2),
-            self.center_coordinates[1] + (self.cell_size / 2)
-        )
-
-        self.canvas.coords(
-            self.cell["sense"],
-            self.center_coordinates[0] - self.sense_range,
-            self.center_coordinates[1] - self.sense_range,
-            self.center_coordinates[0] + self.sense_range,
-            self.center_coordinates[1] + self.sense_range
-        )
+        self.planet.grid.move(self, self.body_coords)
+        self.planet.sense_grid.move(self, self.sense_coords)
 
         self._update_track_list(origin, destination)
 # ---------------------------------------------------------------------------- #
     def _update_energy_content(self):
         # 1. First, let's feed this creature:
         for scux in self.feeling[0]["scux"]:
-            scux_coords = self.canvas.coords(scux)
-            scux_energy_content = (scux_coords[2] - scux_coords[0]) ** 2
+            scux_energy_content = self.planet.eat_scux(scux)
 
             self.energy_content += scux_energy_content
 
             if self.energy_content > self.max_energy_content:
                 self.energy_content = self.max_energy_content
 
-            self.canvas.delete(scux)
-
         # 2. Now, let's discount the metabolic cost
         self.energy_content -= self.metabolic_cost
 
 # ---------------------------------------------------------------------------- #
     def _update_status(self):
-        if self.energy_content <= 0:
-            self.canvas.delete(self.cell["body"])
-            self.canvas.delete(self.cell["sense"])
-            for track in self.tracks:
-                self.canvas.delete(track)
-
+        if self.energy_content <= 0 or self.age >= self.max_age:
             self.status = "dead"
         else:
-            self.sttus = "alive"
+            self.status = "alive"
+
+# ---------------------------------------------------------------------------- #
+    def _sporulate(self):
+        """A Litix old enough and well fed stops and turns its energy into
+        `spore_count` new Litix, which inherit its traits. Returns the
+        spores, the planet kills the parent.
+        """
+        if self.status != "alive" or self.age < self.spore_age \
+        or self.energy_content < self.spore_energy * self.max_energy_content:
+            return list()
+
+        spores = [
+            Litix(
+                planet = self.planet,
+                cell_size = self.cell_size,
+                cell_speed = self.cell_speed,
+                max_energy_content = self.max_energy_content,
+                metabolic_cost = self.metabolic_cost,
+                sense_range = self.sense_range,
+                max_memory_size = self.max_memory_size,
+                direction_angle_window = self.direction_angle_window,
+                direction_change_prob = self.direction_change_prob,
+                center_coordinates = self.center_coordinates
+            )
+            for i in range(self.spore_count)
+        ]
+
+        for spore in spores:
+            spore.energy_content = self.energy_content // self.spore_count
+            spore._update_current_color()
+
+        return spores
 
 # ---------------------------------------------------------------------------- #
     def _update_age(self):
         if self.status == "alive":
+            profiler = self.planet.profiler
+
             self.age += 1
             self._update_position()
+            if profiler is not None:
+                profiler.lap("litix.position")
+
             self._update_feeling()
+            if profiler is not None:
+                profiler.lap("litix.feeling")
+
             self._update_energy_content()
             self._update_current_color()
             self._update_status()
+            if profiler is not None:
+                profiler.lap("litix.energy")
+
             self._log_events()
+            if profiler is not None:
+                profiler.lap("litix.logging")
+
             #self.direction_angle = np.random.randint(0, 360)
             self._update_direction_angle()
+            if profiler is not None:
+                profiler.lap("litix.direction")
 
 # ---------------------------------------------------------------------------- #
-    @property
-    def direction_change_prob(self):
-        return self._direction_change_prob
+    # The plain attributes saved by `pack`, and how they are stored:
+    state_fields = {
+        "id": np.int64,
+        "age": np.int64,
+        "status": "U5",
+        "current_color": "U7",
+        "energy_content": np.int64,
+        "cell_size": np.int64,
+        "cell_speed": np.float64,
+        "max_memory_size": np.int64,
+        "max_energy_content": np.int64,
+        "metabolic_cost": np.int64,
+        "sense_range": np.int64,
+        "direction_angle": np.int64,
+        "direction_angle_window": np.int64,
+        "direction_change_prob": np.float64
+    }
+
+    @classmethod
+    def pack(cls, litix_list):
+        """The state of many litix as arrays, one entry per litix. Memories
+        and tracks have a different length per litix, so they are stored one
+        after the other with their lengths.
+        """
+        state = {
+            field: np.array(
+                [getattr(litix, field) for litix in litix_list],
+                dtype = dtype
+            )
+            for field, dtype in cls.state_fields.items()
+        }
 
-    @direction_change_prob.setter
-    def direction_change_prob(self, value):
-        assert isinstance(value, float) or value is None, \
-            f"<ERROR> `direction_angle_window` must be a float, not {type(value)}"
+        state["center_coordinates"] = np.array(
+            [litix.center_coordinates for litix in litix_list],
+            dtype = np.int64
+        ).reshape(-1, 2)
+        state["cell_colors"] = np.array(
+            [litix.cell_colors for litix in litix_list],
+            dtype = "U7"
+        ).reshape(-1, 10)
+
+        # Tracks, (x0, y0, x1, y1) and the color of every segment:
+        state["n_tracks"] = np.array(
+            [len(litix.tracks) for litix in litix_list],
+            dtype = np.int64
+        )
+        tracks = [track for litix in litix_list for track in litix.tracks]
+        state["tracks"] = np.array(
+            [origin + destination for origin, destination, color in tracks],
+            dtype = np.int64
+        ).reshape(-1, 4)
+        state["track_colors"] = np.array(
+            [color for origin, destination, color in tracks],
+            dtype = "U7"
+        )
 
-        if value is None:
-            self._direction_change_prob = np.random.uniform(0.4, 0.61)
-        else:
-            if value < 0.10:
-                self._direction_change_prob = 0.10
-            elif value > 0.90:
-                self._direction_change_prob = 0.90
-            else:
-                self._direction_change_prob = value
+        # Memories, the whole ring of each litix, `max_memory_size` rows:
+        state["memory"] = {
+            "head": np.array(
+                [litix.memory.head for litix in litix_list],
+                dtype = np.int64
+            ),
+            "count": np.array(
+                [litix.memory.count for litix in litix_list],
+                dtype = np.int64
+            )
+        }
+        for field, dtype in cls.memory_fields.items():
+            state["memory"][field] = np.concatenate(
+                [litix.memory.columns[field] for litix in litix_list]
+                + [np.zeros(0, dtype = dtype)]
+            )
+
+        # Rewards, one tracker for all of them:
+        state["reward"] = dict()
+        for field in ["last_energy", "short_term_reward", "long_term_reward"]:
+            state["reward"][field] = np.array(
+                [getattr(litix.reward, field)[0] for litix in litix_list],
+                dtype = np.float64
+            )
+        state["reward"]["short_term_rewards"] = np.array(
+            [litix.reward.short_term_rewards[0] for litix in litix_list],
+            dtype = np.float64
+        ).reshape(-1, RewardTracker.window)
+
+        return state
 
 # ---------------------------------------------------------------------------- #
-    @property
-    def direction_angle_window(self):
-        return self._direction_angle_window
+    @classmethod
+    def unpack(cls, planet, state):
+        """The litix packed by `pack`, living in `planet`. No random numbers
+        are drawn.
+        """
+        litix_list = list()
+        tracks = list(zip(state["tracks"].tolist(), state["track_colors"].tolist()))
+        memory_start = 0
+        track_start = 0
 
-    @direction_angle_window.setter
-    def direction_angle_window(self, value):
-        assert isinstance(value, int) or value is None, \
-            f"<ERROR> `direction_angle_window` must be an integer, not {type(value)}"
+        for i in range(state["id"].shape[0]):
+            litix = cls.__new__(cls)
+            litix.planet = planet
+            litix.feeling = None
 
-        if value is None:
-            self._direction_angle_window = np.random.randint(30, 90)
-        else:
-            if value < 30:
-                self._direction_angle_window = 30
-            elif value > 90:
-                self._direction_angle_window = 90
-            else:
-                self._direction_angle_window = value
+            for field in cls.state_fields:
+                setattr(litix, field, state[field][i].item())
+
+            litix.center_coordinates = tuple(
+                state["center_coordinates"][i].tolist()
+            )
+            litix.cell_colors = state["cell_colors"][i].tolist()
+
+            # The default palette stays shared:
+            if litix.cell_colors == cls.default_cell_colors:
+                litix.cell_colors = cls.default_cell_colors
+
+            n_tracks = int(state["n_tracks"][i])
+            litix.tracks = [
+                (tuple(track[:2]), tuple(track[2:]), color)
+                for track, color in tracks[track_start:track_start + n_tracks]
+            ]
+            track_start += n_tracks
+
+            litix.memory = RingMemory(litix.max_memory_size, cls.memory_fields)
+            memory_end = memory_start + litix.max_memory_size
+            for field in cls.memory_fields:
+                litix.memory.columns[field][:] = \
+                    state["memory"][field][memory_start:memory_end]
+            litix.memory.head = int(state["memory"]["head"][i])
+            litix.memory.count = int(state["memory"]["count"][i])
+            memory_start = memory_end
+
+            litix.reward = RewardTracker()
+            litix.reward.set_state(
+                {
+                    field: values[i:i + 1]
+                    for field, values in state["reward"].items()
+                }
+            )
+
+            litix_list.append(litix)
+
+        return litix_list
 
 # ---------------------------------------------------------------------------- #
-    @property
-    def direction_angle(self):
-        return self._direction_angle
+class LitixSwarm(ColumnStore):
+    """A whole Litix colony stored as NumPy arrays, one entry per cell. Every
+    tick moves, clamps, feeds, pays the metabolic cost and picks the palette
+    color of all cells at once, following the same rules of `Litix`.
+
+    Cells live in growable buffers (see `ColumnStore`), so the spores of a
+    population boom are appended in one vectorized step at amortized O(1)
+    per cell.
+    """
+    # A pallete with ten RGB colors to indicate the cell energy content:
+    cell_colors = Litix.default_cell_colors
+
+    # Every per cell array, kept aligned by `_compact`:
+    columns = {
+        "ids": (np.int64, ()),
+        "age": (np.int64, ()),
+        "cell_size": (np.int64, ()),
+        "cell_speed": (np.float64, ()),
+        "max_energy_content": (np.int64, ()),
+        "energy_content": (np.float64, ()),
+        "metabolic_cost": (np.int64, ()),
+        "sense_range": (np.int64, ()),
+        "direction_angle": (np.int64, ()),
+        "direction_angle_window": (np.int64, ()),
+        "direction_change_prob": (np.float64, ()),
+        "position": (np.float64, (2,)),
+        "color_index": (np.int64, ()),
+        "tracks": (np.float64, (11, 2))
+    }
+
+    max_age = Litix.max_age
+    spore_age = Litix.spore_age
+    spore_count = Litix.spore_count
+    spore_energy = Litix.spore_energy
 
-    @direction_angle.setter
-    def direction_angle(self, value):
-        assert isinstance(value, int) or value is None, \
-            f"<ERROR> `direction_angle` must be an integer, not {type(value)}"
+    def __init__(
+        self,
+        rng: RandomService = None
+    ):
+        super().__init__()
 
-        if value is None:
-            self._direction_angle = np.random.randint(0, 360)
-        else:
-            self._direction_angle = value
+        self.rng = shared if rng is None else rng
+        self.next_id = 0                            # ids are never reused
+        self.reward = RewardTracker(0)
+        self.feeling = None                         # (in_touch, in_range)
 
 # ---------------------------------------------------------------------------- #
-    @property
-    def center_coordinates(self):
-        return self._center_coordinates
-
-    @center_coordinates.setter
-    def center_coordinates(self, value):
-        assert isinstance(value, tuple) or value is None, \
-            f"<ERROR> `center_coordinates` must be an integer, not {type(value)}"
-
-        if value is None:
-            self._center_coordinates = (
-                np.random.randint(5, 995),
-                np.random.randint(5, 700)
-            )
-        else:
-            self._center_coordinates = value
+    def _add(self, newborn, n_litix):
+        self._append(newborn, n_litix)
+        self.reward.extend(n_litix)
+        self.next_id += n_litix
 
 # ---------------------------------------------------------------------------- #
-    @property
-    def sense_range(self):
-        return self._sense_range
+    def spawn(self, n_litix, traits = None):
+        """Append `n_litix` newborn cells with the same random defaults of
+        `Litix`. `traits` fixes some of them for every cell, with the same
+        names and limits of the `Litix` arguments, e.g. {"sense_range": 50}.
+        `max_memory_size` is ignored, the swarm only keeps rewards.
+        """
+        if n_litix <= 0:
+            return
 
-    @sense_range.setter
-    def sense_range(self, value):
-        assert isinstance(value, int) or value is None, \
-            f"<ERROR> `sense_range` must be a tuple of integers, not {type(value)}"
+        traits = dict() if traits is None else traits
 
-        if value is None:
-            self._sense_range = 2 * self.cell_size
-        else:
-            self._sense_range = value
+        def trait(name, default):
+            if name not in traits:
+                return default
+
+            return np.full(n_litix, traits[name])
+
+        cell_size = self.rng.choice([14, 16, 18, 20], n_litix)
+        if "cell_size" in traits:
+            cell_size = np.full(n_litix, traits["cell_size"] + traits["cell_size"] % 2)
+
+        position = np.column_stack(
+            [
+                self.rng.integers(5, 995, n_litix),
+                self.rng.integers(5, 700, n_litix)
+            ]
+        ).astype(np.float64)
+        max_energy_content = trait("max_energy_content", cell_size ** 2)
+
+        self._add(
+            {
+                "ids": np.arange(self.next_id, self.next_id + n_litix),
+                "age": 0,
+                "cell_size": cell_size,
+                "cell_speed": trait("cell_speed", 1.3 * cell_size),
+                "max_energy_content": max_energy_content,
+                "energy_content": max_energy_content,
+                "metabolic_cost": np.maximum(
+                    trait("metabolic_cost", cell_size // 100),
+                    1
+                ),
+                "sense_range": trait("sense_range", 2 * cell_size),
+                "direction_angle": self.rng.integers(0, 360, n_litix),
+                "direction_angle_window": np.clip(
+                    trait(
+                        "direction_angle_window",
+                        self.rng.integers(30, 90, n_litix)
+                    ),
+                    30,
+                    90
+                ),
+                "direction_change_prob": np.clip(
+                    trait(
+                        "direction_change_prob",
+                        self.rng.uniform(0.4, 0.61, n_litix)
+                    ),
+                    0.10,
+                    0.90
+                ),
+                "position": position,
+                "color_index": 0,
+                "tracks": position[:, np.newaxis, :]
+            },
+            n_litix
+        )
 
 # ---------------------------------------------------------------------------- #
-    @property
-    def metabolic_cost(self):
-        return self._metabolic_cost
-
-    @metabolic_cost.setter
-    def metabolic_cost(self, value):
-        assert isinstance(value, int) or value is None, \
-            f"<ERROR> `metabolic_cost` must be an integer, not {type(value)}"
-
-        if value is None:
-            self._metabolic_cost = (
-                int(self.cell_size / 100)
-                if int(self.cell_size / 100) >= 1
-                else 1
-            )
-        else:
-            self._metabolic_cost = (
-                value
-                if value >= 1
-                else 1
-            )
+    def _sporulate(self):
+        """Cells old enough and well fed turn into `spore_count` new cells
+        each, all appended at once. Spores share the energy of their parent
+        and inherit its size and movement parameters. Returns how many were
+        born.
+        """
+        ready = (self.age >= self.spore_age) \
+            & (self.energy_content >= self.spore_energy * self.max_energy_content)
+
+        if not ready.any():
+            return 0
+
+        parent = np.repeat(np.flatnonzero(ready), self.spore_count)
+        n_spores = len(parent)
+        position = self.position[parent]
+
+        spores = {
+            "ids": np.arange(self.next_id, self.next_id + n_spores),
+            "age": 0,
+            "energy_content": np.floor(
+                self.energy_content[parent] / self.spore_count
+            ),
+            "direction_angle": self.rng.integers(0, 360, n_spores),
+            "position": position,
+            "color_index": 0,
+            "tracks": position[:, np.newaxis, :]
+        }
+        for field in [
+            "cell_size", "cell_speed", "max_energy_content", "metabolic_cost",
+            "sense_range", "direction_angle_window", "direction_change_prob"
+        ]:
+            spores[field] = getattr(self, field)[parent]
+
+        # Parents turn into their spores:
+        self._compact(~ready)
+        self._add(spores, n_spores)
+        self._update_current_color()
+
+        return n_spores
 
 # ---------------------------------------------------------------------------- #
-    @property
-    def max_energy_content(self):
-        return self._max_energy_content
+    def _compact(self, keep):
+        super()._compact(keep)
+        self.reward.compact(keep)
+
+# ---------------------------------------------------------------------------- #
+    def remove(self, index):
+        """Drop the cells at `index` right away, e.g. eaten by a predator.
+        Returns the energy they had.
+        """
+        energy = self.energy_content[index].copy()
 
-    @max_energy_content.setter
-    def max_energy_content(self, value):
-        assert isinstance(value, int) or value is None, \
-            f"<ERROR> `max_energy_content` must be an integer, not {type(value)}"
+        keep = np.ones(len(self), dtype = bool)
+        keep[index] = False
+        self._compact(keep)
 
-        if value is None:
-            self._max_energy_content = self.cell_size ** 2
-        else:
-            self._max_energy_content = value
+        return energy
 
 # ---------------------------------------------------------------------------- #
-    @property
-    def max_memory_size(self):
-        return self._max_memory_size
+    def get_state(self):
+        state = {field: getattr(self, field) for field in self.columns}
+        state["next_id"] = self.next_id
+        state["reward"] = self.reward.get_state()
 
-    @max_memory_size.setter
-    def max_memory_size(self, value):
-        assert isinstance(value, int) or value is None, \
-            f"<ERROR> `max_memory_size` must be an integer, not {type(value)}"
+        return state
 
-        if value is None:
-            self._max_memory_size = 100
-        else:
-            self._max_memory_size = value
+# ---------------------------------------------------------------------------- #
+    def set_state(self, state):
+        self._resize(len(state["ids"]))
+
+        for field in self.columns:
+            setattr(self, field, state[field])
+
+        self.next_id = state["next_id"]
+        self.reward.set_state(state["reward"])
 
 # ---------------------------------------------------------------------------- #
-    @property
-    def cell_colors(self):
-        return self._cell_colors
-
-    @cell_colors.setter
-    def cell_colors(self, value):
-        assert isinstance(value, list) or value is None, \
-            f"<ERROR> `cell_colors` must be a list, not {type(value)}"
-
-        if value is None:
-            self._cell_colors = [
-                "#ff8b15", "#fe9831", "#fda547", "#fcb15d", "#fbbc72",
-                "#fac788", "#fad29e", "#f9dcb4", "#f8e5cb", "#f7efe3"
-            ]
-        else:
-            self._cell_colors = value
+    def body_coords(self):
+        """Circle bounding boxes (x0, y0, x1, y1) of every cell body."""
+        half_size = (self.cell_size / 2)[:, np.newaxis]
+
+        return np.hstack([self.position - half_size, self.position + half_size])
 
 # ---------------------------------------------------------------------------- #
-    @property
-    def cell_speed(self):
-        return self._cell_speed
+    def sense_coords(self):
+        """Circle bounding boxes (x0, y0, x1, y1) of every cell sense range."""
+        sense_range = self.sense_range[:, np.newaxis]
 
-    @cell_speed.setter
-    def cell_speed(self, value):
-        assert isinstance(value, int) or value is None, \
-            f"<ERROR> `cell_speed` must be an integer, not {type(value)}"
+        return np.hstack([self.position - sense_range, self.position + sense_range])
 
-        if value is None:
-            self._cell_speed = 1.3 * self.cell_size
-        else:
-            self._cell_speed = value
+# ---------------------------------------------------------------------------- #
+    def current_colors(self):
+        return [self.cell_colors[index] for index in self.color_index]
 
 # ---------------------------------------------------------------------------- #
-    @property
-    def cell_size(self):
-        return self._cell_size
+    def total_energy(self):
+        return float(self.energy_content.sum())
 
-    @cell_size.setter
-    def cell_size(self, value):
-        assert isinstance(value, int) or value is None, \
-            f"<ERROR> `cell_size` must be an integer, not {type(value)}"
+# ---------------------------------------------------------------------------- #
+    def _update_position(self, width, height):
+        move(
+            self.position,
+            self.cell_speed,
+            self.direction_angle,
+            width,
+            height,
+            tracks = self.tracks
+        )
 
-        if value is None:
-            self._cell_size = np.random.choice([14, 16, 18, 20])
-        else:
-            self._cell_size = value if value % 2 == 0 else value + 1
+# ---------------------------------------------------------------------------- #
+    def _update_feeling(self, planet):
+        """Count what every cell touches and what it senses, the `in_touch`
+        and `in_range` events of `Litix`: scux, the other cells, by their
+        body and by their sense ring like the canvas items they were, and
+        vohix.
+        """
+        body = self.body_coords()
+        sense = self.sense_coords()
+        vohix = planet.vohix_pack.body_coords()
+
+        in_touch = _join_counts(
+            planet.count_scux_in_all(body),
+            count_boxes(body, body, exclude_self = True)
+            + count_boxes(body, sense, exclude_self = True),
+            count_boxes(body, vohix)
+        )
+
+        in_range = _join_counts(
+            planet.count_scux_in_all(sense, enclosed = True),
+            count_boxes(sense, body, enclosed = True, exclude_self = True)
+            + count_boxes(sense, sense, enclosed = True, exclude_self = True),
+            count_boxes(sense, vohix, enclosed = True)
+        )
+
+        self.feeling = (in_touch, in_range)
+
+# ---------------------------------------------------------------------------- #
+    def _update_energy_content(self, planet):
+        # 1. First, let's feed the colony, cell by cell, so the first cell
+        # touching a scux is the one that eats it:
+        self.energy_content = np.minimum(
+            self.energy_content + planet.eat_scux_in_all(self.body_coords()),
+            self.max_energy_content
+        )
+
+        # 2. Now, let's discount the metabolic cost
+        self.energy_content -= self.metabolic_cost
+
+# ---------------------------------------------------------------------------- #
+    def _update_current_color(self):
+        energy_proportion = self.energy_content / self.max_energy_content
+
+        self.color_index = np.minimum(
+            10 - np.ceil(energy_proportion * 10).astype(np.int64),
+            9
+        )
 
 # ---------------------------------------------------------------------------- #
+    def _update_direction_angle(self):
+        """Same policy of `Litix`: cells with more than ten ticks of memory
+        add their long term reward to `direction_change_prob` and either turn
+        with a wider window or keep going with a narrower one. Younger cells
+        always turn.
+        """
+        experienced = self.age > 10
+
+        self.direction_change_prob = np.where(
+            experienced,
+            np.clip(
+                self.direction_change_prob + self.reward.long_term_reward,
+                0.10,
+                0.90
+            ),
+            self.direction_change_prob
+        )
+
+        turn = ~experienced | (
+            self.rng.random(len(self)) >= self.direction_change_prob
+        )
+
+        self.direction_angle_window = np.where(
+            experienced,
+            np.clip(
+                self.direction_angle_window + np.where(turn, 1, -1),
+                30,
+                90
+            ),
+            self.direction_angle_window
+        )
+
+        self.direction_angle = np.where(
+            turn,
+            self.rng.integers(
+                self.direction_angle - self.direction_angle_window,
+                self.direction_angle + self.direction_angle_window
+            ),
+            self.direction_angle
+        )
+
+# ---------------------------------------------------------------------------- #
+    def _log_events(self, planet):
+        if planet.telemetry is None:
+            return
+
+        planet.telemetry.write_many(
+            self.ids,
+            {
+                "age": self.age,
+                "color": self.current_colors(),
+                "energy": self.energy_content / self.max_energy_content,
+                "position_x": self.position[:, 0],
+                "position_y": self.position[:, 1],
+                "direction": self.direction_angle,
+                "in_touch": self.feeling[0],
+                "in_range": self.feeling[1],
+                "status": np.where(
+                    (self.energy_content > 0) & (self.age < self.max_age),
+                    "alive",
+                    "dead"
+                ),
+                "short_term_reward": self.reward.short_term_reward,
+                "long_term_reward": self.reward.long_term_reward
+            }
+        )
+
+# ---------------------------------------------------------------------------- #
+    def update_age(self, planet):
+        """Step every cell of the colony by one tick, drop the dead ones and
+        split the ripe ones into spores. Returns how many were born and how
+        many died.
+        """
+        if len(self) == 0:
+            return 0, 0
+
+        profiler = planet.profiler
+
+        self.age += 1
+        self._update_position(planet.width, planet.height)
+        if profiler is not None:
+            profiler.lap("litix.position")
+
+        # Feelings are only logged, they are not counted without telemetry:
+        if planet.telemetry is not None:
+            self._update_feeling(planet)
+            if profiler is not None:
+                profiler.lap("litix.feeling")
+
+        self._update_energy_content(planet)
+        self._update_current_color()
+        self.reward.update(self.energy_content / self.max_energy_content)
+        if profiler is not None:
+            profiler.lap("litix.energy")
+
+        self._log_events(planet)
+        if profiler is not None:
+            profiler.lap("litix.logging")
+
+        keep = (self.energy_content > 0) & (self.age < self.max_age)
+        died = len(self) - int(np.count_nonzero(keep))
+        self._compact(keep)
+        self._update_direction_angle()
+        if profiler is not None:
+            profiler.lap("litix.direction")
+
+        born = self._sporulate()
+        if profiler is not None:
+            profiler.lap("litix.spores")
+
+        return born, died
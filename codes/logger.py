@@ -0,0 +1,225 @@
+import atexit
+import csv
+import os
+import queue
+import threading
+
+
+class LogWriter:
+    """An append-only log sink. Records are buffered in memory and handed in
+    batches to a background thread that appends them to `path`, so the
+    simulation loop never blocks on file I/O and never rewrites the history.
+
+    Records are written as CSV (the default), or as Parquet or Arrow IPC
+    when `pyarrow` is installed. Pending records are flushed by `close`, which
+    also runs at interpreter exit.
+    """
+    formats = ["csv", "parquet", "arrow"]
+
+    def __init__(
+        self,
+        path: str,
+        format: str = "csv",
+        batch_size: int = 100,
+        decimal: str = ","
+    ):
+        """Instantiate a writer. The file at `path` is truncated by the first
+        batch, so every run starts a new log.
+
+        Args:
+            path (str): Where the log is written.
+
+            format (str): One of "csv", "parquet" or "arrow". Defaults to
+                "csv".
+
+            batch_size (int): How many records are buffered before a batch is
+                handed to the writer thread. Defaults to 100.
+
+            decimal (str): The decimal separator of floats in CSV logs.
+                Defaults to ",".
+
+        """
+        assert format in self.formats, \
+            f"<ERROR> `format` must be one of {self.formats}, not {format}"
+
+        if format != "csv":
+            try:
+                import pyarrow
+            except ImportError:
+                raise ImportError(
+                    f"<ERROR> `{format}` logs need pyarrow: pip install pyarrow"
+                )
+
+        self.path = path
+        self.format = format
+        self.batch_size = batch_size
+        self.decimal = decimal
+
+        self.buffer = list()
+        self.columns = None
+        self.error = None
+        self.closed = False
+
+        self.batches = queue.Queue()
+        self.thread = threading.Thread(target = self._run, daemon = True)
+        self.thread.start()
+
+        atexit.register(self.close)
+
+# ---------------------------------------------------------------------------- #
+    def __enter__(self):
+        return self
+
+# ---------------------------------------------------------------------------- #
+    def __exit__(self, *args):
+        self.close()
+
+# ---------------------------------------------------------------------------- #
+    def write(self, record: dict):
+        """Buffer `record`. Every record must have the keys of the first one."""
+        assert not self.closed, "<ERROR> this LogWriter is closed"
+        self._raise_error()
+
+        if self.columns is None:
+            self.columns = list(record)
+
+        self.buffer.append(record)
+
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+# ---------------------------------------------------------------------------- #
+    def flush(self):
+        """Hand the buffered records to the writer thread."""
+        if len(self.buffer) > 0:
+            self.batches.put(self.buffer)
+            self.buffer = list()
+
+# ---------------------------------------------------------------------------- #
+    def close(self):
+        """Flush the buffered records and wait until they are on disk."""
+        if self.closed:
+            return
+
+        self.flush()
+        self.batches.put(None)
+        self.thread.join()
+        self.closed = True
+
+        atexit.unregister(self.close)
+        self._raise_error()
+
+# ---------------------------------------------------------------------------- #
+    def _raise_error(self):
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+# ---------------------------------------------------------------------------- #
+    def _run(self):
+        sink = None
+
+        while True:
+            batch = self.batches.get()
+
+            if batch is None:
+                break
+
+            if self.error is not None:
+                continue
+
+            try:
+                if sink is None:
+                    sink = self._open()
+
+                self._write_batch(sink, batch)
+            except Exception as error:
+                self.error = error
+
+        if sink is not None:
+            sink.close()
+
+# ---------------------------------------------------------------------------- #
+    def _open(self):
+        directory = os.path.dirname(self.path)
+
+        if directory:
+            os.makedirs(directory, exist_ok = True)
+
+        if self.format == "csv":
+            sink = open(self.path, "w", newline = "")
+            csv.writer(sink).writerow(self.columns)
+            return sink
+
+        return _ArrowSink(self.path, self.format)
+
+# ---------------------------------------------------------------------------- #
+    def _format(self, value):
+        if isinstance(value, float):
+            return repr(float(value)).replace(".", self.decimal)
+
+        return value
+
+# ---------------------------------------------------------------------------- #
+    def _write_batch(self, sink, batch):
+        if self.format == "csv":
+            csv.writer(sink).writerows(
+                [
+                    [self._format(record[column]) for column in self.columns]
+                    for record in batch
+                ]
+            )
+            sink.flush()
+        else:
+            sink.write(
+                {
+                    column: [record[column] for record in batch]
+                    for column in self.columns
+                }
+            )
+
+# ---------------------------------------------------------------------------- #
+class _ArrowSink:
+    """Appends record batches to a Parquet or an Arrow IPC file."""
+    def __init__(self, path, format):
+        self.path = path
+        self.format = format
+        self.writer = None
+        self.schema = None
+
+    def write(self, columns):
+        import pyarrow as pa
+
+        table = pa.table(columns)
+
+        if self.writer is None:
+            self.schema = table.schema
+
+            if self.format == "parquet":
+                import pyarrow.parquet as pq
+                self.writer = pq.ParquetWriter(self.path, self.schema)
+            else:
+                self.writer = pa.ipc.new_file(self.path, self.schema)
+
+        self.writer.write_table(table.cast(self.schema))
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+# ---------------------------------------------------------------------------- #
+class MemoryLog:
+    """A log sink that keeps the records in a list, for runs that hand their
+    log to someone else instead of writing it to disk.
+    """
+    def __init__(self):
+        self.records = list()
+
+    def write(self, record: dict):
+        self.records.append(record)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
@@ -0,0 +1,99 @@
+import numpy as np
+
+
+class RingMemory:
+    """A preallocated, typed ring buffer with one column per event field. It
+    keeps the last `size` events and appends in O(1), so the memory use and
+    the time per append stay flat no matter how long the run is.
+
+    Every event is stored once, at `head`, so reading the events in order
+    wraps around the end of the columns and returns copies.
+    """
+    __slots__ = ("size", "fields", "columns", "head", "count")
+
+    def __init__(
+        self,
+        size: int,
+        fields: dict
+    ):
+        """Instantiate an empty memory.
+
+        Args:
+            size (int): How many events the memory keeps.
+
+            fields (dict): Maps each event field name to its NumPy dtype, e.g.
+                {"age": np.int64, "color": np.uint8}.
+
+        """
+        assert isinstance(size, int) and size > 0, \
+            f"<ERROR> `size` must be a positive integer, not {size}"
+
+        self.size = size
+        self.fields = fields
+        self.columns = {
+            field: np.zeros(size, dtype = dtype)
+            for field, dtype in fields.items()
+        }
+
+        self.head = 0           # Where the next event will be written
+        self.count = 0          # How many events are stored
+
+# ---------------------------------------------------------------------------- #
+    def __len__(self):
+        return self.count
+
+# ---------------------------------------------------------------------------- #
+    def __getitem__(self, field):
+        """Every stored value of `field`, the oldest first."""
+        return self.columns[field][self._order(self.count)]
+
+# ---------------------------------------------------------------------------- #
+    def _order(self, n):
+        # Indexes of the last `n` events in the columns, the oldest first:
+        return np.arange(self.head - n, self.head) % self.size
+
+# ---------------------------------------------------------------------------- #
+    def append(self, event: dict):
+        """Store `event`, a dict with one value per field, dropping the oldest
+        event if the memory is full.
+        """
+        for field, column in self.columns.items():
+            column[self.head] = event[field]
+
+        self.head = (self.head + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+# ---------------------------------------------------------------------------- #
+    def newest(self, field):
+        """The value of `field` in the last event, without copying."""
+        assert self.count > 0, "<ERROR> the memory is empty"
+
+        return self.columns[field][self.head - 1]
+
+# ---------------------------------------------------------------------------- #
+    def last(self, n: int = None):
+        """Copies of the last `n` events (all of them if None), one array per
+        field, the oldest first.
+        """
+        order = self._order(self.count if n is None else min(n, self.count))
+
+        return {field: column[order] for field, column in self.columns.items()}
+
+# ---------------------------------------------------------------------------- #
+    def to_frame(self, labels: dict = None):
+        """Copy the stored events into a pandas DataFrame.
+
+        Args:
+            labels (dict): Fields stored as codes, mapped to the values the
+                codes stand for, e.g. {"color": palette} turns every color
+                index into its color. Defaults to None, the stored values.
+
+        """
+        import pandas as pd
+
+        events = self.last()
+
+        for field, values in (labels or dict()).items():
+            events[field] = np.asarray(values)[events[field].astype(np.int64)]
+
+        return pd.DataFrame(events)
@@ -0,0 +1,134 @@
+from time import perf_counter
+
+
+class Profiler:
+    """Times the phases of `Brorix84.update_calendar` and counts the
+    creatures born and dead, from inside the run.
+
+    Phases are laps of a single clock: every `lap(phase)` charges the time
+    since the previous lap to `phase`, so phases never overlap and add up to
+    the time spent in `update_calendar`. Nested phases, like the steps of
+    every Litix inside the "litix" phase, are simply laps of their own.
+
+    A planet without a profiler skips every hook, so profiling costs nothing
+    unless it is enabled.
+    """
+    def __init__(
+        self,
+        summary_every: int = None,
+        output = print
+    ):
+        """Instantiate a profiler. Pass it to `Brorix84(profiler = ...)`.
+
+        Args:
+            summary_every (int): Call `output` with a `summary` of the last
+                `summary_every` days. Defaults to None, no periodic summary.
+
+            output (callable): Where the periodic summary goes. Defaults to
+                `print`.
+
+        """
+        assert summary_every is None or summary_every >= 1, \
+            f"<ERROR> `summary_every` must be positive, not {summary_every}"
+
+        self.summary_every = summary_every
+        self.output = output
+
+        self.days = 0
+        self.seconds = dict()       # phase -> seconds
+        self.calls = dict()         # phase -> laps
+        self.counters = dict()      # counter -> count
+
+        self.last = perf_counter()
+        self.window = self._snapshot()
+
+# ---------------------------------------------------------------------------- #
+    def start(self):
+        """Start the clock, the time before it is not charged to any phase."""
+        self.last = perf_counter()
+
+# ---------------------------------------------------------------------------- #
+    def lap(self, phase):
+        """Charge the time since the last lap to `phase`."""
+        now = perf_counter()
+
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + now - self.last
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        self.last = now
+
+# ---------------------------------------------------------------------------- #
+    def count(self, counter, n = 1):
+        self.counters[counter] = self.counters.get(counter, 0) + n
+
+# ---------------------------------------------------------------------------- #
+    def end_day(self):
+        """Called by the planet at the end of every day."""
+        self.days += 1
+
+        if self.summary_every is not None and self.days % self.summary_every == 0:
+            self.output(self.summary())
+
+# ---------------------------------------------------------------------------- #
+    def _snapshot(self):
+        return {
+            "days": self.days,
+            "seconds": dict(self.seconds),
+            "calls": dict(self.calls),
+            "counters": dict(self.counters)
+        }
+
+# ---------------------------------------------------------------------------- #
+    def metrics(self, since = None):
+        """Everything measured so far, or since the `since` snapshot.
+
+        Returns:
+            dict: {"days": ..., "seconds": {phase: ...}, "calls": {phase: ...},
+                "counters": {counter: ...}, "ms_per_day": {phase: ...}}
+        """
+        if since is None:
+            since = {"days": 0, "seconds": {}, "calls": {}, "counters": {}}
+
+        days = self.days - since["days"]
+        metrics = {"days": days}
+
+        for key in ["seconds", "calls", "counters"]:
+            metrics[key] = {
+                name: value - since[key].get(name, 0)
+                for name, value in getattr(self, key).items()
+            }
+
+        metrics["ms_per_day"] = {
+            phase: 1000 * seconds / days if days > 0 else 0.0
+            for phase, seconds in metrics["seconds"].items()
+        }
+
+        return metrics
+
+# ---------------------------------------------------------------------------- #
+    def summary(self):
+        """A table of the days since the previous summary (or the start)."""
+        metrics = self.metrics(since = self.window)
+        self.window = self._snapshot()
+
+        total = sum(metrics["seconds"].values())
+        lines = [
+            f"days {self.days - metrics['days']}-{self.days}: "
+            f"{1000 * total / max(metrics['days'], 1):.3f} ms/day"
+        ]
+
+        for phase, seconds in sorted(
+            metrics["seconds"].items(),
+            key = lambda item: -item[1]
+        ):
+            lines.append(
+                f"  {phase:<20}{metrics['ms_per_day'][phase]:10.3f} ms/day"
+                f"{100 * seconds / total if total > 0 else 0:7.1f}%"
+            )
+
+        if metrics["counters"]:
+            lines.append("  " + ", ".join(
+                f"{counter} {count}"
+                for counter, count in sorted(metrics["counters"].items())
+            ))
+
+        return "\n".join(lines)
@@ -0,0 +1,114 @@
+import numpy as np
+
+
+class RandomService:
+    """The random numbers of a world. It wraps a `np.random.Generator` seeded
+    once, so a whole run can be reproduced from a single seed, and pre-draws
+    uniform numbers in large blocks, so the many small draws made per creature
+    and per tick don't pay the Generator call overhead one by one.
+
+    Every draw also accepts a `size`, to hand out vectorized draws for whole
+    populations at once.
+    """
+    def __init__(
+        self,
+        seed: int = None,
+        block_size: int = 4096
+    ):
+        """Instantiate a service.
+
+        Args:
+            seed (int): The world seed. Defaults to None, a random seed.
+
+            block_size (int): How many uniform numbers are pre-drawn at once.
+                Defaults to 4096.
+
+        """
+        self.seed = seed
+        self.block_size = block_size
+        self.generator = np.random.default_rng(seed)
+
+        self.block = np.zeros(0)
+        self.position = 0
+
+# ---------------------------------------------------------------------------- #
+    def _take(self, n):
+        # Large draws don't fit a block, they go straight to the Generator:
+        if n > self.block_size:
+            return self.generator.random(n)
+
+        if self.position + n > self.block.shape[0]:
+            self.block = self.generator.random(self.block_size)
+            self.position = 0
+
+        values = self.block[self.position:self.position + n]
+        self.position += n
+
+        return values
+
+# ---------------------------------------------------------------------------- #
+    def random(self, size = None):
+        """Uniform floats in [0, 1)."""
+        if size is None:
+            return float(self._take(1)[0])
+
+        return self._take(int(np.prod(size))).reshape(size)
+
+# ---------------------------------------------------------------------------- #
+    def uniform(self, low, high, size = None):
+        """Uniform floats in [low, high)."""
+        if size is None:
+            size = np.broadcast(low, high).shape or None
+
+        return low + self.random(size) * (high - low)
+
+# ---------------------------------------------------------------------------- #
+    def integers(self, low, high, size = None):
+        """Uniform integers in [low, high). `low` and `high` may be arrays,
+        one draw per element.
+        """
+        if size is None:
+            size = np.broadcast(low, high).shape or None
+
+        values = np.minimum(
+            np.floor(low + self.random(size) * (np.subtract(high, low))),
+            np.subtract(high, 1)
+        ).astype(np.int64)
+
+        return int(values) if size is None else values
+
+# ---------------------------------------------------------------------------- #
+    def choice(self, options, size = None):
+        """Uniform picks from `options`."""
+        index = self.integers(0, len(options), size)
+
+        if size is None:
+            return options[index]
+
+        return np.asarray(options)[index]
+
+# ---------------------------------------------------------------------------- #
+    def get_state(self):
+        """Everything needed to continue the same stream of numbers later:
+        the Generator state and the unused part of the current block.
+        """
+        return {
+            "seed": self.seed,
+            "block_size": self.block_size,
+            "generator": self.generator.bit_generator.state,
+            "block": self.block[self.position:].copy()
+        }
+
+# ---------------------------------------------------------------------------- #
+    def set_state(self, state):
+        """Continue the stream of numbers saved by `get_state`."""
+        self.seed = state["seed"]
+        self.block_size = state["block_size"]
+        self.generator.bit_generator.state = state["generator"]
+
+        self.block = np.array(state["block"], dtype = np.float64)
+        self.position = 0
+
+# ---------------------------------------------------------------------------- #
+# Used by creatures created outside of a world, which have no service of their own:
+shared = RandomService()
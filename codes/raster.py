@@ -0,0 +1,387 @@
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import os
+import struct
+import zlib
+
+import numpy as np
+
+
+def _rgb(color):
+    """"#rrggbb" to (r, g, b)."""
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+# ---------------------------------------------------------------------------- #
+def _rgb_array(colors):
+    return np.array([_rgb(color) for color in colors], dtype = np.uint8).reshape(-1, 3)
+
+# ---------------------------------------------------------------------------- #
+def scene(planet):
+    """Copy what a frame of `planet` shows into plain arrays: the background
+    color and, for every layer in drawing order, the shapes and their RGB
+    colors. A scene no longer depends on the planet, so it can be drawn by
+    another thread while the planet runs on.
+    """
+    layers = list()
+
+    # 1. Scux rectangles, or the squares of a scux field, colored by age:
+    if planet.engine == "field":
+        field = planet.scux_field
+        size = field.cell_size
+        cells = list(field.cells())
+        rows = np.array([cell[0] for cell in cells], dtype = np.float64)
+        columns = np.array([cell[1] for cell in cells], dtype = np.float64)
+
+        layers.append(
+            (
+                "rects",
+                np.column_stack(
+                    [columns, rows, columns + 1, rows + 1]
+                ).reshape(-1, 4) * size,
+                _rgb_array([field.colors[min(int(cell[3]), 9)] for cell in cells])
+            )
+        )
+    elif planet.engine == "vector":
+        pool = planet.scux_pool
+        layers.append(
+            (
+                "rects",
+                pool.coords[pool.alive],
+                _rgb_array(
+                    [pool.colors[age] for age in np.minimum(pool.age[pool.alive], 9)]
+                )
+            )
+        )
+    else:
+        alive = [scux for scux in planet.scux_list if scux.status == "alive"]
+        layers.append(
+            (
+                "rects",
+                np.array([scux.coords for scux in alive], dtype = np.float64),
+                _rgb_array([scux.current_color for scux in alive])
+            )
+        )
+
+    # 2. Litix bodies, sense rings and their last ten tracks:
+    if planet.engine != "object":
+        swarm = planet.litix_swarm
+        colors = _rgb_array(swarm.current_colors())
+
+        # Spores have no tracks on the tick they are born:
+        n_tracks = np.minimum(swarm.age, swarm.tracks.shape[1] - 1)
+        first = swarm.tracks.shape[1] - 1 - n_tracks
+        step = np.arange(swarm.tracks.shape[1] - 1)
+        drawn = step[np.newaxis, :] >= first[:, np.newaxis]
+
+        segments = np.concatenate(
+            [swarm.tracks[:, :-1], swarm.tracks[:, 1:]],
+            axis = 2
+        )[drawn]
+        track_colors = np.repeat(colors, n_tracks, axis = 0)
+
+        body_coords = swarm.body_coords()
+        sense_coords = swarm.sense_coords()
+    else:
+        colors = _rgb_array([litix.current_color for litix in planet.litix_list])
+        tracks = [track for litix in planet.litix_list for track in litix.tracks]
+
+        segments = np.array(
+            [origin + destination for origin, destination, color in tracks],
+            dtype = np.float64
+        ).reshape(-1, 4)
+        track_colors = _rgb_array([color for origin, destination, color in tracks])
+
+        body_coords = np.array(
+            [litix.body_coords for litix in planet.litix_list],
+            dtype = np.float64
+        ).reshape(-1, 4)
+        sense_coords = np.array(
+            [litix.sense_coords for litix in planet.litix_list],
+            dtype = np.float64
+        ).reshape(-1, 4)
+
+    layers.append(("discs", body_coords, colors))
+    layers.append(("rings", sense_coords, colors))
+    layers.append(("lines", segments, track_colors))
+
+    # 3. Vohix bodies:
+    pack = planet.vohix_pack
+    layers.append(
+        ("discs", pack.body_coords(), _rgb_array(pack.current_colors()))
+    )
+
+    return {
+        "width": planet.width,
+        "height": planet.height,
+        "background": _rgb(planet.current_color),
+        "layers": layers
+    }
+
+# ---------------------------------------------------------------------------- #
+def _stamp(frame, boxes, colors, shape, max_pixels = 1 << 22):
+    # Every box is broadcast to the largest box side, in chunks of at most
+    # `max_pixels` pixels, and masked by `shape`:
+    height, width = frame.shape[:2]
+
+    if len(boxes) == 0:
+        return
+
+    x0 = np.floor(boxes[:, 0]).astype(np.int64)
+    y0 = np.floor(boxes[:, 1]).astype(np.int64)
+    w = np.ceil(boxes[:, 2]).astype(np.int64) - x0 + 1
+    h = np.ceil(boxes[:, 3]).astype(np.int64) - y0 + 1
+
+    side = int(max(w.max(), h.max()))
+    chunk = max(max_pixels // (side * side), 1)
+    offset = np.arange(side)
+
+    for start in range(0, len(boxes), chunk):
+        part = slice(start, start + chunk)
+        dx = offset[np.newaxis, np.newaxis, :]
+        dy = offset[np.newaxis, :, np.newaxis]
+
+        x = x0[part, np.newaxis, np.newaxis] + dx
+        y = y0[part, np.newaxis, np.newaxis] + dy
+
+        inside = (dx < w[part, np.newaxis, np.newaxis]) \
+            & (dy < h[part, np.newaxis, np.newaxis]) \
+            & (x >= 0) & (x < width) & (y >= 0) & (y < height)
+
+        if shape != "rects":
+            box = boxes[part]
+            cx = ((box[:, 0] + box[:, 2]) / 2)[:, np.newaxis, np.newaxis]
+            cy = ((box[:, 1] + box[:, 3]) / 2)[:, np.newaxis, np.newaxis]
+            radius = ((box[:, 2] - box[:, 0]) / 2)[:, np.newaxis, np.newaxis]
+            distance = np.hypot(x - cx, y - cy)
+
+            if shape == "discs":
+                inside &= distance <= radius
+            else:
+                inside &= np.abs(distance - radius) <= 0.5
+
+        x, y = np.broadcast_arrays(x, y)
+        frame[y[inside], x[inside]] = colors[part][np.nonzero(inside)[0]]
+
+# ---------------------------------------------------------------------------- #
+def _lines(frame, segments, colors, max_pixels = 1 << 22):
+    height, width = frame.shape[:2]
+
+    if len(segments) == 0:
+        return
+
+    length = np.hypot(
+        segments[:, 2] - segments[:, 0],
+        segments[:, 3] - segments[:, 1]
+    )
+    samples = int(np.ceil(length.max())) + 1
+    t = np.linspace(0, 1, samples)[np.newaxis, :]
+    chunk = max(max_pixels // samples, 1)
+
+    for start in range(0, len(segments), chunk):
+        part = segments[start:start + chunk]
+
+        x = np.floor(part[:, 0:1] + t * (part[:, 2:3] - part[:, 0:1])).astype(np.int64)
+        y = np.floor(part[:, 1:2] + t * (part[:, 3:4] - part[:, 1:2])).astype(np.int64)
+        inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+
+        frame[y[inside], x[inside]] = colors[start:start + chunk][np.nonzero(inside)[0]]
+
+# ---------------------------------------------------------------------------- #
+def draw(scene):
+    """Draw a `scene` into a new (height, width, 3) uint8 RGB array."""
+    frame = np.empty((scene["height"], scene["width"], 3), dtype = np.uint8)
+    frame[:] = scene["background"]
+
+    for shape, coords, colors in scene["layers"]:
+        if shape == "lines":
+            _lines(frame, coords, colors)
+        else:
+            _stamp(frame, coords, colors, shape)
+
+    return frame
+
+# ---------------------------------------------------------------------------- #
+def encode_png(frame, level = 6):
+    """A (height, width, 3) uint8 frame as the bytes of an RGB PNG file."""
+    height, width = frame.shape[:2]
+
+    # Every row starts with its filter type, 0 is none:
+    rows = np.zeros((height, 1 + 3 * width), dtype = np.uint8)
+    rows[:, 1:] = frame.reshape(height, -1)
+
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data \
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xffffffff)
+
+    return b"\x89PNG\r\n\x1a\n" \
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)) \
+        + chunk(b"IDAT", zlib.compress(rows.tobytes(), level)) \
+        + chunk(b"IEND", b"")
+
+# ---------------------------------------------------------------------------- #
+def encode_ppm(frame):
+    """A (height, width, 3) uint8 frame as the bytes of a binary PPM file."""
+    height, width = frame.shape[:2]
+
+    return f"P6\n{width} {height}\n255\n".encode("ascii") + frame.tobytes()
+
+# ---------------------------------------------------------------------------- #
+def _render_batch(scenes, paths):
+    """Draw a batch of scenes and, if `paths` are given, write each frame to
+    its file. This is what every worker runs. Returns the frames that were not
+    written.
+    """
+    frames = [draw(scene) for scene in scenes]
+
+    if paths is None:
+        return frames
+
+    for frame, path in zip(frames, paths):
+        data = encode_png(frame) if path.endswith(".png") else encode_ppm(frame)
+
+        with open(path, "wb") as file:
+            file.write(data)
+
+    return list()
+
+# ---------------------------------------------------------------------------- #
+class RasterView:
+    """Records a Brorix84 planet without a display: every frame is drawn into
+    a NumPy RGB array (the seasonal background, scux, litix bodies, sense
+    rings and tracks, and vohix) and written to an image sequence or a video.
+
+    Like `TkView`, it is an observer, see `Brorix84.attach`. Every frame only
+    copies the planet state it shows; drawing and encoding run in batches on
+    a pool of worker threads (NumPy and zlib release the GIL), so the planet
+    keeps running meanwhile. Call `close` when the run is over.
+    """
+    formats = ["png", "ppm", "mp4"]
+
+    def __init__(
+        self,
+        path: str = "../data/frames/{frame:06d}.png",
+        render_every: int = 1,
+        batch_size: int = 16,
+        max_workers: int = None,
+        fps: int = 30
+    ):
+        """Instantiate a recorder.
+
+        Args:
+            path (str): Where frames are written. Image sequences (".png" or
+                ".ppm") need a `{frame}` field for the frame number, e.g.
+                "frames/{frame:06d}.png"; an ".mp4" path is a single video.
+                Defaults to "../data/frames/{frame:06d}.png".
+
+            render_every (int): Draw one frame every `render_every` days.
+                Defaults to 1, every day.
+
+            batch_size (int): How many frames every worker job draws.
+                Defaults to 16.
+
+            max_workers (int): The number of worker threads. Defaults to
+                None, one per core.
+
+            fps (int): The frame rate of videos. Defaults to 30.
+
+        """
+        format = path.rsplit(".", 1)[-1]
+
+        assert format in self.formats, \
+            f"<ERROR> `path` must end in one of {self.formats}, not {path}"
+        assert format == "mp4" or "{frame" in path, \
+            f"<ERROR> image sequences need a `{{frame}}` field in `path`, not {path}"
+        assert isinstance(render_every, int) and render_every >= 1, \
+            f"<ERROR> `render_every` must be a positive integer, not {render_every}"
+
+        self.video = None
+        if format == "mp4":
+            try:
+                import imageio
+            except ImportError:
+                raise ImportError(
+                    "<ERROR> `mp4` videos need imageio: "
+                    "pip install imageio imageio-ffmpeg"
+                )
+            self.video = imageio.get_writer(path, fps = fps)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok = True)
+
+        self.path = path
+        self.format = format
+        self.render_every = render_every
+        self.batch_size = batch_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        self.ticks = 0
+        self.frames = 0             # Frames handed to the workers
+        self.batch = list()
+        self.pending = deque()      # Batches being drawn, oldest first
+        self.executor = ThreadPoolExecutor(max_workers = self.max_workers)
+        self.closed = False
+
+# ---------------------------------------------------------------------------- #
+    def update(self, planet):
+        """Called by the planet at the end of every day. Records a frame
+        every `render_every` days.
+        """
+        if self.ticks % self.render_every == 0:
+            self.render(planet)
+
+        self.ticks += 1
+
+# ---------------------------------------------------------------------------- #
+    def render(self, planet):
+        """Record a frame of the current `planet` state."""
+        assert not self.closed, "<ERROR> the recorder is closed"
+
+        self.batch.append(scene(planet))
+
+        if len(self.batch) >= self.batch_size:
+            self._submit()
+
+# ---------------------------------------------------------------------------- #
+    def _submit(self):
+        if not self.batch:
+            return
+
+        paths = None
+        if self.video is None:
+            paths = [
+                self.path.format(frame = self.frames + i)
+                for i in range(len(self.batch))
+            ]
+
+        self.pending.append(self.executor.submit(_render_batch, self.batch, paths))
+        self.frames += len(self.batch)
+        self.batch = list()
+
+        # Don't let the planet run too far ahead of the workers:
+        while len(self.pending) > 2 * self.max_workers:
+            self._collect()
+
+# ---------------------------------------------------------------------------- #
+    def _collect(self):
+        # Batches are collected in order, so videos get their frames in order:
+        for frame in self.pending.popleft().result():
+            self.video.append_data(frame)
+
+# ---------------------------------------------------------------------------- #
+    def close(self):
+        """Draw and write the frames left and stop the workers."""
+        if self.closed:
+            return
+
+        self._submit()
+
+        while self.pending:
+            self._collect()
+
+        self.executor.shutdown()
+
+        if self.video is not None:
+            self.video.close()
+
+        self.closed = True
@@ -0,0 +1,100 @@
+import numpy as np
+
+
+class EntityRegistry:
+    """Gives every creature of a world a compact integer id and finds it back
+    in O(1).
+
+    An id packs a slot and the generation of that slot: `generation << 32 |
+    slot`. Slots of dead creatures are reused, and every reuse bumps the
+    generation, so an old id never finds the creature that took its slot.
+    """
+    SLOT_BITS = 32
+    SLOT_MASK = (1 << SLOT_BITS) - 1
+
+    def __init__(self):
+        self.entities = list()      # slot -> creature, None if free
+        self.generations = list()   # slot -> generation of its current id
+        self.free = list()          # free slots, the last one is reused first
+        self.count = 0
+
+# ---------------------------------------------------------------------------- #
+    def __len__(self):
+        return self.count
+
+# ---------------------------------------------------------------------------- #
+    def __contains__(self, id):
+        return self.get(id) is not None
+
+# ---------------------------------------------------------------------------- #
+    def __iter__(self):
+        return (entity for entity in self.entities if entity is not None)
+
+# ---------------------------------------------------------------------------- #
+    def add(self, entity):
+        """Register `entity` and return its new id."""
+        if self.free:
+            slot = self.free.pop()
+            self.entities[slot] = entity
+        else:
+            slot = len(self.entities)
+            self.entities.append(entity)
+            self.generations.append(0)
+
+        self.count += 1
+
+        return (self.generations[slot] << self.SLOT_BITS) | slot
+
+# ---------------------------------------------------------------------------- #
+    def get(self, id):
+        """The creature with `id`, or None if it is dead."""
+        slot = id & self.SLOT_MASK
+
+        if slot < len(self.entities) \
+        and self.generations[slot] == id >> self.SLOT_BITS:
+            return self.entities[slot]
+
+        return None
+
+# ---------------------------------------------------------------------------- #
+    def remove(self, id):
+        """Free the slot of `id`. Removing a dead id does nothing."""
+        if self.get(id) is None:
+            return
+
+        slot = id & self.SLOT_MASK
+        self.entities[slot] = None
+        self.generations[slot] += 1
+        self.free.append(slot)
+        self.count -= 1
+
+# ---------------------------------------------------------------------------- #
+    def get_state(self):
+        """The slots layout, the creatures themselves are saved by their
+        owners and put back with `restore`.
+        """
+        return {
+            "generations": np.array(self.generations, dtype = np.int64),
+            "free": np.array(self.free, dtype = np.int64)
+        }
+
+# ---------------------------------------------------------------------------- #
+    def set_state(self, state):
+        self.generations = state["generations"].tolist()
+        self.free = state["free"].tolist()
+        self.entities = [None] * len(self.generations)
+        self.count = 0
+
+# ---------------------------------------------------------------------------- #
+    def restore(self, id, entity):
+        """Put a creature saved with `id` back in its slot, after
+        `set_state`.
+        """
+        slot = id & self.SLOT_MASK
+
+        assert self.generations[slot] == id >> self.SLOT_BITS \
+        and self.entities[slot] is None, \
+            f"<ERROR> the slot of id {id} is not free for this generation"
+
+        self.entities[slot] = entity
+        self.count += 1
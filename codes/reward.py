@@ -0,0 +1,88 @@
+import numpy as np
+from columns import ColumnStore
+
+
+class RewardTracker(ColumnStore):
+    """Short and long term rewards of one or many Litix, updated in O(1) for
+    every new event instead of recomputed over the whole memory.
+
+    The short term reward is the energy difference between two events. The
+    long term reward is the mean of the last ten short term rewards, each one
+    weighted by (1 + 1 / i), where i goes from 1 (oldest) to 10 (newest). It
+    is NaN until ten short term rewards are known.
+    """
+    window = 10
+
+    columns = {
+        "last_energy": (np.float64, ()),
+        "short_term_rewards": (np.float64, (window,)),
+        "short_term_reward": (np.float64, ()),
+        "long_term_reward": (np.float64, ())
+    }
+
+    # The weights of the long term reward, 1 (oldest) to 10 (newest):
+    i = np.arange(1, window + 1)
+
+    # Every Litix object has its own tracker, so no instance dict:
+    __slots__ = ()
+
+    def __init__(
+        self,
+        n: int = 1
+    ):
+        """Instantiate `n` trackers with no events.
+
+        Args:
+            n (int): How many creatures are tracked together. Defaults to 1.
+
+        """
+        super().__init__(n, capacity = max(n, 1))
+
+        for buffer in self.buffers.values():
+            buffer[:] = np.nan
+
+# ---------------------------------------------------------------------------- #
+    def update(self, energy):
+        """Track a new event for every creature.
+
+        Args:
+            energy (float or np.ndarray): The energy of the new events, one per
+                tracked creature.
+        Returns:
+            tuple: (short_term_reward, long_term_reward) arrays.
+        """
+        short_term_reward = energy - self.last_energy
+        self.short_term_reward = short_term_reward
+        self.last_energy = energy
+
+        self.short_term_rewards[:, :-1] = self.short_term_rewards[:, 1:]
+        self.short_term_rewards[:, -1] = short_term_reward
+
+        long_term_reward = np.mean(
+            self.short_term_rewards + (self.short_term_rewards * 1 / self.i),
+            axis = 1
+        )
+        self.long_term_reward = long_term_reward
+
+        return short_term_reward, long_term_reward
+
+# ---------------------------------------------------------------------------- #
+    def extend(self, n):
+        """Track `n` more creatures, with no events yet."""
+        self._append({name: np.nan for name in self.columns}, n)
+
+# ---------------------------------------------------------------------------- #
+    def compact(self, keep):
+        """Stop tracking the creatures where the `keep` mask is False."""
+        self._compact(keep)
+
+# ---------------------------------------------------------------------------- #
+    def get_state(self):
+        return {name: getattr(self, name) for name in self.columns}
+
+# ---------------------------------------------------------------------------- #
+    def set_state(self, state):
+        self._resize(len(state["last_energy"]))
+
+        for name in self.columns:
+            setattr(self, name, state[name])
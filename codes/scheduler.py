@@ -0,0 +1,174 @@
+from time import perf_counter, sleep
+
+
+class Scheduler:
+    """Drives a Brorix84 planet, one `update_calendar` call per tick.
+
+    Modes:
+        "fast": as many ticks per second as the machine can do.
+
+        "realtime": a fixed timestep of 1 / `ticks_per_second`. The time spent
+            in each step is discounted from the wait, so slow steps do not
+            slow the clock down. If the run falls far behind, it catches up
+            instead of sleeping.
+
+        "budget": as fast as possible, but only until `max_ticks` ticks or
+            `deadline` seconds, whichever comes first.
+    """
+    modes = ["fast", "realtime", "budget"]
+
+    def __init__(
+        self,
+        planet,
+        mode: str = "fast",
+        ticks_per_second: float = 100,
+        max_ticks: int = None,
+        deadline: float = None
+    ):
+        """Instantiate a scheduler for `planet`.
+
+        Args:
+            planet (Brorix84): The planet to drive.
+
+            mode (str): One of "fast", "realtime" or "budget". Defaults to
+                "fast".
+
+            ticks_per_second (float): The target rate of the "realtime" mode.
+                Defaults to 100.
+
+            max_ticks (int): The step budget, no more ticks are run after it.
+                Required by "budget" if `deadline` is None. Defaults to None.
+
+            deadline (float): The wall time budget in seconds, counted from the
+                first tick. Required by "budget" if `max_ticks` is None.
+                Defaults to None.
+
+        """
+        assert mode in self.modes, \
+            f"<ERROR> `mode` must be one of {self.modes}, not {mode}"
+        assert mode != "budget" or max_ticks is not None or deadline is not None, \
+            "<ERROR> the `budget` mode needs `max_ticks` or `deadline`"
+        assert ticks_per_second > 0, \
+            f"<ERROR> `ticks_per_second` must be positive, not {ticks_per_second}"
+
+        self.planet = planet
+        self.mode = mode
+        self.period = 1 / ticks_per_second
+        self.max_ticks = max_ticks
+        self.deadline = deadline
+
+        self.ticks = 0              # Ticks run so far
+        self.step_time = 0.0        # Seconds spent inside update_calendar
+        self.started = None         # perf_counter() at the first tick
+        self.last_tick = None       # perf_counter() at the end of the last tick
+        self.next_tick = None       # perf_counter() when the next tick is due
+        self.stop_at = None         # Tick count where the current run stops
+
+# ---------------------------------------------------------------------------- #
+    @property
+    def elapsed(self):
+        """Wall time from the start of the first tick to the end of the last."""
+        if self.started is None:
+            return 0.0
+
+        return self.last_tick - self.started
+
+# ---------------------------------------------------------------------------- #
+    @property
+    def ticks_per_second(self):
+        """The achieved rate, over `elapsed`."""
+        elapsed = self.elapsed
+
+        return self.ticks / elapsed if elapsed > 0 else 0.0
+
+# ---------------------------------------------------------------------------- #
+    def report(self):
+        return {
+            "mode": self.mode,
+            "ticks": self.ticks,
+            "elapsed": self.elapsed,
+            "step_time": self.step_time,
+            "ticks_per_second": self.ticks_per_second
+        }
+
+# ---------------------------------------------------------------------------- #
+    def done(self):
+        if self.stop_at is not None and self.ticks >= self.stop_at:
+            return True
+
+        if self.max_ticks is not None and self.ticks >= self.max_ticks:
+            return True
+
+        if self.deadline is not None and self.started is not None \
+        and perf_counter() - self.started >= self.deadline:
+            return True
+
+        return False
+
+# ---------------------------------------------------------------------------- #
+    def wait_time(self):
+        """Seconds until the next tick is due."""
+        if self.mode != "realtime" or self.next_tick is None:
+            return 0.0
+
+        return max(self.next_tick - perf_counter(), 0.0)
+
+# ---------------------------------------------------------------------------- #
+    def step(self):
+        """Run a single tick now."""
+        start = perf_counter()
+
+        if self.started is None:
+            self.started = start
+            self.next_tick = start
+
+        self.planet.update_calendar()
+
+        end = perf_counter()
+        self.last_tick = end
+        self.step_time += end - start
+        self.ticks += 1
+
+        if self.mode == "realtime":
+            self.next_tick += self.period
+
+            # Too far behind, don't try to run all the missed ticks at once:
+            if end - self.next_tick > 10 * self.period:
+                self.next_tick = end
+
+# ---------------------------------------------------------------------------- #
+    def run(self, ticks: int = None):
+        """Run `ticks` more ticks (forever if None) or until the budget is
+        over, blocking. Returns the `report`.
+        """
+        self.stop_at = None if ticks is None else self.ticks + ticks
+
+        while not self.done():
+            wait_time = self.wait_time()
+
+            if wait_time > 0:
+                sleep(wait_time)
+
+            self.step()
+
+        return self.report()
+
+# ---------------------------------------------------------------------------- #
+    def run_tk(self, tk, ticks: int = None, time_slice: float = 0.02):
+        """Run inside the Tk event loop instead of blocking: ticks are run in
+        `tk.after` callbacks of at most `time_slice` seconds, so the window
+        stays responsive. Call `tk.mainloop()` afterwards.
+        """
+        self.stop_at = None if ticks is None else self.ticks + ticks
+
+        def callback():
+            slice_end = perf_counter() + time_slice
+
+            while not self.done() and self.wait_time() == 0 \
+            and perf_counter() < slice_end:
+                self.step()
+
+            if not self.done():
+                tk.after(max(int(self.wait_time() * 1000), 1), callback)
+
+        tk.after(0, callback)
@@ -1,49 +1,58 @@
-from tkinter import *
 import numpy as np
-from time import sleep, time
+from randomness import RandomService, shared
+from kernels import eat_overlapping, count_boxes
 
 class Scux:
+    # The colors change as the scux gets older, shared by every scux:
+    colors = [
+        "#a1ff26", "#a6e91f", "#a4d319", "#a3bd13", "#9fa70e",
+        "#918c0a", "#7a6b06", "#644d03", "#4e3601", "#382100",
+    ]
+
+    # No instance dict, large populations are bound by memory:
+    __slots__ = (
+        "age", "size", "energy_content", "current_color", "initial_position",
+        "status", "id"
+    )
+
     def __init__(
         self,
-        canvas: Canvas
+        size: int = None,
+        initial_position: tuple = None,
+        rng: RandomService = None
     ):
+        """Instantiate a Scux. Random characteristics are drawn from `rng`,
+        the world random numbers (the shared ones if None), unless given.
+        """
+        rng = shared if rng is None else rng
 
         # Some characteristics first: size, energy content, color...
         self.age = 0                        # It's a newborn
-        self.size = np.random.randint(3, 7) # Size may change from 3 to 7
+        self.size = rng.integers(3, 7) if size is None else size # 3 to 7
         self.energy_content = self.size ** 2 # minimum 9, maximum 49
-
-        # The colors change as the scux gets older.
-        self.colors = [
-            "#a1ff26", "#a6e91f", "#a4d319", "#a3bd13", "#9fa70e",
-            "#918c0a", "#7a6b06", "#644d03", "#4e3601", "#382100",
-
-        ]
+        self.current_color = self.colors[0]
 
         # The initial position is random:
-        self.initial_position = tuple(
-            np.random.choice(
-                np.random.randint(5, 995, 100),
-                2
-            )
+        self.initial_position = (
+            tuple(rng.integers(5, 995, 2).tolist())
+            if initial_position is None
+            else initial_position
         )
 
         self.status = "alive"
-        self.canvas = canvas
+        self.id = None                      # Given by the planet registry
 
+# ---------------------------------------------------------------------------- #
+    @property
+    def coords(self):
         # Body is a rectangle:
-        self.body = self.canvas.create_rectangle(
+        return (
             self.initial_position[0] - (self.size / 2),
             self.initial_position[1] - (self.size / 2),
             self.initial_position[0] + (self.size / 2),
-            self.initial_position[1] + (self.size / 2),
-            fill = self.colors[0],
-            outline = self.colors[0],
-            tag = "scux"
+            self.initial_position[1] + (self.size / 2)
         )
 
-        self.canvas.update()
-
 # ---------------------------------------------------------------------------- #
     def update_energy_content(self):
         MAX_ENERGY_CONTENT = self.size ** 2
@@ -56,22 +65,12 @@ class Scux:
 
 # ---------------------------------------------------------------------------- #
     def update_appearance(self):
-        self.canvas.itemconfig(
-            self.body,
-            fill = self.colors[self.age] if self.age < 10 else self.colors[-1]
+        self.current_color = (
+            self.colors[self.age] if self.age < 10 else self.colors[-1]
         )
 
-        self.canvas.itemconfig(
-            self.body,
-            outline = self.colors[self.age] if self.age < 10 else self.colors[-1]
-        )
-
-        self.canvas.update()
-
 # ---------------------------------------------------------------------------- #
     def die(self):
-        self.canvas.delete(self.body)
-        self.canvas.update()
         self.status = "dead"
 
 # ---------------------------------------------------------------------------- #
@@ -82,3 +81,360 @@ class Scux:
 
         if self.energy_content == 0:
             self.die()
+
+# ---------------------------------------------------------------------------- #
+    @staticmethod
+    def pack(scux_list):
+        """The state of many scux as arrays, one entry per scux."""
+        return {
+            "id": np.array([scux.id for scux in scux_list], dtype = np.int64),
+            "age": np.array([scux.age for scux in scux_list], dtype = np.int64),
+            "size": np.array([scux.size for scux in scux_list], dtype = np.int64),
+            "energy_content": np.array(
+                [scux.energy_content for scux in scux_list],
+                dtype = np.float64
+            ),
+            "position": np.array(
+                [scux.initial_position for scux in scux_list],
+                dtype = np.int64
+            ).reshape(-1, 2),
+            "status": np.array(
+                [scux.status for scux in scux_list],
+                dtype = "U5"
+            )
+        }
+
+# ---------------------------------------------------------------------------- #
+    @staticmethod
+    def unpack(state):
+        """The scux packed by `pack`."""
+        scux_list = list()
+
+        for id, age, size, energy_content, position, status in zip(
+            state["id"].tolist(),
+            state["age"].tolist(),
+            state["size"].tolist(),
+            state["energy_content"].tolist(),
+            state["position"].tolist(),
+            state["status"].tolist()
+        ):
+            scux = Scux(size = size, initial_position = tuple(position))
+            scux.id = id
+            scux.age = age
+            scux.energy_content = energy_content
+            scux.status = status
+            scux.update_appearance()
+            scux_list.append(scux)
+
+        return scux_list
+
+# ---------------------------------------------------------------------------- #
+class ScuxPool:
+    """A whole Scux population stored as NumPy arrays, one entry per algae.
+    It follows the same rules of `Scux`, but ages every algae in a single
+    vectorized step and removes the dead ones with a single mask compaction.
+    """
+    colors = Scux.colors
+
+    def __init__(
+        self,
+        rng: RandomService = None
+    ):
+        self.rng = shared if rng is None else rng
+        self.next_id = 0                            # ids are never reused
+        self.ids = np.zeros(0, dtype = np.int64)
+        self.age = np.zeros(0, dtype = np.int64)
+        self.size = np.zeros(0, dtype = np.int64)
+        self.energy_content = np.zeros(0, dtype = np.float64)
+        self.position = np.zeros((0, 2), dtype = np.int64)
+        self.alive = np.zeros(0, dtype = bool)
+        self.coords = np.zeros((0, 4), dtype = np.float64)
+
+# ---------------------------------------------------------------------------- #
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+# ---------------------------------------------------------------------------- #
+    def spawn(self, n_scux):
+        """Append `n_scux` newborn algae with random sizes and positions."""
+        if n_scux <= 0:
+            return
+
+        size = self.rng.integers(3, 7, n_scux)  # Size may change from 3 to 7
+
+        self.ids = np.concatenate(
+            [self.ids, np.arange(self.next_id, self.next_id + n_scux)]
+        )
+        self.age = np.concatenate([self.age, np.zeros(n_scux, dtype = np.int64)])
+        self.size = np.concatenate([self.size, size])
+        self.energy_content = np.concatenate([self.energy_content, size ** 2])
+        self.position = np.concatenate(
+            [self.position, self.rng.integers(5, 995, (n_scux, 2))]
+        )
+        self.alive = np.concatenate([self.alive, np.ones(n_scux, dtype = bool)])
+
+        self.next_id += n_scux
+        self._update_coords()
+
+# ---------------------------------------------------------------------------- #
+    def update_age(self):
+        """Age every algae by one day and drop the dead ones."""
+        self.age += 1
+
+        MAX_ENERGY_CONTENT = self.size ** 2
+        DECREMENT = np.ceil(MAX_ENERGY_CONTENT * 0.10)
+
+        self.energy_content = np.maximum(
+            MAX_ENERGY_CONTENT - (self.age * DECREMENT),
+            0
+        )
+
+        keep = self.alive & (self.energy_content > 0)
+
+        self.ids = self.ids[keep]
+        self.age = self.age[keep]
+        self.size = self.size[keep]
+        self.energy_content = self.energy_content[keep]
+        self.position = self.position[keep]
+        self.alive = self.alive[keep]
+        self.coords = self.coords[keep]
+
+# ---------------------------------------------------------------------------- #
+    def get_state(self):
+        return {
+            "next_id": self.next_id,
+            "ids": self.ids,
+            "age": self.age,
+            "size": self.size,
+            "energy_content": self.energy_content,
+            "position": self.position,
+            "alive": self.alive
+        }
+
+# ---------------------------------------------------------------------------- #
+    def set_state(self, state):
+        self.next_id = state["next_id"]
+
+        for field in ["ids", "age", "size", "energy_content", "position", "alive"]:
+            setattr(self, field, state[field])
+
+        self._update_coords()
+
+# ---------------------------------------------------------------------------- #
+    def _update_coords(self):
+        # Body is a rectangle, (x0, y0, x1, y1) of every algae:
+        half_size = (self.size / 2)[:, np.newaxis]
+
+        self.coords = np.hstack(
+            [self.position - half_size, self.position + half_size]
+        )
+
+# ---------------------------------------------------------------------------- #
+    def current_colors(self):
+        return [self.colors[age] for age in np.minimum(self.age, 9)]
+
+# ---------------------------------------------------------------------------- #
+    def total_energy(self):
+        return float(self.energy_content[self.alive].sum())
+
+# ---------------------------------------------------------------------------- #
+    def consume_overlapping(self, rects):
+        """Every rectangle, in order, kills the living algae overlapping it.
+        Returns the energy each rectangle gets and how many algae died.
+        """
+        return eat_overlapping(rects, self.coords, self.alive, self.size)
+
+# ---------------------------------------------------------------------------- #
+    def count_in(self, rects, enclosed = False):
+        """How many living algae overlap each rectangle, or are enclosed by
+        it, see `count_boxes`.
+        """
+        return count_boxes(
+            rects,
+            self.coords,
+            enclosed = enclosed,
+            alive = self.alive
+        )
+
+# ---------------------------------------------------------------------------- #
+class ScuxField:
+    """A whole Scux population stored as a density grid: how many algae of
+    each age and size live in every cell of the world. It follows the same
+    rules of `Scux`, but its cost depends on the grid size only, not on how
+    many algae there are, so it can hold huge blooms.
+
+    Algae are only known by their cell, so a Litix eats every algae of the
+    cells its body overlaps.
+    """
+    colors = ScuxPool.colors
+    sizes = np.arange(3, 7)                 # Size may change from 3 to 7
+    max_age = 10                            # Every algae is dead by then
+
+    def __init__(
+        self,
+        cell_size: int = 10,
+        extent: int = 1000,
+        rng: RandomService = None
+    ):
+        """Instantiate an empty field.
+
+        Args:
+            cell_size (int): The side of each grid cell in pixels. Defaults
+                to 10.
+
+            extent (int): The side of the square covered by the grid. Algae
+                are born in (5, 995) on both axes, like `Scux`. Defaults to
+                1000.
+
+            rng (RandomService): Defaults to None, the shared one.
+
+        """
+        assert isinstance(cell_size, int) and cell_size > 0, \
+            f"<ERROR> `cell_size` must be a positive integer, not {cell_size}"
+
+        self.rng = shared if rng is None else rng
+        self.cell_size = cell_size
+        self.n_cells = -(-extent // cell_size)
+
+        # Algae count by (age, size, row, column):
+        self.counts = np.zeros(
+            (self.max_age, len(self.sizes), self.n_cells, self.n_cells),
+            dtype = np.int64
+        )
+
+        # Energy of an algae by (age, size), zero once it is dead:
+        MAX_ENERGY_CONTENT = self.sizes ** 2
+        DECREMENT = np.ceil(MAX_ENERGY_CONTENT * 0.10)
+        self.energy_table = np.maximum(
+            MAX_ENERGY_CONTENT
+            - np.arange(self.max_age)[:, np.newaxis] * DECREMENT,
+            0
+        )
+
+# ---------------------------------------------------------------------------- #
+    def __len__(self):
+        return int(self.counts.sum())
+
+# ---------------------------------------------------------------------------- #
+    def spawn(self, n_scux):
+        """Add `n_scux` newborn algae with random sizes and positions."""
+        if n_scux <= 0:
+            return
+
+        size = self.rng.integers(3, 7, n_scux) - 3
+        cell = self.rng.integers(5, 995, (n_scux, 2)) // self.cell_size
+
+        # Newborns are counted in the age 0 layer:
+        self.counts[0] += np.bincount(
+            np.ravel_multi_index(
+                (size, cell[:, 1], cell[:, 0]),
+                self.counts.shape[1:]
+            ),
+            minlength = self.counts[0].size
+        ).reshape(self.counts.shape[1:])
+
+# ---------------------------------------------------------------------------- #
+    def update_age(self):
+        """Age every algae by one day and drop the dead ones. Returns how
+        many died.
+        """
+        self.counts[1:] = self.counts[:-1].copy()
+        self.counts[0] = 0
+
+        dead = self.energy_table == 0
+        died = int(self.counts[dead].sum())
+        self.counts[dead] = 0
+
+        return died
+
+# ---------------------------------------------------------------------------- #
+    def energy(self):
+        """The energy map, total energy of the algae in every cell."""
+        return np.tensordot(self.energy_table, self.counts, axes = 2)
+
+# ---------------------------------------------------------------------------- #
+    def total_energy(self):
+        return float((self.energy_table * self.counts.sum(axis = (2, 3))).sum())
+
+# ---------------------------------------------------------------------------- #
+    def _window(self, x0, y0, x1, y1):
+        # The cells overlapped by a rectangle, clipped to the grid:
+        c0, r0, c1, r1 = np.clip(
+            np.floor_divide([x0, y0, x1, y1], self.cell_size).astype(np.int64),
+            0,
+            self.n_cells - 1
+        )
+
+        return slice(r0, r1 + 1), slice(c0, c1 + 1)
+
+# ---------------------------------------------------------------------------- #
+    def sense(self, coords, counts = False):
+        """The algae energy inside each rectangle of `coords`, an (n, 4)
+        array of (x0, y0, x1, y1), in O(1) per rectangle from the summed area
+        table of the energy map. Rectangles cover every cell they overlap,
+        the cells `eat` would empty.
+
+        Args:
+            coords (np.ndarray): The (n, 4) rectangles.
+
+            counts (bool): Sum how many algae there are instead of their
+                energy. Defaults to False.
+
+        """
+        values = self.counts.sum(axis = (0, 1)) if counts else self.energy()
+
+        table = np.zeros((self.n_cells + 1, self.n_cells + 1), dtype = values.dtype)
+        table[1:, 1:] = values.cumsum(axis = 0).cumsum(axis = 1)
+
+        c0, r0, c1, r1 = np.clip(
+            np.floor_divide(
+                np.asarray(coords).reshape(-1, 4),
+                self.cell_size
+            ).astype(np.int64),
+            0,
+            self.n_cells - 1
+        ).T
+
+        return (
+            table[r1 + 1, c1 + 1] - table[r0, c1 + 1]
+            - table[r1 + 1, c0] + table[r0, c0]
+        )
+
+# ---------------------------------------------------------------------------- #
+    def eat(self, x0, y0, x1, y1):
+        """Kill every algae in the cells overlapped by the rectangle. Returns
+        how many were eaten and the energy a Litix gets from them, the same
+        `size ** 2` each of `ScuxPool.consume_overlapping`.
+        """
+        rows, columns = self._window(x0, y0, x1, y1)
+        window = self.counts[:, :, rows, columns]
+
+        eaten = window.sum(axis = (0, 2, 3))
+        window[...] = 0
+
+        return int(eaten.sum()), int((eaten * self.sizes ** 2).sum())
+
+# ---------------------------------------------------------------------------- #
+    def cells(self):
+        """Yield `(row, column, count, mean age)` for every cell with algae."""
+        counts = self.counts.sum(axis = 1)
+        total = counts.sum(axis = 0)
+        ages = np.tensordot(np.arange(self.max_age), counts, axes = 1)
+
+        for row, column in zip(*np.nonzero(total)):
+            yield (
+                int(row),
+                int(column),
+                int(total[row, column]),
+                ages[row, column] / total[row, column]
+            )
+
+# ---------------------------------------------------------------------------- #
+    def get_state(self):
+        return {"cell_size": self.cell_size, "counts": self.counts}
+
+# ---------------------------------------------------------------------------- #
+    def set_state(self, state):
+        self.cell_size = state["cell_size"]
+        self.counts = np.array(state["counts"])
+        self.n_cells = self.counts.shape[-1]
@@ -0,0 +1,104 @@
+import numpy as np
+
+
+def _read_only(array):
+    """A read-only view of `array`, nothing is copied."""
+    if array is None:
+        return None
+
+    view = np.asarray(array).view()
+    view.flags.writeable = False
+
+    return view
+
+# ---------------------------------------------------------------------------- #
+class Snapshot:
+    """A read-only picture of a planet at the end of a tick: calendar,
+    climate, population counts and energy totals and, if asked for, the
+    positions of the creatures.
+
+    Positions are read-only views of the planet arrays whenever the engine
+    keeps them in arrays, so they are only valid until the next tick. Copy
+    them to keep them longer.
+    """
+    fields = [
+        "tick", "year", "day", "season", "temperature", "day_length",
+        "n_scux", "n_litix", "n_vohix", "total_scux_energy",
+        "total_litix_energy", "total_vohix_energy", "scux_positions",
+        "litix_positions", "vohix_positions"
+    ]
+
+    def __init__(self, planet, positions: bool = False):
+        """Take a snapshot of `planet`.
+
+        Args:
+            planet (Brorix84): The planet to picture.
+
+            positions (bool): Add the (n, 2) positions of every scux, litix
+                and vohix. Scux positions are None for the "field" engine,
+                which only keeps densities. Defaults to False.
+
+        """
+        values = {
+            "tick": planet.ticks,
+            "year": planet.year,
+            "day": planet.day,
+            "season": planet.season,
+            "temperature": planet.temperature,
+            "day_length": planet.day_length,
+            "n_scux": planet.n_scux,
+            "n_litix": planet.n_litix,
+            "n_vohix": planet.n_vohix,
+            "total_scux_energy": planet.total_scux_energy,
+            "total_litix_energy": planet.total_litix_energy,
+            "total_vohix_energy": planet.total_vohix_energy,
+            "scux_positions": None,
+            "litix_positions": None,
+            "vohix_positions": None
+        }
+
+        if positions:
+            values["scux_positions"] = _read_only(planet.scux_positions())
+            values["litix_positions"] = _read_only(planet.litix_positions())
+            values["vohix_positions"] = _read_only(planet.vohix_pack.position)
+
+        for field, value in values.items():
+            object.__setattr__(self, field, value)
+
+# ---------------------------------------------------------------------------- #
+    def __setattr__(self, name, value):
+        raise AttributeError(f"<ERROR> snapshots are read-only, can't set `{name}`")
+
+# ---------------------------------------------------------------------------- #
+    def __repr__(self):
+        return (
+            f"Snapshot(tick={self.tick}, year={self.year}, day={self.day}, "
+            f"n_scux={self.n_scux}, n_litix={self.n_litix}, n_vohix={self.n_vohix})"
+        )
+
+# ---------------------------------------------------------------------------- #
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.fields}
+
+# ---------------------------------------------------------------------------- #
+class Subscription:
+    """An observer that hands a `Snapshot` to `callback` every `every` ticks,
+    see `Brorix84.subscribe`.
+    """
+    def __init__(
+        self,
+        callback,
+        every: int = 1,
+        positions: bool = False
+    ):
+        assert isinstance(every, int) and every >= 1, \
+            f"<ERROR> `every` must be a positive integer, not {every}"
+
+        self.callback = callback
+        self.every = every
+        self.positions = positions
+
+# ---------------------------------------------------------------------------- #
+    def update(self, planet):
+        if planet.ticks % self.every == 0:
+            self.callback(Snapshot(planet, positions = self.positions))
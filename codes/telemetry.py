@@ -0,0 +1,158 @@
+import atexit
+import os
+import sqlite3
+import numpy as np
+
+
+class TelemetryStore:
+    """One SQLite database per run with the events of every Litix, keyed by
+    (litix_id, age). Events are buffered and inserted in large batches, and
+    the table is clustered by that key, so loading a single cell trajectory
+    reads only that cell's rows.
+    """
+    def __init__(
+        self,
+        path: str,
+        fields: dict,
+        batch_size: int = 10000
+    ):
+        """Instantiate a store, replacing any previous run at `path`.
+
+        Args:
+            path (str): Where the database is written.
+
+            fields (dict): The event fields, as in `Litix.memory_fields`. The
+                "age" field is part of the key.
+
+            batch_size (int): How many events are buffered before they are
+                inserted. Defaults to 10000.
+
+        """
+        self.path = path
+        self.fields = [field for field in fields if field != "age"]
+        self.batch_size = batch_size
+        self.buffer = list()
+
+        directory = os.path.dirname(path)
+
+        if directory:
+            os.makedirs(directory, exist_ok = True)
+
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute("DROP TABLE IF EXISTS telemetry")
+        self.connection.execute(
+            "CREATE TABLE telemetry (litix_id, age INTEGER, "
+            + ", ".join(self.fields)
+            + ", PRIMARY KEY (litix_id, age)) WITHOUT ROWID"
+        )
+        self.connection.commit()
+
+        self.insert = (
+            "INSERT OR REPLACE INTO telemetry VALUES ("
+            + ", ".join(["?"] * (len(self.fields) + 2))
+            + ")"
+        )
+
+        # Buffered events are not lost if the run ends without `close`:
+        atexit.register(self.close)
+
+# ---------------------------------------------------------------------------- #
+    def write(self, litix_id, event: dict):
+        """Buffer one `event` of the cell `litix_id`."""
+        self.buffer.append(
+            tuple(
+                value.item() if isinstance(value, np.generic) else value
+                for value in [litix_id, event["age"]]
+                + [event.get(field) for field in self.fields]
+            )
+        )
+
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+# ---------------------------------------------------------------------------- #
+    def write_many(self, litix_ids, events: dict):
+        """Buffer one event for each cell in `litix_ids`. `events` maps each
+        field to an array aligned with `litix_ids`; missing fields are NULL.
+        """
+        columns = [np.asarray(litix_ids).tolist(), np.asarray(events["age"]).tolist()]
+        columns += [
+            np.asarray(events[field]).tolist()
+            if field in events
+            else [None] * len(columns[0])
+            for field in self.fields
+        ]
+
+        self.buffer.extend(zip(*columns))
+
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+# ---------------------------------------------------------------------------- #
+    def flush(self):
+        """Insert the buffered events in a single transaction."""
+        if len(self.buffer) > 0:
+            with self.connection:
+                self.connection.executemany(self.insert, self.buffer)
+
+            self.buffer = list()
+
+# ---------------------------------------------------------------------------- #
+    def close(self):
+        """Insert the buffered events and close the database. Closing twice
+        does nothing.
+        """
+        if self.connection is None:
+            return
+
+        self.flush()
+        self.connection.close()
+        self.connection = None
+
+        atexit.unregister(self.close)
+
+# ---------------------------------------------------------------------------- #
+    def ids(self):
+        """Every Litix id in the store."""
+        self.flush()
+
+        return [
+            row[0]
+            for row in self.connection.execute(
+                "SELECT DISTINCT litix_id FROM telemetry"
+            )
+        ]
+
+# ---------------------------------------------------------------------------- #
+    def trajectory(self, litix_id):
+        """The events of the cell `litix_id` as a DataFrame, ordered by age."""
+        self.flush()
+
+        return _trajectory(self.connection, litix_id)
+
+# ---------------------------------------------------------------------------- #
+def _trajectory(connection, litix_id):
+    import pandas as pd
+
+    cursor = connection.execute(
+        "SELECT * FROM telemetry WHERE litix_id = ? ORDER BY age",
+        (litix_id,)
+    )
+
+    return pd.DataFrame(
+        cursor.fetchall(),
+        columns = [column[0] for column in cursor.description]
+    ).drop(columns = "litix_id")
+
+# ---------------------------------------------------------------------------- #
+def load_trajectory(path, litix_id):
+    """Load the events of the cell `litix_id` from the telemetry database of
+    a finished run at `path`, without reading the other cells.
+    """
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri = True)
+
+    try:
+        return _trajectory(connection, litix_id)
+    finally:
+        connection.close()
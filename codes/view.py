@@ -0,0 +1,308 @@
+from tkinter import *
+
+
+class TkView:
+    """Draws a Brorix84 planet on a Tkinter canvas. The view only reads the
+    planet state, so the simulation runs the same with or without it.
+
+    Every frame first collects what changed since the last frame (new and dead
+    creatures, moves, colors and the background) and then applies all of it to
+    the canvas in a single pass, followed by a single redraw. Frames can be
+    skipped with `render_every`, so the simulation rate is not tied to the
+    redraw rate.
+    """
+    def __init__(
+        self,
+        canvas: Canvas,
+        render_every: int = 1
+    ):
+        """Instantiate a view over `canvas`.
+
+        Args:
+            canvas (Tkinter.canvas): The canvas where the planet is drawn.
+
+            render_every (int): Draw one frame every `render_every` days.
+                Defaults to 1, every day.
+
+        """
+        assert isinstance(render_every, int) and render_every >= 1, \
+            f"<ERROR> `render_every` must be a positive integer, not {render_every}"
+
+        self.canvas = canvas
+        self.render_every = render_every
+        self.ticks = 0
+
+        self.background = None
+        self.scux_items = dict()        # Scux, pool id or field cell -> [id, color]
+        self.litix_items = dict()       # Litix (or swarm id) -> drawn cell
+        self.vohix_items = dict()       # Pack id -> [id, coords, color]
+
+# ---------------------------------------------------------------------------- #
+    def _scux_state(self, planet):
+        """Yield `(key, coords, color)` for every living scux. A scux field
+        is drawn as one square per grid cell with algae, colored by their
+        mean age.
+        """
+        if planet.engine == "field":
+            field = planet.scux_field
+            size = field.cell_size
+
+            for row, column, count, age in field.cells():
+                yield (
+                    (row, column),
+                    (
+                        column * size,
+                        row * size,
+                        (column + 1) * size,
+                        (row + 1) * size
+                    ),
+                    field.colors[min(int(age), 9)]
+                )
+        elif planet.engine == "vector":
+            pool = planet.scux_pool
+            yield from zip(
+                pool.ids[pool.alive].tolist(),
+                pool.coords[pool.alive].tolist(),
+                [
+                    color
+                    for color, alive in zip(pool.current_colors(), pool.alive)
+                    if alive
+                ]
+            )
+        else:
+            for scux in planet.scux_list:
+                if scux.status == "alive":
+                    yield scux, scux.coords, scux.current_color
+
+# ---------------------------------------------------------------------------- #
+    def _litix_state(self, planet):
+        """Yield `(key, age, body coords, sense coords, color, tracks)` for
+        every living litix.
+        """
+        if planet.engine != "object":
+            swarm = planet.litix_swarm
+            colors = swarm.current_colors()
+            body_coords = swarm.body_coords().tolist()
+            sense_coords = swarm.sense_coords().tolist()
+
+            for i, key in enumerate(swarm.ids.tolist()):
+                points = swarm.tracks[i].tolist()
+                # Spores are drawn on the tick they are born, with no tracks:
+                n_tracks = min(int(swarm.age[i]), len(points) - 1)
+                yield (
+                    key,
+                    int(swarm.age[i]),
+                    body_coords[i],
+                    sense_coords[i],
+                    colors[i],
+                    [
+                        (origin, destination, colors[i])
+                        for origin, destination in zip(points[:-1], points[1:])
+                    ][len(points) - 1 - n_tracks:]
+                )
+        else:
+            for litix in planet.litix_list:
+                if litix.status == "alive":
+                    yield (
+                        litix,
+                        litix.age,
+                        litix.body_coords,
+                        litix.sense_coords,
+                        litix.current_color,
+                        litix.tracks
+                    )
+
+# ---------------------------------------------------------------------------- #
+    def _collect(self, planet):
+        """Diff the planet against what is on the canvas. Returns the changes
+        of this frame, nothing is drawn yet.
+        """
+        changes = {
+            "background": None,
+            "delete": list(),           # canvas ids
+            "create_scux": list(),      # (key, coords, color)
+            "create_litix": list(),     # (key, body coords, sense coords, color)
+            "create_tracks": list(),    # (key, origin, destination, color)
+            "create_vohix": list(),     # (key, coords, color)
+            "coords": list(),           # (canvas id, coords)
+            "color": list()             # (canvas id, options)
+        }
+
+        if planet.current_color != self.background:
+            changes["background"] = planet.current_color
+
+        # 1. Scux never move, they are only born, change color or die:
+        alive = set()
+
+        for scux, coords, color in self._scux_state(planet):
+            alive.add(scux)
+
+            if scux not in self.scux_items:
+                changes["create_scux"].append((scux, coords, color))
+            elif self.scux_items[scux][1] != color:
+                self.scux_items[scux][1] = color
+                changes["color"].append(
+                    (self.scux_items[scux][0], {"fill": color, "outline": color})
+                )
+
+        for scux in [scux for scux in self.scux_items if scux not in alive]:
+            changes["delete"].append(self.scux_items.pop(scux)[0])
+
+        # 2. Litix move, change color, leave tracks and die:
+        alive = set()
+
+        for litix, age, body, sense, color, tracks in self._litix_state(planet):
+            alive.add(litix)
+
+            if litix not in self.litix_items:
+                self.litix_items[litix] = {
+                    "body": None,
+                    "sense": None,
+                    "coords": body,
+                    "color": color,
+                    "age": 0,
+                    "tracks": list()
+                }
+                changes["create_litix"].append((litix, body, sense, color))
+
+            cell = self.litix_items[litix]
+
+            if cell["body"] is not None:
+                if cell["coords"] != body:
+                    changes["coords"].append((cell["body"], body))
+                    changes["coords"].append((cell["sense"], sense))
+
+                if cell["color"] != color:
+                    changes["color"].append(
+                        (cell["body"], {"fill": color, "outline": color})
+                    )
+                    changes["color"].append((cell["sense"], {"outline": color}))
+
+            new_tracks = tracks[-(age - cell["age"]):] if age > cell["age"] else list()
+
+            for origin, destination, track_color in new_tracks:
+                changes["create_tracks"].append(
+                    (litix, origin, destination, track_color)
+                )
+
+            overflow = len(cell["tracks"]) + len(new_tracks) - len(tracks)
+            for i in range(max(overflow, 0)):
+                changes["delete"].append(cell["tracks"].pop(0))
+
+            cell["coords"] = body
+            cell["color"] = color
+            cell["age"] = age
+
+        for litix in [litix for litix in self.litix_items if litix not in alive]:
+            cell = self.litix_items.pop(litix)
+            changes["delete"] += [cell["body"], cell["sense"]] + cell["tracks"]
+
+        # 3. Vohix move, change color and die:
+        pack = planet.vohix_pack
+        alive = set()
+
+        for vohix, coords, color in zip(
+            pack.ids.tolist(),
+            pack.body_coords().tolist(),
+            pack.current_colors()
+        ):
+            alive.add(vohix)
+
+            if vohix not in self.vohix_items:
+                changes["create_vohix"].append((vohix, coords, color))
+                continue
+
+            item = self.vohix_items[vohix]
+
+            if item[1] != coords:
+                item[1] = coords
+                changes["coords"].append((item[0], coords))
+
+            if item[2] != color:
+                item[2] = color
+                changes["color"].append((item[0], {"fill": color, "outline": color}))
+
+        for vohix in [vohix for vohix in self.vohix_items if vohix not in alive]:
+            changes["delete"].append(self.vohix_items.pop(vohix)[0])
+
+        return changes
+
+# ---------------------------------------------------------------------------- #
+    def _apply(self, changes):
+        """Apply the changes of a frame to the canvas in a single pass."""
+        if changes["background"] is not None:
+            self.background = changes["background"]
+            self.canvas.configure(bg = self.background)
+
+        for item in changes["delete"]:
+            self.canvas.delete(item)
+
+        for scux, coords, color in changes["create_scux"]:
+            self.scux_items[scux] = [
+                self.canvas.create_rectangle(
+                    *coords,
+                    fill = color,
+                    outline = color,
+                    tag = "scux"
+                ),
+                color
+            ]
+
+        for litix, body, sense, color in changes["create_litix"]:
+            cell = self.litix_items[litix]
+            cell["body"] = self.canvas.create_oval(
+                *body,
+                fill = color,
+                outline = color,
+                tag = ("litix", "body")
+            )
+            cell["sense"] = self.canvas.create_oval(
+                *sense,
+                outline = color,
+                tag = ("litix", "sense")
+            )
+
+        for litix, origin, destination, color in changes["create_tracks"]:
+            self.litix_items[litix]["tracks"].append(
+                self.canvas.create_line(
+                    origin[0],
+                    origin[1],
+                    destination[0],
+                    destination[1],
+                    fill = color
+                )
+            )
+
+        for vohix, coords, color in changes["create_vohix"]:
+            self.vohix_items[vohix] = [
+                self.canvas.create_oval(
+                    *coords,
+                    fill = color,
+                    outline = color,
+                    tag = "vohix"
+                ),
+                coords,
+                color
+            ]
+
+        for item, coords in changes["coords"]:
+            self.canvas.coords(item, *coords)
+
+        for item, options in changes["color"]:
+            self.canvas.itemconfig(item, **options)
+
+# ---------------------------------------------------------------------------- #
+    def render(self, planet):
+        """Draw a frame of the current `planet` state right now."""
+        self._apply(self._collect(planet))
+        self.canvas.update()
+
+# ---------------------------------------------------------------------------- #
+    def update(self, planet):
+        """Called by the planet at the end of every day. Draws a frame every
+        `render_every` days.
+        """
+        if self.ticks % self.render_every == 0:
+            self.render(planet)
+
+        self.ticks += 1
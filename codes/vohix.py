@@ -0,0 +1,276 @@
+import numpy as np
+from grid import PointGrid
+from kernels import move
+from randomness import RandomService, shared
+
+
+class VohixPack:
+    """The Vohix, the Litix main predators, stored as NumPy arrays, one entry
+    per predator.
+
+    Vohix are large and slower than the Litix, and daylight doesn't change
+    their speed or their metabolism, but they strike further at night. Each
+    day every Vohix turns towards the nearest Litix it senses (or wanders),
+    moves, and eats every Litix within its strike range. A well fed Vohix
+    springs a single cub, and only once its previous cub has grown. Vohix
+    live at most `max_age` days.
+
+    The Litix positions are indexed once per tick in a `PointGrid`, so
+    finding the prey of every predator never compares every pair.
+    """
+    # A pallete with ten RGB colors to indicate the cell energy content:
+    cell_colors = [
+        "#d7263d", "#c82337", "#b82031", "#a81d2c", "#981a27",
+        "#881722", "#78141d", "#681118", "#580e13", "#480b0e"
+    ]
+
+    # Every per cell array, kept aligned by `_compact`:
+    fields = [
+        "ids", "age", "parent", "cell_size", "cell_speed", "max_energy_content",
+        "energy_content", "metabolic_cost", "sense_range", "direction_angle",
+        "direction_angle_window", "position", "color_index", "cub"
+    ]
+
+    max_age = 100           # days, a Vohix may live 100 cycles
+    cub_age = 20            # days, a cub is on its own after this age
+    litter_energy = 0.8     # share of `max_energy_content` to spring a cub
+
+    def __init__(
+        self,
+        rng: RandomService = None
+    ):
+        self.rng = shared if rng is None else rng
+        self.next_id = 0                            # ids are never reused
+        self.ids = np.zeros(0, dtype = np.int64)
+        self.age = np.zeros(0, dtype = np.int64)
+        self.parent = np.zeros(0, dtype = np.int64)
+        self.cell_size = np.zeros(0, dtype = np.int64)
+        self.cell_speed = np.zeros(0, dtype = np.float64)
+        self.max_energy_content = np.zeros(0, dtype = np.int64)
+        self.energy_content = np.zeros(0, dtype = np.float64)
+        self.metabolic_cost = np.zeros(0, dtype = np.int64)
+        self.sense_range = np.zeros(0, dtype = np.int64)
+        self.direction_angle = np.zeros(0, dtype = np.int64)
+        self.direction_angle_window = np.zeros(0, dtype = np.int64)
+        self.position = np.zeros((0, 2), dtype = np.float64)
+        self.color_index = np.zeros(0, dtype = np.int64)
+        self.cub = np.zeros(0, dtype = np.int64)    # id of the last cub, or -1
+
+# ---------------------------------------------------------------------------- #
+    def __len__(self):
+        return self.ids.shape[0]
+
+# ---------------------------------------------------------------------------- #
+    def spawn(self, n_vohix, position = None, parent = None):
+        """Append `n_vohix` newborn predators, at random positions unless
+        given. Returns their ids.
+        """
+        if n_vohix <= 0:
+            return np.zeros(0, dtype = np.int64)
+
+        cell_size = self.rng.choice([30, 34, 38, 42], n_vohix)
+
+        if position is None:
+            position = np.column_stack(
+                [
+                    self.rng.integers(5, 995, n_vohix),
+                    self.rng.integers(5, 700, n_vohix)
+                ]
+            )
+
+        newborn = {
+            "ids": np.arange(self.next_id, self.next_id + n_vohix),
+            "age": np.zeros(n_vohix, dtype = np.int64),
+            "parent": (
+                np.full(n_vohix, -1, dtype = np.int64)
+                if parent is None
+                else parent
+            ),
+            "cell_size": cell_size,
+            "cell_speed": 0.4 * cell_size,
+            "max_energy_content": cell_size ** 2,
+            "energy_content": (cell_size ** 2 / 2).astype(np.float64),
+            "metabolic_cost": cell_size // 3,
+            "sense_range": 4 * cell_size,
+            "direction_angle": self.rng.integers(0, 360, n_vohix),
+            "direction_angle_window": self.rng.integers(30, 90, n_vohix),
+            "position": np.asarray(position, dtype = np.float64),
+            "color_index": np.zeros(n_vohix, dtype = np.int64),
+            "cub": np.full(n_vohix, -1, dtype = np.int64)
+        }
+
+        for field in self.fields:
+            setattr(
+                self,
+                field,
+                np.concatenate([getattr(self, field), newborn[field]])
+            )
+
+        self.next_id += n_vohix
+
+        return newborn["ids"]
+
+# ---------------------------------------------------------------------------- #
+    def _compact(self, keep):
+        for field in self.fields:
+            setattr(self, field, getattr(self, field)[keep])
+
+# ---------------------------------------------------------------------------- #
+    def body_coords(self):
+        half_size = (self.cell_size / 2)[:, np.newaxis]
+
+        return np.hstack([self.position - half_size, self.position + half_size])
+
+# ---------------------------------------------------------------------------- #
+    def current_colors(self):
+        return [self.cell_colors[index] for index in self.color_index]
+
+# ---------------------------------------------------------------------------- #
+    def total_energy(self):
+        return float(self.energy_content.sum())
+
+# ---------------------------------------------------------------------------- #
+    def _update_direction_angle(self, prey):
+        """Turn towards the nearest prey in sense range, or wander."""
+        wander = self.rng.integers(
+            self.direction_angle - self.direction_angle_window,
+            self.direction_angle + self.direction_angle_window
+        )
+
+        for i, (x, y) in enumerate(self.position.tolist()):
+            nearest = prey.query_radius(x, y, self.sense_range[i])
+
+            if len(nearest) > 0:
+                target_x, target_y = prey.points[nearest[0]]
+                wander[i] = int(np.degrees(np.arctan2(target_y - y, target_x - x)))
+
+        self.direction_angle = wander % 360
+
+# ---------------------------------------------------------------------------- #
+    def _update_position(self, width, height):
+        move(
+            self.position,
+            self.cell_speed,
+            self.direction_angle,
+            width,
+            height
+        )
+
+# ---------------------------------------------------------------------------- #
+    def _hunt(self, planet, prey):
+        """Every predator eats the prey within its strike range, the first
+        one to reach a prey gets it. The strike range grows with the share of
+        the day that is night.
+        """
+        night = 1 - planet.day_length / planet.rotation_period
+        strike_range = (self.cell_size / 2) * (1 + night)
+
+        eaten = list()
+        taken = np.zeros(len(prey), dtype = bool)
+
+        for i, (x, y) in enumerate(self.position.tolist()):
+            caught = prey.query_radius(x, y, strike_range[i])
+            caught = caught[~taken[caught]]
+
+            if len(caught) == 0:
+                continue
+
+            taken[caught] = True
+            eaten.append((i, caught))
+
+        if not taken.any():
+            return
+
+        # Eaten litix leave the world all at once, and feed their hunter:
+        energy = planet.eat_litix(np.flatnonzero(taken))
+        energy_by_prey = dict(zip(np.flatnonzero(taken).tolist(), energy.tolist()))
+
+        for i, caught in eaten:
+            self.energy_content[i] = min(
+                self.energy_content[i]
+                + sum(energy_by_prey[index] for index in caught.tolist()),
+                self.max_energy_content[i]
+            )
+
+# ---------------------------------------------------------------------------- #
+    def _spring_cubs(self):
+        """Well fed predators, with no cub or a grown one, spring a cub next to
+        them and give it half their energy. Returns how many were born.
+        """
+        alive = dict(zip(self.ids.tolist(), self.age.tolist()))
+        free = np.array(
+            [
+                cub not in alive or alive[cub] >= self.cub_age
+                for cub in self.cub.tolist()
+            ],
+            dtype = bool
+        )
+        ready = np.flatnonzero(
+            free
+            & (self.energy_content >= self.litter_energy * self.max_energy_content)
+        )
+
+        if len(ready) == 0:
+            return 0
+
+        self.energy_content[ready] /= 2
+        self.cub[ready] = self.spawn(
+            len(ready),
+            position = self.position[ready],
+            parent = self.ids[ready]
+        )
+
+        # Cubs start with the energy their parents gave:
+        self.energy_content[-len(ready):] = self.energy_content[ready]
+
+        return len(ready)
+
+# ---------------------------------------------------------------------------- #
+    def _update_current_color(self):
+        energy_proportion = self.energy_content / self.max_energy_content
+
+        self.color_index = np.clip(
+            10 - np.ceil(energy_proportion * 10).astype(np.int64),
+            0,
+            9
+        )
+
+# ---------------------------------------------------------------------------- #
+    def update_age(self, planet):
+        """Step every predator by one tick and drop the dead ones. Returns
+        how many were born and how many died.
+        """
+        if len(self) == 0:
+            return 0, 0
+
+        prey = PointGrid(planet.litix_positions(), cell_size = 40)
+
+        self.age += 1
+        self._update_direction_angle(prey)
+        self._update_position(planet.width, planet.height)
+        self._hunt(planet, prey)
+
+        self.energy_content -= self.metabolic_cost
+
+        keep = (self.energy_content > 0) & (self.age < self.max_age)
+        died = int((~keep).sum())
+        self._compact(keep)
+
+        born = self._spring_cubs()
+        self._update_current_color()
+
+        return born, died
+
+# ---------------------------------------------------------------------------- #
+    def get_state(self):
+        state = {field: getattr(self, field) for field in self.fields}
+        state["next_id"] = self.next_id
+
+        return state
+
+# ---------------------------------------------------------------------------- #
+    def set_state(self, state):
+        for field in self.fields:
+            setattr(self, field, state[field])
+
+        self.next_id = state["next_id"]
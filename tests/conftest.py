@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The modules of `codes` import each other as top-level modules:
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "codes")
+)
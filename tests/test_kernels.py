@@ -0,0 +1,138 @@
+import numpy as np
+import pytest
+
+import kernels
+from brorix84 import Brorix84
+
+
+def _backends():
+    # Numba is optional, its backend is only tested where it is installed:
+    kernels.backend = None
+
+    return sorted({"numpy", kernels._load()})
+
+
+@pytest.fixture(params = _backends())
+def backend(request, monkeypatch):
+    monkeypatch.setattr(kernels, "backend", request.param)
+
+    return request.param
+
+
+def _boxes(rng, n, low = 0, high = 1000, sizes = (3, 40)):
+    position = rng.integers(low, high, (n, 2)).astype(np.float64)
+    half = rng.integers(*sizes, n)[:, np.newaxis] / 2
+
+    return np.hstack([position - half, position + half])
+
+# ---------------------------------------------------------------------------- #
+def test_move_matches_numpy(backend):
+    rng = np.random.default_rng(0)
+    position = rng.integers(0, 1000, (500, 2)).astype(np.float64)
+    speed = rng.uniform(5, 40, 500)
+    angle = rng.integers(-360, 720, 500)
+    tracks = np.repeat(position[:, np.newaxis, :], 11, axis = 1)
+
+    expected_position, expected_tracks = position.copy(), tracks.copy()
+    kernels._move_numpy(
+        expected_position, speed, angle, 1000, 700, expected_tracks
+    )
+
+    kernels.move(position, speed, angle, 1000, 700, tracks = tracks)
+
+    assert np.array_equal(position, expected_position)
+    assert np.array_equal(tracks, expected_tracks)
+
+# ---------------------------------------------------------------------------- #
+def test_eat_overlapping_matches_brute_force(backend):
+    rng = np.random.default_rng(1)
+    rects = _boxes(rng, 200)
+    coords = _boxes(rng, 3000, sizes = (3, 7))
+    size = rng.integers(3, 7, 3000)
+    alive = rng.random(3000) < 0.9
+    living = alive.copy()
+
+    expected_alive = alive.copy()
+    expected_energy = np.zeros(len(rects), dtype = np.int64)
+    for i, (a0, b0, a1, b1) in enumerate(rects):
+        hit = expected_alive \
+            & (coords[:, 0] <= a1) & (coords[:, 2] >= a0) \
+            & (coords[:, 1] <= b1) & (coords[:, 3] >= b0)
+        expected_alive[hit] = False
+        expected_energy[i] = (size[hit] ** 2).sum()
+
+    energy, eaten = kernels.eat_overlapping(rects, coords, alive, size)
+
+    assert np.array_equal(energy, expected_energy)
+    assert np.array_equal(alive, expected_alive)
+    assert eaten == np.count_nonzero(living & ~expected_alive)
+
+# ---------------------------------------------------------------------------- #
+@pytest.mark.parametrize("enclosed", [False, True])
+@pytest.mark.parametrize("exclude_self", [False, True])
+def test_count_boxes_matches_brute_force(backend, enclosed, exclude_self):
+    rng = np.random.default_rng(2)
+    rects = _boxes(rng, 300, sizes = (10, 160))
+    coords = rects if exclude_self else _boxes(rng, 2000)
+    alive = rng.random(len(coords)) < 0.8
+
+    expected = list()
+    for i, (a0, b0, a1, b1) in enumerate(rects):
+        if enclosed:
+            inside = (coords[:, 0] > a0) & (coords[:, 2] < a1) \
+                & (coords[:, 1] > b0) & (coords[:, 3] < b1)
+        else:
+            inside = (coords[:, 0] <= a1) & (coords[:, 2] >= a0) \
+                & (coords[:, 1] <= b1) & (coords[:, 3] >= b0)
+
+        inside &= alive
+        if exclude_self:
+            inside[i] = False
+
+        expected.append(np.count_nonzero(inside))
+
+    counts = kernels.count_boxes(
+        rects,
+        coords,
+        enclosed = enclosed,
+        alive = alive,
+        exclude_self = exclude_self
+    )
+
+    assert counts.tolist() == expected
+
+# ---------------------------------------------------------------------------- #
+@pytest.mark.parametrize("engine", ["vector", "field"])
+def test_runs_are_identical_on_every_backend(engine, monkeypatch):
+    runs = list()
+
+    for backend in _backends():
+        monkeypatch.setattr(kernels, "backend", backend)
+
+        planet = Brorix84(
+            engine = engine,
+            seed = 7,
+            log_path = None,
+            telemetry_path = ":memory:",
+            verbose = False
+        )
+        planet.vohix_pack_size = 2
+
+        for day in range(60):
+            planet.update_calendar()
+
+        swarm = planet.litix_swarm
+        runs.append(
+            (
+                swarm.ids.tolist(),
+                swarm.position.tolist(),
+                swarm.energy_content.tolist(),
+                swarm.feeling[0].tolist(),
+                swarm.feeling[1].tolist(),
+                planet.n_scux,
+                planet.total_scux_energy
+            )
+        )
+        planet.close()
+
+    assert all(run == runs[0] for run in runs)
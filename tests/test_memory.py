@@ -0,0 +1,24 @@
+import pytest
+
+import benchmark
+
+
+# Bytes per creature, a little above what each representation takes now, so
+# a change that makes them grow fails here instead of only in a benchmark
+# comparison. Small objects vary by a few tens of bytes from a process to
+# another, hence the wider margin of the scux:
+CEILINGS = {
+    "scux": 300,
+    "litix": 12000,
+    "scux_pool": 100,
+    "litix_swarm": 450
+}
+
+
+@pytest.mark.parametrize("n", [200, 2000])
+def test_bytes_per_entity_stay_under_their_ceiling(n):
+    sizes = benchmark.entity_bytes(n, memory = 100)
+
+    for name, ceiling in CEILINGS.items():
+        assert sizes[name] <= ceiling, \
+            f"{name} takes {sizes[name]:.0f} bytes per entity, over {ceiling}"
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from reward import RewardTracker
+
+pd = pytest.importorskip("pandas")
+
+
+def _policies(energy):
+    """The rewards as the Litix memory computed them before `RewardTracker`,
+    recomputed over the whole history with pandas.
+    """
+    def short_term_reward_policy(energy_diff):
+        return energy_diff
+
+    def long_term_reward_policy(short_term_reward_value):
+        return np.mean(
+            np.asarray(
+                [
+                    strv + (strv * 1 / i)
+                    for strv, i in zip(short_term_reward_value, range(1, 11))
+                ]
+            )
+        )
+
+    memory = pd.DataFrame({"energy": energy})
+    memory["short_term_reward"] = memory.energy.diff().apply(
+        lambda x: short_term_reward_policy(x)
+    )
+    memory["long_term_reward"] = memory.short_term_reward.rolling(
+        window = 10
+    ).apply(
+        lambda x: long_term_reward_policy(x)
+    )
+
+    return (
+        memory["short_term_reward"].to_numpy(),
+        memory["long_term_reward"].to_numpy()
+    )
+
+# ---------------------------------------------------------------------------- #
+def test_rewards_match_the_policies_they_replace():
+    rng = np.random.default_rng(6)
+    energy = rng.random((200, 8))       # 200 events of 8 cells
+
+    tracker = RewardTracker(8)
+    short_term, long_term = zip(*[tracker.update(row) for row in energy])
+    short_term, long_term = np.array(short_term), np.array(long_term)
+
+    for cell in range(8):
+        expected_short_term, expected_long_term = _policies(energy[:, cell])
+
+        np.testing.assert_allclose(short_term[:, cell], expected_short_term)
+        np.testing.assert_allclose(long_term[:, cell], expected_long_term)